@@ -1,5 +1,13 @@
 #!/bin/bash
 
+# Demonio en Python: misma salida sin lanzar procesos cada segundo
+# (ver ~/.config/qtile/modules/statusd.py). Si no está o falla,
+# sigue el loop de siempre con los scripts.
+QTILE_DIR="$HOME/.config/qtile"
+if command -v python3 > /dev/null && [ -f "$QTILE_DIR/modules/statusd.py" ]; then
+	(cd "$QTILE_DIR" && python3 -m modules.statusd)
+fi
+
 DIR="$HOME/.config/dwmbar/scripts"
 while [[ true ]]; do
 	fecha_hora="$($DIR/clock.sh)"
@@ -11,14 +11,28 @@
 # - Carga del sistema
 ############################################
 
+# Demonio en Python: misma barra sin recorrer todos los repos cada
+# 2 segundos (ver ~/.config/qtile/modules/statusd.py y repos.py).
+# Si no está o falla, sigue el loop de siempre.
+QTILE_DIR="$HOME/.config/qtile"
+if command -v python3 > /dev/null && [ -f "$QTILE_DIR/modules/statusd.py" ]; then
+    (cd "$QTILE_DIR" && python3 -m modules.statusd --profile developer)
+fi
+
 DIR="$HOME/.config/dwmbar/scripts"
 
 # Crear directorio de scripts si no existe
 mkdir -p "$DIR"
 
+# unit_active: estado de una unidad desde el caché de ~/.config/qtile/modules/units.py
+# (ver units.sh); sin la configuración de qtile, systemctl directamente
+if ! . ~/.config/qtile/modules/units.sh 2>/dev/null; then
+    unit_active() { systemctl is-active --quiet "$1" 2>/dev/null; }
+fi
+
 # Función para verificar si un servicio está corriendo
 check_service() {
-    if systemctl is-active --quiet $1 2>/dev/null; then
+    if unit_active $1; then
         echo "🟢"
     else
         echo "🔴"  
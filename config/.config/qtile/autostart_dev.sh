@@ -89,15 +89,20 @@ if [ -f ~/.config/dwmbar/bar.sh ]; then
 fi
 
 # Sincronizar repositorios de desarrollo cada hora
+# (en paralelo con ~/.config/qtile/modules/gitsync.py; mod+shift+g lo lanza a mano)
 (while true; do 
     sleep 3600
     if [ -d ~/Development/projects ]; then
-        find ~/Development/projects -name ".git" -type d | while read repo; do
-            cd "$(dirname "$repo")"
-            if git status &>/dev/null; then
-                git fetch --all &>/dev/null || true
-            fi
-        done
+        if command -v python3 > /dev/null && [ -f ~/.config/qtile/modules/gitsync.py ]; then
+            (cd ~/.config/qtile && python3 -m modules.gitsync > /dev/null)
+        else
+            find ~/Development/projects -name ".git" -type d | while read repo; do
+                cd "$(dirname "$repo")"
+                if git status &>/dev/null; then
+                    git fetch --all &>/dev/null || true
+                fi
+            done
+        fi
     fi
 done) &
 
@@ -201,9 +206,15 @@ fi
 # Verificar conexiones de desarrollo
 ####################################################
 
+# unit_active: estado de una unidad desde el caché de ~/.config/qtile/modules/units.py
+# (ver units.sh); sin la configuración de qtile, systemctl directamente
+if ! . ~/.config/qtile/modules/units.sh 2>/dev/null; then
+    unit_active() { systemctl is-active --quiet "$1" 2>/dev/null; }
+fi
+
 # Función para verificar servicios
 check_service() {
-    if systemctl is-active --quiet $1; then
+    if unit_active $1; then
         echo "✅ $1 está funcionando"
     else
         echo "❌ $1 no está activo"
@@ -33,8 +33,12 @@
 ####################################################
 # Librerías de qtile
 
+# Marca de inicio para el perfil de carga (ver modules/profiler.py)
+import time
+_config_started = time.perf_counter()
+
 from libqtile import bar, layout, widget, hook, qtile
-from libqtile.config import Click, Drag, Group, Key, Match, hook, Screen, KeyChord
+from libqtile.config import Click, Drag, Group, Key, Match, hook, Screen, KeyChord, ScratchPad
 from libqtile.lazy import lazy
 from libqtile.utils import guess_terminal
 from libqtile.dgroups import simple_key_binder
@@ -46,6 +50,39 @@ import os
 import subprocess
 from libqtile import hook
 
+# Widgets que comparten una sola lectura de CPU, RAM, volumen,
+# batería y reloj entre todas las pantallas (ver modules/sampler.py)
+from modules.sampler import (
+    SharedBattery,
+    SharedBatteryIcon,
+    SharedClock,
+    SharedCPU,
+    SharedMemory,
+    SharedVolume,
+)
+# Las barras se describen por segmentos (ver modules/bar_builder.py)
+from modules.bar_builder import Image, Segment, W, build_widgets
+from modules.screens import LazyScreen
+from modules.sticky import sticky
+from modules import window_rules
+# Los atajos de uso frecuente lanzan por un proceso ayudante ya
+# arrancado, sin fork de qtile (ver modules/spawner.py)
+from modules.spawner import spawn, spawner
+spawner.start()
+# Terminal y btop ya arrancados, ocultos en un ScratchPad (ver modules/warmpool.py)
+from modules.warmpool import warm_pools
+# Selector de ventanas en orden MRU, sin lanzar rofi (ver modules/switcher.py)
+from modules.switcher import window_switcher
+window_switcher.subscribe()
+# Aplicaciones para rofi desde un índice en memoria, por frecencia (ver modules/launcher.py)
+from modules import launcher
+launcher_rofi = launcher.rofi_command("-show-icons", "-theme", "rounded-green-dark")
+
+# Perfil de tiempos de carga, solo si QTILE_PROFILE=1 o existe profile.conf
+from modules import profiler
+load_profile = profiler.start("config.py", _config_started)
+load_profile.mark("imports")
+
 ####################################################
 # Variables
 
@@ -68,38 +105,58 @@ powermenu ="wlogout"
 # funciones
 
 # Sticky windows
-
-sticky_windows = []
+# el registro va por id de ventana y sobrevive a reload_config
+# (ver modules/sticky.py)
 
 @lazy.function
 def toggle_sticky_windows(qtile, window=None):
     if window is None:
         window = qtile.current_screen.group.current_window
-    if window in sticky_windows:
-        sticky_windows.remove(window)
-    else:
-        sticky_windows.append(window)
+    if window is not None:
+        sticky.toggle(window)
     return window
 
 @hook.subscribe.setgroup
 def move_sticky_windows():
-    for window in sticky_windows:
-        window.togroup()
+    sticky.follow(qtile.current_group)
     return
 
 @hook.subscribe.client_killed
 def remove_sticky_windows(window):
-    if window in sticky_windows:
-        sticky_windows.remove(window)
+    sticky.discard(window)
+    warm_pools.discard(window)
+
+# Ventanas que se vuelven sticky automáticamente
+# se comparan con wm_class/título leídos una sola vez por ventana,
+# sin pedir window.info() completo (ver modules/window_rules.py)
+auto_sticky_rules = [
+    # Firefox Picture-in-Picture
+    Match(wm_class="firefox", wm_instance_class="Toolkit", title="Picture-in-Picture"),
+    # Otros ejemplos:
+    # Match(wm_class="mpv"),
+    # Match(wm_class="Alacritty", title="flotante"),
+]
+auto_sticky = window_rules.RuleIndex("sticky")
+for rule in auto_sticky_rules:
+    auto_sticky.add_match(rule, True)
+
+# Las instancias de los pools se ocultan en cuanto aparecen
+@hook.subscribe.client_new
+def claim_warm_windows(window):
+    warm_pools.claim(window)
+
+@hook.subscribe.startup_complete
+def fill_warm_pools():
+    warm_pools.start()
+    launcher.ensure_daemon()
 
-# Below is an example how to make Firefox Picture-in-Picture windows automatically sticky.
 @hook.subscribe.client_managed
 def auto_sticky_windows(window):
-    info = window.info()
-    if (info['wm_class'] == ['Toolkit', 'firefox']
-            and info['name'] == 'Picture-in-Picture'):
-        sticky_windows.append(window)
+    if auto_sticky.classify(window):
+        sticky.add(window)
+    window_rules.release(window)
 
+load_profile.mark("hooks")
 
 ####################################################
 # Atajos de teclado
@@ -168,11 +225,11 @@ keys = [
         desc="Toggle between split and unsplit sides of stack",
     ),
 
-    Key([mod], "Return", lazy.spawn(terminal), desc="Launch terminal"),
+    Key([mod], "Return", warm_pools.lazy_show("terminal"), desc="Launch terminal"),
     Key([mod], "Tab", lazy.next_layout(), desc="Toggle between layouts"),
     Key([mod, "shift"], "q", lazy.window.kill(), desc="Kill focused window"),
     Key([mod, "control"], "r", lazy.reload_config(), desc="Reload the config"),
-    Key([mod, "mod1"], "d", lazy.spawn("rofi -show-icons -theme rounded-green-dark -show drun"), desc="Spawn a command using a prompt widget"),
+    Key([mod, "mod1"], "d", spawn(launcher_rofi), desc="Spawn a command using a prompt widget"),
 
 
 # Atajos adicionales
@@ -180,9 +237,9 @@ keys = [
 #   Teclas de volumen con pipewire
 #   se debe instalar alsa-utils para que funcione el widget de la barra de qtile
 
-    Key([], "XF86AudioMute", lazy.spawn("wpctl set-mute @DEFAULT_AUDIO_SINK@ toggle"), desc="Silencio - Mute"),
-    Key([], "XF86AudioLowerVolume", lazy.spawn("wpctl set-volume @DEFAULT_AUDIO_SINK@ 5%- -l 1.0"), desc="Bajar Volumen - Volume down"),
-    Key([], "XF86AudioRaiseVolume", lazy.spawn("wpctl set-volume @DEFAULT_AUDIO_SINK@ 5%+ -l 1.0"), desc="Subir Volumen - Volume up"),
+    Key([], "XF86AudioMute", spawn("wpctl set-mute @DEFAULT_AUDIO_SINK@ toggle"), desc="Silencio - Mute"),
+    Key([], "XF86AudioLowerVolume", spawn("wpctl set-volume @DEFAULT_AUDIO_SINK@ 5%- -l 1.0"), desc="Bajar Volumen - Volume down"),
+    Key([], "XF86AudioRaiseVolume", spawn("wpctl set-volume @DEFAULT_AUDIO_SINK@ 5%+ -l 1.0"), desc="Subir Volumen - Volume up"),
 #   Estos con wpctl funcionan con wireplumber
 #   visto en la wiki de sway
 #   https://github.com/swaywm/sway/wiki
@@ -195,17 +252,17 @@ keys = [
     # Key([], "XF86AudioMute", lazy.spawn("pactl set-sink-mute @DEFAULT_SINK@ toggle"), desc='Volume Mute'),
 
 #   se debe installar playerctl
-    Key([], "XF86AudioPlay", lazy.spawn("playerctl play-pause"), desc='playerctl'),
-    Key([], "XF86AudioPrev", lazy.spawn("playerctl previous"), desc='playerctl'),
-    Key([], "XF86AudioNext", lazy.spawn("playerctl next"), desc='playerctl'),
+    Key([], "XF86AudioPlay", spawn("playerctl play-pause"), desc='playerctl'),
+    Key([], "XF86AudioPrev", spawn("playerctl previous"), desc='playerctl'),
+    Key([], "XF86AudioNext", spawn("playerctl next"), desc='playerctl'),
 
 
 #   se debe instalar brightnessctl
-    Key([], "XF86MonBrightnessUp", lazy.spawn("brightnessctl s 5%+"), desc='brightness UP'),
-    Key([], "XF86MonBrightnessDown", lazy.spawn("brightnessctl s 5%-"), desc='brightness Down'),
+    Key([], "XF86MonBrightnessUp", spawn("brightnessctl s 5%+"), desc='brightness UP'),
+    Key([], "XF86MonBrightnessDown", spawn("brightnessctl s 5%-"), desc='brightness Down'),
 
 ##Misc keybinds
-    Key([], "Print", lazy.spawn("xfce4-screenshooter"), desc='Screenshot'),
+    Key([], "Print", spawn("xfce4-screenshooter"), desc='Screenshot'),
     # Key(["control"], "Print", lazy.spawn("flameshot full -c -p ~/Pictures/"), desc='Screenshot'),
     Key([mod], "e", lazy.spawn(filemanager), desc="Open file manager"),
     Key([mod], "s",toggle_sticky_windows(), desc="Toggle state of sticky for current window"),
@@ -226,13 +283,14 @@ keys = [
 
 # ver las ventanas que están abiertas
 # similar a la clásica alt + tab
-    Key([mod, "mod1"], "Tab", lazy.spawn("rofi -show-icons -show window -theme rounded-green-dark"), desc="Spawn a command using a prompt widget"),
+    Key([mod, "mod1"], "Tab", window_switcher.lazy_open(fallback="rofi -show-icons -show window -theme rounded-green-dark"), desc="Window switcher (MRU)"),
 
 
 
 ]
 
 # fin de los atajos de teclado
+load_profile.mark("keys")
 
 
 ####################################################
@@ -274,6 +332,16 @@ for i in groups:
         ]
     )
 
+# ScratchPad sin DropDowns: ahí esperan ocultas las ventanas precalentadas
+groups.append(ScratchPad(warm_pools.group, []))
+# -u: sin D-Bus, cada terminator es su propio proceso (el pool reconoce
+# sus ventanas por pid; si no, la ventana nueva lleva el pid del primero)
+warm_pools.add("terminal", f"{terminal} -u", size=1)
+warm_pools.add("btop", "alacritty --hold -e btop", size=1)
+warm_pools.resume()
+
+load_profile.mark("groups")
+
 
 
 
@@ -331,6 +399,8 @@ layouts = [
    #  layout.Zoomy(),
 ]
 
+load_profile.mark("layouts")
+
 
 ####################################################
 
@@ -349,10 +419,10 @@ extension_defaults = [ widget_defaults.copy()]
 # estas" def" se usan en la configuración de la barra que sigue
 
 def open_launcher():
-    qtile.cmd_spawn("rofi -show-icons -theme rounded-green-dark -show drun")
+    qtile.spawn(launcher_rofi)
 
 def open_btop():
-    qtile.cmd_spawn("alacritty --hold -e btop")
+    warm_pools.show("btop")
 
 # def open_power():
 #     qtile.cmd_spawn("wlogout")
@@ -368,476 +438,215 @@ def open_power():
 
 
 
-screens = [
-
-
 ##############################################################
-##  fake screen 1 - pantalla interna del portatil
+##  Segmentos de la barra
+##  cada segmento: separador izquierdo, widgets, separador derecho
+##  las imágenes se decodifican una sola vez para todas las
+##  pantallas (ver modules/bar_builder.py)
 ##############################################################
-##
-####################################################
-    Screen(
-        top = bar.Bar(
-            [
-                ##############
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/3.png',
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/launch_Icon.png',
-                    background = '#033C4B',
-                    mouse_callbacks = {'Button1': open_launcher},
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/6.png',
-                ),
-
-                ###############
-
-                widget.GroupBox(
-                    fontsize = 14,
-                    borderwidth = 1,
-                    highlight_method = 'block',
-                    active = '#56D9C7', #Active workspaces circle color
-                    block_highlight_text_color = "#00F076", #Current workspace circle color
-                    highlight_color = '#4B427E',
-                    inactive = '#052A25', #Empty workspace circle
-                    foreground = '#046F5F',
-                    background = '#046F5F',
-                    this_current_screen_border = '#00361A', #Circle background color
-                    this_screen_border = '#52548D',
-                    other_current_screen_border = '#52548D',
-                    other_screen_border = '#52548D',
-                    urgent_border = '#52548D',
-                    rounded = True,
-                    disable_drag = True,
-                 ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                ),
-
-                ###############
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/2.png',
-                ),
-
-                widget.CurrentLayoutIcon(
-                    background = '#046F5F',
-                    padding = 2,
-                    scale = 0.5,
-                ),
-
-                widget.CurrentLayout(
-                    background ='#046F5F',
-                    padding = 0,
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                ),
-
-                ###############
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/2.png',
-                ),
-
-                widget.WindowName(
-                    background = '#046F5F',
-                    format = "{name}",
-                    empty_group_string = 'Desktop',
-                    padding = 0,
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                ),
-
-                ###############
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/1.png',
-                    background = '#52548D',
-                ),
-
-                widget.CPU(
-                    format='CPU:({load_percent:.1f}%/{freq_current}GHz)',
-                    margin = 1,
-                    padding = 1,
-                    background = '#046F5F',
-                    mouse_callbacks = {'Button1': open_btop},
-                ),
-
-                widget.Spacer(
-                    length = 6,
-                    background = '#046f5f',
-                ),
-
-                widget.Memory(
-                    format = 'RAM:({MemUsed:.0f}MB/{MemTotal:.0f}MB)',
-                    padding = 0,
-                    background = '#046F5F',
-                    mouse_callbacks = {'Button1': open_btop},
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                ),
-
-                ###############
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/2.png',
-                    background = '#52548D',
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/Bar-Icons/volume.svg',
-                    background = '#046F5F',
-                    margin_y = 3,
-                    scale = True,
-                    mouse_callbacks = {'Button1': open_btop},
-                ),
-
-                widget.Spacer(
-                    length = 4,
-                    background = '#046f5f',
-                ),
-
-                widget.Volume(
-                    padding = 0,
-                    background = '#046F5F',
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                ),
-
-                ###############
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/1.png',
-                    background = '#4B427E',
-                ),
-
-
-                widget.Clock(
-                    format = '%d/%m/%y ', #Here you can change between USA or another timezone
-                    background = '#046f5f',
-                    padding = 0,
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/Bar-Icons/calendar.svg',
-                    background = '#046F5F',
-                    margin_y = 3,
-                    margin_x = 5,
-                    scale = True,
-                ),
-
-                widget.Clock(
-                    format = '%H:%M',
-                    background = '#046f5f',
-                    padding = 0,
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                    background = '#4B427E',
-                ),
-
-                ###############
-
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/2.png',
-                    background = '#52548D',
-                ),
-
-                widget.Systray(
-                    background = '#046F5F',
-                    icon_size = 14,
-                    padding = 2,
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                ),
-
-
-
-
-                ###############
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/Bar-Icons/shutdown.svg',
-                    background = '#FF0000',
-                    margin_y = 3,
-                    margin_x = 5,
-                    scale = True,
-                    mouse_callbacks = {'Button1': open_power},
-                ),
 
+segments = {
 
+    "launcher": Segment(
+        Image(
+            'launch_Icon.png',
+            background = '#033C4B',
+            mouse_callbacks = {'Button1': open_launcher},
+        ),
+        left = Image('3.png'),
+        right = Image('6.png'),
+    ),
 
+    "groups": Segment(
+        W(widget.GroupBox,
+            fontsize = 14,
+            borderwidth = 1,
+            highlight_method = 'block',
+            active = '#56D9C7', #Active workspaces circle color
+            block_highlight_text_color = "#00F076", #Current workspace circle color
+            highlight_color = '#4B427E',
+            inactive = '#052A25', #Empty workspace circle
+            foreground = '#046F5F',
+            background = '#046F5F',
+            this_current_screen_border = '#00361A', #Circle background color
+            this_screen_border = '#52548D',
+            other_current_screen_border = '#52548D',
+            other_screen_border = '#52548D',
+            urgent_border = '#52548D',
+            rounded = True,
+            disable_drag = True,
+        ),
+        right = Image('5.png'),
+    ),
 
+    "layout": Segment(
+        W(widget.CurrentLayoutIcon,
+            background = '#046F5F',
+            padding = 2,
+            scale = 0.5,
+        ),
+        W(widget.CurrentLayout,
+            background ='#046F5F',
+            padding = 0,
+        ),
+        left = Image('2.png'),
+        right = Image('5.png'),
+    ),
 
-                ###############
+    "window": Segment(
+        W(widget.WindowName,
+            background = '#046F5F',
+            format = "{name}",
+            empty_group_string = 'Desktop',
+            padding = 0,
+        ),
+        left = Image('2.png'),
+        right = Image('5.png'),
+    ),
 
-                # Batería de un laptop
-                widget.Spacer(
-                    length = 18,
-                    background = '#046f5f',
-                ),
-                widget.BatteryIcon(),
-                widget.Battery(background = '#046f5f'),
+    "system": Segment(
+        W(SharedCPU,
+            format='CPU:({load_percent:.1f}%/{freq_current}GHz)',
+            margin = 1,
+            padding = 1,
+            background = '#046F5F',
+            mouse_callbacks = {'Button1': open_btop},
+        ),
+        W(widget.Spacer,
+            length = 6,
+            background = '#046f5f',
+        ),
+        W(SharedMemory,
+            format = 'RAM:({MemUsed:.0f}MB/{MemTotal:.0f}MB)',
+            padding = 0,
+            background = '#046F5F',
+            mouse_callbacks = {'Button1': open_btop},
+        ),
+        left = Image('1.png', background = '#52548D'),
+        right = Image('5.png'),
+    ),
 
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                    background = '#4B427E',
-                ),
+    "volume": Segment(
+        Image(
+            'Bar-Icons/volume.svg',
+            background = '#046F5F',
+            margin_y = 3,
+            scale = True,
+            mouse_callbacks = {'Button1': open_btop},
+        ),
+        W(widget.Spacer,
+            length = 4,
+            background = '#046f5f',
+        ),
+        W(SharedVolume,
+            padding = 0,
+            background = '#046F5F',
+        ),
+        left = Image('2.png', background = '#52548D'),
+        right = Image('5.png'),
+    ),
 
+    "clock": Segment(
+        W(SharedClock,
+            format = '%d/%m/%y ', #Here you can change between USA or another timezone
+            background = '#046f5f',
+            padding = 0,
+            update_interval = 60, # sin segundos: basta un ciclo por minuto
+        ),
+        Image(
+            'Bar-Icons/calendar.svg',
+            background = '#046F5F',
+            margin_y = 3,
+            margin_x = 5,
+            scale = True,
+        ),
+        W(SharedClock,
+            format = '%H:%M',
+            background = '#046f5f',
+            padding = 0,
+            update_interval = 60,
+        ),
+        left = Image('1.png', background = '#4B427E'),
+        right = Image('5.png', background = '#4B427E'),
+    ),
 
+    "systray": Segment(
+        W(widget.Systray,
+            background = '#046F5F',
+            icon_size = 14,
+            padding = 2,
+        ),
+        left = Image('2.png', background = '#52548D'),
+        right = Image('5.png'),
+    ),
 
+    "power": Segment(
+        Image(
+            'Bar-Icons/shutdown.svg',
+            background = '#FF0000',
+            margin_y = 3,
+            margin_x = 5,
+            scale = True,
+            mouse_callbacks = {'Button1': open_power},
+        ),
+    ),
 
+    # Batería de un laptop
+    "battery": Segment(
+        W(widget.Spacer,
+            length = 18,
+            background = '#046f5f',
+        ),
+        W(SharedBatteryIcon),
+        W(SharedBattery, background = '#046f5f'),
+        right = Image('5.png', background = '#4B427E'),
+    ),
+}
 
+load_profile.mark("widgets")
 
 
+# Cada barra se construye cuando su pantalla recibe una salida;
+# con un solo monitor la barra externa no se llega a crear
+# (ver modules/screens.py)
+screens = [
 
-            ],
+##############################################################
+##  fake screen 1 - pantalla interna del portatil
+##############################################################
+    LazyScreen(
+        lambda: bar.Bar(
+            build_widgets(segments, [
+                "launcher", "groups", "layout", "window", "system",
+                "volume", "clock", "systray", "power", "battery",
+            ]),
             30,  # Bar size (all axis)
             margin = [2,4,2,4] # Bar margin (Top,Right,Bottom,Left)
         ),
-
-
+        profile = load_profile,
     ),
 
-
-
-# pantalla externa
+# pantalla externa (el systray solo puede estar en una pantalla)
 #########################################
-####################################################
-    Screen(
-        top = bar.Bar(
-            [
-                ##############
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/3.png',
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/launch_Icon.png',
-                    background = '#033C4B',
-                    mouse_callbacks = {'Button1': open_launcher},
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/6.png',
-                ),
-
-                ###############
-
-                widget.GroupBox(
-                    fontsize = 14,
-                    borderwidth = 1,
-                    highlight_method = 'block',
-                    active = '#56D9C7', #Active workspaces circle color
-                    block_highlight_text_color = "#00F076", #Current workspace circle color
-                    highlight_color = '#4B427E',
-                    inactive = '#052A25', #Empty workspace circle
-                    foreground = '#046F5F',
-                    background = '#046F5F',
-                    this_current_screen_border = '#00361A', #Circle background color
-                    this_screen_border = '#52548D',
-                    other_current_screen_border = '#52548D',
-                    other_screen_border = '#52548D',
-                    urgent_border = '#52548D',
-                    rounded = True,
-                    disable_drag = True,
-                 ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                ),
-
-                ###############
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/2.png',
-                ),
-
-                widget.CurrentLayoutIcon(
-                    background = '#046F5F',
-                    padding = 2,
-                    scale = 0.5,
-                ),
-
-                widget.CurrentLayout(
-                    background ='#046F5F',
-                    padding = 0,
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                ),
-
-                ###############
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/2.png',
-                ),
-
-                widget.WindowName(
-                    background = '#046F5F',
-                    format = "{name}",
-                    empty_group_string = 'Desktop',
-                    padding = 0,
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                ),
-
-                ###############
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/1.png',
-                    background = '#52548D',
-                ),
-
-                widget.CPU(
-                    format='CPU:({load_percent:.1f}%/{freq_current}GHz)',
-                    margin = 1,
-                    padding = 1,
-                    background = '#046F5F',
-                    mouse_callbacks = {'Button1': open_btop},
-                ),
-
-                widget.Spacer(
-                    length = 6,
-                    background = '#046f5f',
-                ),
-
-                widget.Memory(
-                    format = 'RAM:({MemUsed:.0f}MB/{MemTotal:.0f}MB)',
-                    padding = 0,
-                    background = '#046F5F',
-                    mouse_callbacks = {'Button1': open_btop},
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                ),
-
-                ###############
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/2.png',
-                    background = '#52548D',
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/Bar-Icons/volume.svg',
-                    background = '#046F5F',
-                    margin_y = 3,
-                    scale = True,
-                    mouse_callbacks = {'Button1': open_btop},
-                ),
-
-                widget.Spacer(
-                    length = 4,
-                    background = '#046f5f',
-                ),
-
-                widget.Volume(
-                    padding = 0,
-                    background = '#046F5F',
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                ),
-
-                ###############
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/1.png',
-                    background = '#4B427E',
-                ),
-
-
-                widget.Clock(
-                    format = '%d/%m/%y ', #Here you can change between USA or another timezone
-                    background = '#046f5f',
-                    padding = 0,
-                ),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/Bar-Icons/calendar.svg',
-                    background = '#046F5F',
-                    margin_y = 3,
-                    margin_x = 5,
-                    scale = True,
-                ),
-
-                widget.Clock(
-                    format = '%H:%M',
-                    background = '#046f5f',
-                    padding = 0,
-                ),
-
-                # Batería de un laptop
-                widget.Spacer(
-                    length = 18,
-                    background = '#046f5f',
-                ),
-                widget.BatteryIcon(),
-                widget.Battery(background = '#046f5f'),
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/5.png',
-                    background = '#4B427E',
-                ),
-
-                ###############
-
-                widget.Image(
-                    filename = '~/.config/qtile/Assets/Bar-Icons/shutdown.svg',
-                    background = '#FF0000',
-                    margin_y = 3,
-                    margin_x = 5,
-                    scale = True,
-                    mouse_callbacks = {'Button1': open_power},
-                ),
-
-
-            ],
+    LazyScreen(
+        lambda: bar.Bar(
+            build_widgets(segments, [
+                "launcher", "groups", "layout", "window", "system",
+                "volume", "clock", "battery", "power",
+            ]),
             30,  # Bar size (all axis)
             margin = [2,4,2,4] # Bar margin (Top,Right,Bottom,Left)
         ),
-
-
+        profile = load_profile,
     ),
 
-
-
-#####################################################33
-
-
-
-
-
 #  aqui irian más screens
 ##########################
 
-
-
 ]
 
+load_profile.mark("screens")
+
 
 ######################################################################
 #  fin de las pantallas
@@ -874,6 +683,8 @@ floating_layout = layout.Floating(
     ]
 )
 
+load_profile.mark("layouts")
+
 
 
 auto_fullscreen = True
@@ -917,4 +728,7 @@ def autostart():
     home = os.path.expanduser(autostartscript)
     subprocess.Popen([home])
 
+load_profile.mark("hooks")
+load_profile.report()
+
 ###########################################################################
@@ -6,8 +6,12 @@
 # widgets específicos para monitoreo de sistema
 ####################################################
 
+# Marca de inicio para el perfil de carga (ver modules/profiler.py)
+import time
+_config_started = time.perf_counter()
+
 from libqtile import bar, layout, widget, hook, qtile
-from libqtile.config import Click, Drag, Group, Key, Match, hook, Screen, KeyChord
+from libqtile.config import Click, Drag, Group, Key, Match, hook, Screen, KeyChord, ScratchPad
 from libqtile.lazy import lazy
 from libqtile.utils import guess_terminal
 from libqtile.dgroups import simple_key_binder
@@ -16,6 +20,29 @@ import os
 import subprocess
 from libqtile import hook
 
+# Una sola lectura de CPU/RAM/volumen/reloj para todas las barras
+from modules.sampler import SharedClock, SharedCPU, SharedMemory, SharedVolume
+from modules.dev_widgets import GitRepos, Load, Projects, Services, Temperature
+from modules.screens import LazyScreen
+from modules import window_rules
+# Los atajos de uso frecuente lanzan por un proceso ayudante ya
+# arrancado, sin fork de qtile (ver modules/spawner.py)
+from modules.spawner import spawn, spawner
+spawner.start()
+# Terminal, htop y btop ya arrancados, ocultos en un ScratchPad (ver modules/warmpool.py)
+from modules.warmpool import warm_pools
+# Selector de ventanas en orden MRU, sin lanzar rofi (ver modules/switcher.py)
+from modules.switcher import window_switcher
+window_switcher.subscribe()
+# Aplicaciones para rofi desde un índice en memoria, por frecencia (ver modules/launcher.py)
+from modules import launcher
+launcher_rofi = launcher.rofi_command("-show-icons")
+
+# Perfil de tiempos de carga, solo si QTILE_PROFILE=1 o existe profile.conf
+from modules import profiler
+load_profile = profiler.start("config_developer.py", _config_started)
+load_profile.mark("imports")
+
 ####################################################
 # VARIABLES PARA DESARROLLO
 
@@ -113,11 +140,19 @@ group_matches = {
     ],
 }
 
-# Aplicar matches a grupos
-for group_name, matches in group_matches.items():
-    group = next((g for g in groups if g.name == group_name), None)
-    if group:
-        group.matches = matches
+# IDEs y navegadores que no tienen un wm_class fijo
+# (ej. jetbrains-pycharm-ce, Google-chrome): basta que lo contenga
+group_substrings = {
+    "3": ["code", "pycharm", "idea", "sublime"],
+    "2": ["firefox", "chromium", "chrome"],
+}
+
+# Los matches NO se asignan a group.matches: qtile los recorrería uno por
+# uno en cada ventana nueva. Se compilan en un índice que el hook
+# new_client consulta una sola vez (ver modules/window_rules.py)
+window_groups = window_rules.group_rules(group_matches, group_substrings)
+
+load_profile.mark("groups")
 
 ####################################################
 # ATAJOS DE TECLADO OPTIMIZADOS PARA DESARROLLO
@@ -158,9 +193,9 @@ keys = [
     # =============== APLICACIONES DE DESARROLLO ===============
     
     # Terminales
-    Key([mod], "Return", lazy.spawn(terminal), desc="Launch main terminal"),
-    Key([mod, "shift"], "Return", lazy.spawn(terminal_alt), desc="Launch terminal with splits"),
-    Key([mod, "control"], "Return", lazy.spawn(terminal_floating), desc="Launch floating terminal"),
+    Key([mod], "Return", warm_pools.lazy_show("terminal"), desc="Launch main terminal"),
+    Key([mod, "shift"], "Return", spawn(terminal_alt), desc="Launch terminal with splits"),
+    Key([mod, "control"], "Return", spawn(terminal_floating), desc="Launch floating terminal"),
 
     # Editores e IDEs
     Key([mod], "e", lazy.spawn(editor), desc="Launch VS Code"),
@@ -184,8 +219,8 @@ keys = [
     # =============== HERRAMIENTAS DEL SISTEMA ===============
     
     # Monitoreo del sistema
-    Key([mod], "m", lazy.spawn(terminal + " -e htop"), desc="Launch htop"),
-    Key([mod, "shift"], "m", lazy.spawn(terminal + " -e btop"), desc="Launch btop"),
+    Key([mod], "m", warm_pools.lazy_show("htop"), desc="Launch htop"),
+    Key([mod, "shift"], "m", warm_pools.lazy_show("btop"), desc="Launch btop"),
     
     # Docker
     Key([mod], "o", lazy.spawn(terminal + " -e docker ps"), desc="Docker containers"),
@@ -194,14 +229,14 @@ keys = [
     # =============== DESARROLLO ESPECÍFICO ===============
     
     # Quick commands con rofi
-    Key([mod], "r", lazy.spawn("rofi -show drun -show-icons"), desc="Run launcher"),
-    Key([mod, "shift"], "r", lazy.spawn("rofi -show run"), desc="Run command"),
-    Key([mod], "w", lazy.spawn("rofi -show window"), desc="Window switcher"),
+    Key([mod], "r", spawn(launcher_rofi), desc="Run launcher"),
+    Key([mod, "shift"], "r", spawn("rofi -show run"), desc="Run command"),
+    Key([mod], "w", window_switcher.lazy_open(fallback="rofi -show window"), desc="Window switcher (MRU)"),
 
     # Screenshots (importantes para documentación)
-    Key([], "Print", lazy.spawn("xfce4-screenshooter"), desc="Screenshot"),
-    Key(["shift"], "Print", lazy.spawn("xfce4-screenshooter -r"), desc="Screenshot region"),
-    Key(["control"], "Print", lazy.spawn("xfce4-screenshooter -w"), desc="Screenshot window"),
+    Key([], "Print", spawn("xfce4-screenshooter"), desc="Screenshot"),
+    Key(["shift"], "Print", spawn("xfce4-screenshooter -r"), desc="Screenshot region"),
+    Key(["control"], "Print", spawn("xfce4-screenshooter -w"), desc="Screenshot window"),
 
     # =============== LAYOUTS Y VENTANAS ===============
     
@@ -224,18 +259,18 @@ keys = [
     # =============== MULTIMEDIA ===============
     
     # Control de volumen
-    Key([], "XF86AudioMute", lazy.spawn("wpctl set-mute @DEFAULT_AUDIO_SINK@ toggle")),
-    Key([], "XF86AudioLowerVolume", lazy.spawn("wpctl set-volume @DEFAULT_AUDIO_SINK@ 5%-")),
-    Key([], "XF86AudioRaiseVolume", lazy.spawn("wpctl set-volume @DEFAULT_AUDIO_SINK@ 5%+")),
+    Key([], "XF86AudioMute", spawn("wpctl set-mute @DEFAULT_AUDIO_SINK@ toggle")),
+    Key([], "XF86AudioLowerVolume", spawn("wpctl set-volume @DEFAULT_AUDIO_SINK@ 5%-")),
+    Key([], "XF86AudioRaiseVolume", spawn("wpctl set-volume @DEFAULT_AUDIO_SINK@ 5%+")),
     
     # Control multimedia
-    Key([], "XF86AudioPlay", lazy.spawn("playerctl play-pause")),
-    Key([], "XF86AudioNext", lazy.spawn("playerctl next")),
-    Key([], "XF86AudioPrev", lazy.spawn("playerctl previous")),
+    Key([], "XF86AudioPlay", spawn("playerctl play-pause")),
+    Key([], "XF86AudioNext", spawn("playerctl next")),
+    Key([], "XF86AudioPrev", spawn("playerctl previous")),
     
     # Brillo (para laptops)
-    Key([], "XF86MonBrightnessUp", lazy.spawn("brightnessctl s 5%+")),
-    Key([], "XF86MonBrightnessDown", lazy.spawn("brightnessctl s 5%-")),
+    Key([], "XF86MonBrightnessUp", spawn("brightnessctl s 5%+")),
+    Key([], "XF86MonBrightnessDown", spawn("brightnessctl s 5%-")),
 ]
 
 # Atajos para cambiar entre grupos
@@ -252,6 +287,15 @@ for i in groups:
             desc=f"Move window to group {i.name} and follow"),
     ])
 
+# ScratchPad sin DropDowns (después de los atajos: no tiene tecla propia)
+groups.append(ScratchPad(warm_pools.group, []))
+warm_pools.add("terminal", terminal, size=1)
+warm_pools.add("htop", terminal + " -e htop", size=1)
+warm_pools.add("btop", terminal + " -e btop", size=1)
+warm_pools.resume()
+
+load_profile.mark("keys")
+
 ####################################################
 # LAYOUTS OPTIMIZADOS PARA DESARROLLO
 
@@ -316,6 +360,8 @@ layouts = [
     ),
 ]
 
+load_profile.mark("layouts")
+
 ####################################################
 # WIDGETS ESPECIALIZADOS PARA DESARROLLO
 
@@ -334,7 +380,7 @@ def init_widgets_list():
         widget.Image(
             filename="~/.config/qtile/Assets/python-white.png",
             scale="False",
-            mouse_callbacks={'Button1': lambda: qtile.cmd_spawn("rofi -show drun")},
+            mouse_callbacks={'Button1': lambda: qtile.spawn(launcher_rofi)},
             margin=3,
         ),
         
@@ -387,7 +433,7 @@ def init_widgets_list():
         # ============ WIDGETS DE MONITOREO PARA DESARROLLO ============
         
         # Uso de CPU con gráfico
-        widget.CPU(
+        SharedCPU(
             format="🖥️ {load_percent}%",
             foreground="#e06c75",
             background="#282c34",
@@ -395,8 +441,20 @@ def init_widgets_list():
             update_interval=2.0,
         ),
         
+        # Carga y temperatura (con histéresis para que no parpadeen)
+        Load(
+            foreground="#e5c07b",
+            background="#282c34",
+            padding=5,
+        ),
+        Temperature(
+            foreground="#e06c75",
+            background="#282c34",
+            padding=5,
+        ),
+        
         # Uso de RAM
-        widget.Memory(
+        SharedMemory(
             format="🧠 {MemUsed:.0f}{mm}",
             foreground="#98c379", 
             background="#282c34",
@@ -404,6 +462,28 @@ def init_widgets_list():
             update_interval=2.0,
         ),
         
+        # Docker / PostgreSQL / Redis (por señales de systemd)
+        Services(
+            foreground="#abb2bf",
+            background="#282c34",
+            padding=5,
+        ),
+        
+        # Repos de ~/Development/projects con cambios sin commit
+        # (clic: rama y cambios de cada uno)
+        GitRepos(
+            foreground="#e5c07b",
+            background="#282c34",
+            padding=5,
+        ),
+        
+        # Proyectos indexados (clic: abrir uno con rofi)
+        Projects(
+            foreground="#61afef",
+            background="#282c34",
+            padding=5,
+        ),
+        
         # Uso de disco (importante para compilaciones)
         widget.DF(
             update_interval=600,
@@ -434,7 +514,7 @@ def init_widgets_list():
         ),
         
         # Control de volumen
-        widget.Volume(
+        SharedVolume(
             foreground="#c678dd",
             background="#282c34",
             padding=5,
@@ -450,11 +530,12 @@ def init_widgets_list():
         ),
         
         # Reloj con formato completo
-        widget.Clock(
+        SharedClock(
             foreground="#e5c07b",
             background="#282c34",
             format="📅 %Y-%m-%d %H:%M",
             padding=5,
+            update_interval=60,
         ),
         
         # Indicador de actualizaciones del sistema
@@ -495,41 +576,42 @@ def init_widgets_screen1():
 
 def init_widgets_screen2():
     widgets_screen2 = init_widgets_list()
-    # Remover systray de pantalla secundaria
-    del widgets_screen2[22]  # QuickExit
-    del widgets_screen2[21]  # Systray
-    return widgets_screen2
+    # Remover systray y botón de apagado de la pantalla secundaria
+    return [w for w in widgets_screen2
+            if not isinstance(w, (widget.Systray, widget.QuickExit))]
+
+def init_bar(widgets):
+    return bar.Bar(
+        widgets=widgets,
+        opacity=0.95,
+        size=28,
+        background="#282c34",
+        margin=[8, 8, 0, 8],  # Margin around bar
+    )
 
+load_profile.mark("widgets")
+
+# Sin xrandr al importar: qtile solo usa tantas pantallas como salidas
+# conectadas haya (RandR desde el backend X) y cada barra se construye
+# cuando su pantalla recibe una salida (ver modules/screens.py)
 screens = [
-    Screen(
-        top=bar.Bar(
-            widgets=init_widgets_screen1(),
-            opacity=0.95,
-            size=28,
-            background="#282c34",
-            margin=[8, 8, 0, 8],  # Margin around bar
-        ),
+    LazyScreen(
+        lambda: init_bar(init_widgets_screen1()),
+        profile=load_profile,
         # Wallpaper para pantalla principal
         wallpaper="~/Pictures/dev-wallpaper.png",
         wallpaper_mode="fill",
     ),
+    # Segunda pantalla
+    LazyScreen(
+        lambda: init_bar(init_widgets_screen2()),
+        profile=load_profile,
+        wallpaper="~/Pictures/dev-wallpaper-2.png",
+        wallpaper_mode="fill",
+    ),
 ]
 
-# Detectar segunda pantalla
-if len(subprocess.run(["xrandr", "--listmonitors"], capture_output=True, text=True).stdout.split('\n')) > 3:
-    screens.append(
-        Screen(
-            top=bar.Bar(
-                widgets=init_widgets_screen2(),
-                opacity=0.95,
-                size=28,
-                background="#282c34",
-                margin=[8, 8, 0, 8],
-            ),
-            wallpaper="~/Pictures/dev-wallpaper-2.png", 
-            wallpaper_mode="fill",
-        )
-    )
+load_profile.mark("screens")
 
 ####################################################
 # CONFIGURACIÓN DE MOUSE Y VENTANAS FLOTANTES
@@ -541,9 +623,10 @@ mouse = [
 ]
 
 # Ventanas que siempre deben flotar (útil para herramientas de desarrollo)
+# Las reglas se compilan en un solo índice (ver modules/window_rules.py)
 floating_layout = layout.Floating(
     **layout_theme,
-    float_rules=[
+    float_rules=[window_rules.float_rules([
         # Diálogos del sistema
         *layout.Floating.default_float_rules,
         Match(wm_class="confirmreset"),  # gitk
@@ -576,9 +659,11 @@ floating_layout = layout.Floating(
         # Calculadora y herramientas pequeñas
         Match(wm_class="galculator"),
         Match(wm_class="calculator"),
-    ]
+    ])]
 )
 
+load_profile.mark("layouts")
+
 ####################################################
 # HOOKS PARA AUTOMATIZACIÓN
 
@@ -594,18 +679,32 @@ def start_always():
     # Establecer cursor
     subprocess.Popen(['xsetroot', '-cursor_name', 'left_ptr'])
 
+@hook.subscribe.startup_complete
+def fill_warm_pools():
+    warm_pools.start()
+    launcher.ensure_daemon()
+
+@hook.subscribe.client_killed
+def remove_warm_windows(client):
+    warm_pools.discard(client)
+
 @hook.subscribe.client_new
 def new_client(client):
     """Configuraciones automáticas para nuevas ventanas"""
-    # IDEs y editores siempre al grupo 3 (Code)
-    if client.window.get_wm_class() and any(ide in client.window.get_wm_class()[1].lower() 
-                                          for ide in ['code', 'pycharm', 'idea', 'sublime']):
-        client.togroup('3')
-    
-    # Navegadores siempre al grupo 2 (Web)
-    elif client.window.get_wm_class() and any(browser in client.window.get_wm_class()[1].lower() 
-                                            for browser in ['firefox', 'chromium', 'chrome']):
-        client.togroup('2')
+    # Las instancias de los pools se ocultan y no van a su grupo
+    if warm_pools.claim(client):
+        return
+    # Una sola consulta al índice: IDEs al 3, navegadores al 2, etc.
+    group = window_groups.classify(client)
+    if group is not None:
+        client.togroup(group)
+
+@hook.subscribe.client_managed
+def managed_client(client):
+    """La ventana ya pasó por los grupos y float_rules"""
+    window_rules.release(client)
+
+load_profile.mark("hooks")
 
 # Configuración adicional
 dgroups_key_binder = None
@@ -647,6 +746,9 @@ development_keys = [
     # Quick terminal commands
     Key([mod, "control"], "t", lazy.spawn(terminal + " -e 'cd ~/Development/projects && bash'")),
     Key([mod, "control"], "g", lazy.spawn(terminal + " -e 'cd ~/Development/projects && git status && bash'")),
+    Key([mod, "shift"], "g",
+        lazy.spawn("sh -c 'cd ~/.config/qtile && python3 -m modules.gitsync --force --notify'"),
+        desc="git fetch de todos los proyectos (en paralelo)"),
     Key([mod, "control"], "d", lazy.spawn(terminal + " -e 'docker ps && bash'")),
     Key([mod, "control"], "k", lazy.spawn(terminal + " -e 'kubectl get pods && bash'")),
     
@@ -654,6 +756,12 @@ development_keys = [
     Key([mod, "control"], "s", lazy.spawn("code ~/Development/projects")),  # Open projects folder
     Key([mod, "control"], "n", lazy.spawn("code --new-window")),           # New VS Code window
     Key([mod, "control"], "p", lazy.spawn("code ~/Development/projects --add")), # Add to workspace
+    Key([mod, "shift"], "p",
+        lazy.spawn("sh -c 'cd ~/.config/qtile && python3 -m modules.projects open'"),
+        desc="Abrir un proyecto (búsqueda difusa con rofi)"),
 ]
 
 keys.extend(development_keys)
+
+load_profile.mark("keys")
+load_profile.report()
@@ -0,0 +1,5 @@
+####################################################
+# Módulos auxiliares de la configuración de Qtile
+# Qtile agrega ~/.config/qtile al sys.path al cargar
+# config.py, así que se importan como "modules.<nombre>"
+####################################################
@@ -0,0 +1,127 @@
+####################################################
+# Constructor de barras a partir de segmentos
+#
+# La barra de config.py es una serie de "segmentos":
+# separador izquierdo (1.png, 2.png, 3.png ...), los
+# widgets del segmento y el separador derecho (5.png,
+# 6.png). Antes cada barra repetía ~20 widget.Image
+# apuntando a los mismos archivos y cada uno decodificaba
+# y escalaba su propia copia, también en cada reload.
+#
+# Aquí la barra se describe una sola vez y las imágenes
+# se decodifican y escalan una vez por (archivo, tamaño);
+# todos los widgets de todas las pantallas comparten la
+# misma superficie. El caché se reusa cuando qtile vuelve
+# a ejecutar el módulo en lazy.reload_config(), así que
+# recargar no vuelve a decodificar nada.
+####################################################
+
+import os
+
+from libqtile import widget
+from libqtile.images import Img
+from libqtile.log_utils import logger
+
+
+ASSETS = "~/.config/qtile/Assets"
+
+
+####################################################
+# Caché de imágenes decodificadas
+
+# (ruta, rotación, tamaño, horizontal) -> (mtime, Img)
+_images = globals().get("_images", {})
+
+def shared_image(filename, rotate=0.0, size=None, horizontal=True):
+    """Devuelve la imagen decodificada y escalada, compartida entre widgets
+
+    El fondo no forma parte de la clave: el widget pinta su fondo y
+    encima el patrón de la imagen, así que la superficie es la misma
+    para cualquier color de fondo.
+    """
+    path = os.path.expanduser(filename)
+    mtime = os.stat(path).st_mtime_ns
+    key = (path, rotate, size, horizontal)
+    cached = _images.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    img = Img.from_path(path)
+    img.theta = rotate
+    if size is not None:
+        if horizontal:
+            img.resize(height=size)
+        else:
+            img.resize(width=size)
+    _images[key] = (mtime, img)
+    return img
+
+
+class CachedImage(widget.Image):
+    """widget.Image que toma la superficie del caché compartido"""
+
+    def _update_image(self):
+        self.img = None
+        if not self.filename:
+            logger.warning("Image filename not set!")
+            return
+        self.filename = os.path.expanduser(self.filename)
+        if not os.path.exists(self.filename):
+            logger.warning("Image does not exist: %s", self.filename)
+            return
+
+        size = None
+        if self.scale:
+            if self.bar.horizontal:
+                size = self.bar.height - (self.margin_y * 2)
+            else:
+                size = self.bar.width - (self.margin_x * 2)
+        self.img = shared_image(self.filename, self.rotate, size, self.bar.horizontal)
+
+
+####################################################
+# Descripción declarativa de la barra
+
+class W:
+    """Receta de un widget: la clase y sus opciones
+
+    Los widgets de qtile no se pueden compartir entre barras,
+    así que cada barra instancia su propia copia con build().
+    """
+
+    def __init__(self, cls, **config):
+        self.cls = cls
+        self.config = config
+
+    def build(self):
+        return self.cls(**self.config)
+
+
+def Image(name, **config):
+    """Imagen de Assets/ (ej. Image("5.png", background="#4B427E"))"""
+    return W(CachedImage, filename=os.path.join(ASSETS, name), **config)
+
+
+class Segment:
+    """Un bloque de la barra: separador izquierdo, widgets y separador derecho"""
+
+    def __init__(self, *widgets, left=None, right=None):
+        self.widgets = widgets
+        self.left = left
+        self.right = right
+
+    def build(self):
+        recipes = [self.left, *self.widgets, self.right]
+        return [recipe.build() for recipe in recipes if recipe is not None]
+
+
+def build_widgets(segments, order):
+    """Genera la lista de widgets de una barra
+
+    segments: dict nombre -> Segment
+    order: nombres de los segmentos que lleva esta pantalla, en orden
+    """
+    widgets = []
+    for name in order:
+        widgets.extend(segments[name].build())
+    return widgets
@@ -0,0 +1,344 @@
+####################################################
+# Cliente D-Bus mínimo (solo biblioteca estándar)
+#
+# Lo justo para hablar con systemd por el bus del
+# sistema sin lanzar systemctl: llamadas a métodos,
+# reglas de coincidencia y lectura de señales. Sin
+# dependencias para que funcione igual en statusd (dwm),
+# en qtile y en los scripts de la terminal.
+#
+# Valores: los arrays son listas, los a{..} son dict,
+# las estructuras son tuplas y un variante se escribe
+# como (firma, valor) y se lee solo como el valor.
+####################################################
+
+import os
+import socket
+import struct
+
+
+SYSTEM_BUS_SOCKET = "/var/run/dbus/system_bus_socket"
+SYSTEM_BUS = "unix:path=" + SYSTEM_BUS_SOCKET
+
+_CALL, _REPLY, _ERROR, _SIGNAL = 1, 2, 3, 4
+_NO_REPLY_EXPECTED = 0x1
+
+# Campos de la cabecera
+_PATH, _INTERFACE, _MEMBER, _ERROR_NAME, _REPLY_SERIAL = 1, 2, 3, 4, 5
+_DESTINATION, _SENDER, _SIGNATURE = 6, 7, 8
+
+# Tipos de tamaño fijo: formato de struct
+_FIXED = {
+    "y": "B", "b": "I", "n": "h", "q": "H", "i": "i",
+    "u": "I", "x": "q", "t": "Q", "d": "d", "h": "I",
+}
+
+
+class DBusError(Exception):
+    """Respuesta de error de un método (p.ej. org.freedesktop.DBus.Error.UnknownObject)"""
+
+    def __init__(self, name, message=""):
+        super().__init__(f"{name}: {message}" if message else name)
+        self.name = name
+
+
+####################################################
+# Serialización
+
+def _type_end(sig, i):
+    """Índice donde termina el tipo completo que empieza en sig[i]"""
+    c = sig[i]
+    if c == "a":
+        return _type_end(sig, i + 1)
+    if c in "({":
+        close = ")" if c == "(" else "}"
+        depth = 0
+        for j in range(i, len(sig)):
+            if sig[j] in "({":
+                depth += 1
+            elif sig[j] in ")}":
+                depth -= 1
+                if depth == 0:
+                    return j + 1
+        raise ValueError(f"firma sin cerrar: {sig!r} (falta {close})")
+    return i + 1
+
+
+def split_signature(sig):
+    types, i = [], 0
+    while i < len(sig):
+        end = _type_end(sig, i)
+        types.append(sig[i:end])
+        i = end
+    return types
+
+
+def _alignment(c):
+    if c in _FIXED:
+        return struct.calcsize(_FIXED[c])
+    if c in "({":
+        return 8
+    if c in "soa":
+        return 4
+    return 1                    # g, v
+
+
+class _Writer:
+    def __init__(self):
+        self.buf = bytearray()
+
+    def align(self, n):
+        self.buf += b"\0" * (-len(self.buf) % n)
+
+    def write(self, t, value):
+        c = t[0]
+        if c in _FIXED:
+            self.align(_alignment(c))
+            self.buf += struct.pack("<" + _FIXED[c], value)
+        elif c in "so":
+            data = value.encode()
+            self.align(4)
+            self.buf += struct.pack("<I", len(data)) + data + b"\0"
+        elif c == "g":
+            data = value.encode()
+            self.buf += bytes([len(data)]) + data + b"\0"
+        elif c == "v":
+            sig, inner = value
+            self.write("g", sig)
+            self.write(sig, inner)
+        elif c in "({":
+            self.align(8)
+            for sub, item in zip(split_signature(t[1:-1]), value):
+                self.write(sub, item)
+        elif c == "a":
+            elem = t[1:]
+            self.align(4)
+            length_at = len(self.buf)
+            self.buf += b"\0\0\0\0"
+            self.align(_alignment(elem[0]))
+            start = len(self.buf)
+            for item in (value.items() if elem[0] == "{" else value):
+                self.write(elem, item)
+            struct.pack_into("<I", self.buf, length_at, len(self.buf) - start)
+        else:
+            raise ValueError(f"tipo D-Bus no soportado: {t!r}")
+
+
+class _Reader:
+    def __init__(self, data, endian, offset=0):
+        self.data = data
+        self.endian = endian
+        self.pos = offset
+
+    def align(self, n):
+        self.pos += -self.pos % n
+
+    def _unpack(self, fmt):
+        value, = struct.unpack_from(self.endian + fmt, self.data, self.pos)
+        self.pos += struct.calcsize(fmt)
+        return value
+
+    def read(self, t):
+        c = t[0]
+        if c in _FIXED:
+            self.align(_alignment(c))
+            value = self._unpack(_FIXED[c])
+            return bool(value) if c == "b" else value
+        if c in "so":
+            self.align(4)
+            length = self._unpack("I")
+            value = self.data[self.pos:self.pos + length].decode()
+            self.pos += length + 1
+            return value
+        if c == "g":
+            length = self.data[self.pos]
+            value = self.data[self.pos + 1:self.pos + 1 + length].decode()
+            self.pos += length + 2
+            return value
+        if c == "v":
+            return self.read(self.read("g"))
+        if c in "({":
+            self.align(8)
+            return tuple(self.read(sub) for sub in split_signature(t[1:-1]))
+        if c == "a":
+            elem = t[1:]
+            self.align(4)
+            length = self._unpack("I")
+            self.align(_alignment(elem[0]))
+            end = self.pos + length
+            items = []
+            while self.pos < end:
+                items.append(self.read(elem))
+            return dict(items) if elem[0] == "{" else items
+        raise ValueError(f"tipo D-Bus no soportado: {t!r}")
+
+
+class Message:
+    """Mensaje recibido: tipo, cabecera y cuerpo ya decodificado"""
+
+    def __init__(self, kind, serial, fields, body):
+        self.kind = kind
+        self.serial = serial
+        self.fields = fields
+        self.body = body
+
+    path = property(lambda self: self.fields.get(_PATH))
+    interface = property(lambda self: self.fields.get(_INTERFACE))
+    member = property(lambda self: self.fields.get(_MEMBER))
+    sender = property(lambda self: self.fields.get(_SENDER))
+    reply_serial = property(lambda self: self.fields.get(_REPLY_SERIAL))
+
+    @property
+    def is_signal(self):
+        return self.kind == _SIGNAL
+
+
+def _encode(kind, serial, fields, signature="", body=(), flags=0):
+    payload = _Writer()
+    for t, value in zip(split_signature(signature), body):
+        payload.write(t, value)
+    fields = [(code, value) for code, value in fields if value[1] is not None]
+    if signature:
+        fields.append((_SIGNATURE, ("g", signature)))
+    header = _Writer()
+    header.buf += struct.pack("<cBBBII", b"l", kind, flags, 1, len(payload.buf), serial)
+    header.write("a(yv)", fields)
+    header.align(8)
+    return bytes(header.buf + payload.buf)
+
+
+####################################################
+# Conexión
+
+def _connect_address(address):
+    for candidate in address.split(";"):
+        transport, _, params = candidate.partition(":")
+        if transport != "unix":
+            continue
+        options = dict(p.split("=", 1) for p in params.split(",") if "=" in p)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM | socket.SOCK_CLOEXEC)
+        try:
+            if "path" in options:
+                sock.connect(options["path"])
+            elif "abstract" in options:
+                sock.connect("\0" + options["abstract"])
+            else:
+                sock.close()
+                continue
+        except OSError:
+            sock.close()
+            continue
+        return sock
+    raise ConnectionError(f"no se pudo conectar al bus D-Bus: {address}")
+
+
+class Connection:
+    """Conexión a un bus (por defecto el del sistema)
+
+    call() bloquea hasta la respuesta; las señales que lleguen mientras
+    tanto se guardan para el siguiente next_signal().
+    """
+
+    def __init__(self, address=None):
+        address = address or os.environ.get("DBUS_SYSTEM_BUS_ADDRESS", SYSTEM_BUS)
+        self.sock = _connect_address(address)
+        self._buf = b""
+        self._serial = 0
+        self._signals = []
+        self._authenticate()
+        self.unique_name = self.call(
+            "org.freedesktop.DBus", "/org/freedesktop/DBus",
+            "org.freedesktop.DBus", "Hello",
+        )[0]
+
+    def _authenticate(self):
+        uid = str(os.getuid()).encode().hex()
+        self.sock.sendall(b"\0AUTH EXTERNAL " + uid.encode() + b"\r\n")
+        line = self._read_line()
+        if not line.startswith(b"OK "):
+            raise ConnectionError(f"D-Bus rechazó la autenticación: {line!r}")
+        self.sock.sendall(b"BEGIN\r\n")
+
+    def _read_line(self):
+        while b"\r\n" not in self._buf:
+            self._fill()
+        line, _, self._buf = self._buf.partition(b"\r\n")
+        return line
+
+    def _fill(self):
+        data = self.sock.recv(65536)
+        if not data:
+            raise ConnectionError("el bus D-Bus cerró la conexión")
+        self._buf += data
+
+    def _read_exact(self, n):
+        while len(self._buf) < n:
+            self._fill()
+        data, self._buf = self._buf[:n], self._buf[n:]
+        return data
+
+    def _read_message(self):
+        head = self._read_exact(16)
+        endian = "<" if head[:1] == b"l" else ">"
+        kind = head[1]
+        body_len, serial, fields_len = struct.unpack_from(endian + "III", head, 4)
+        header_len = 16 + fields_len + (-fields_len % 8)
+        data = head + self._read_exact(header_len - 16 + body_len)
+        reader = _Reader(data, endian, 12)
+        fields = dict(reader.read("a(yv)"))
+        reader.pos = header_len
+        signature = fields.get(_SIGNATURE, "")
+        body = [reader.read(t) for t in split_signature(signature)]
+        return Message(kind, serial, fields, body)
+
+    def _send(self, kind, fields, signature="", body=(), flags=0):
+        self._serial += 1
+        self.sock.sendall(_encode(kind, self._serial, fields, signature, body, flags))
+        return self._serial
+
+    def call(self, destination, path, interface, member, signature="", body=()):
+        serial = self._send(_CALL, [
+            (_PATH, ("o", path)),
+            (_INTERFACE, ("s", interface)),
+            (_MEMBER, ("s", member)),
+            (_DESTINATION, ("s", destination)),
+        ], signature, body)
+        while True:
+            message = self._read_message()
+            if message.is_signal:
+                self._signals.append(message)
+            elif message.reply_serial == serial:
+                if message.kind == _ERROR:
+                    detail = message.body[0] if message.body else ""
+                    raise DBusError(message.fields.get(_ERROR_NAME), detail)
+                return message.body
+
+    def add_match(self, rule):
+        self.call("org.freedesktop.DBus", "/org/freedesktop/DBus",
+                  "org.freedesktop.DBus", "AddMatch", "s", [rule])
+
+    def get_property(self, destination, path, interface, name):
+        return self.call(destination, path, "org.freedesktop.DBus.Properties",
+                         "Get", "ss", [interface, name])[0]
+
+    def emit_signal(self, path, interface, member, signature="", body=()):
+        self._send(_SIGNAL, [
+            (_PATH, ("o", path)),
+            (_INTERFACE, ("s", interface)),
+            (_MEMBER, ("s", member)),
+        ], signature, body, _NO_REPLY_EXPECTED)
+
+    def next_signal(self):
+        """Bloquea hasta la próxima señal que coincida con alguna regla"""
+        while not self._signals:
+            message = self._read_message()
+            if message.is_signal:
+                return message
+        return self._signals.pop(0)
+
+    def close(self):
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
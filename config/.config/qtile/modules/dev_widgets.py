@@ -0,0 +1,239 @@
+####################################################
+# Widgets de la barra de desarrollo (config_developer.py)
+#
+# Se apoyan en el muestreador compartido: una sola
+# fuente de datos para todas las pantallas.
+####################################################
+
+from libqtile import qtile
+from libqtile.utils import send_notification
+from libqtile.widget import base
+
+from .projects import MAX_AGE, ProjectIndex
+from .repos import RepoIndex
+from .sampler import _SharedWidget, sampler
+from .sensors import LoadAverage, ThermalSensors
+from .units import DEV_UNITS, UnitMonitor, format_services, write_states
+
+
+####################################################
+# Estado git de ~/Development/projects (ver modules/repos.py)
+
+# Los monitores en marcha se conservan en un reload (ver modules/sampler.py)
+_repo_index = globals().get("_repo_index")
+
+def _start_repos(publish):
+    global _repo_index
+    # Se publica una copia: el índice sigue cambiando en su hilo
+    _repo_index = RepoIndex(
+        on_change=lambda index: publish((index.summary(), index.details()))
+    )
+    _repo_index.start()
+
+
+def _stop_repos():
+    _repo_index.stop()
+
+
+sampler.register_events("repos", _start_repos, _stop_repos)
+
+
+class GitRepos(_SharedWidget, base._TextBox):
+    """Repos con cambios sin commit: 📋📝N, 📋✅ o 📋❓
+
+    Clic izquierdo: notificación con la rama y los cambios de cada repo.
+    """
+
+    source = "repos"
+    defaults = [
+        ("format", "📋{summary}", "Formato del texto ({summary} = 📝N, ✅ o ❓)"),
+    ]
+
+    def __init__(self, **config):
+        base._TextBox.__init__(self, "", **config)
+        self.add_defaults(GitRepos.defaults)
+        # Por eventos: el intervalo solo lo usa el muestreador para ordenar
+        self.update_interval = 0
+        self.repos = []
+        self.add_callbacks({"Button1": self.show_details})
+
+    def _on_sample(self, sample):
+        if isinstance(sample, Exception):
+            return
+        summary, self.repos = sample
+        self.update(self.format.format(summary=summary))
+
+    def show_details(self):
+        lines = []
+        for repo in self.repos:
+            if repo.error:
+                lines.append(f"❓ {repo.name}: {repo.error}")
+                continue
+            status = f"📝{repo.changes}" if repo.dirty else "✅"
+            sync = ""
+            if repo.ahead or repo.behind:
+                sync = f" ↑{repo.ahead} ↓{repo.behind}"
+            lines.append(f"{status} {repo.name} ({repo.branch}){sync}")
+        send_notification("Repositorios", "\n".join(lines) or "Sin repositorios")
+
+
+####################################################
+# Servicios de desarrollo por señales de systemd (ver modules/units.py)
+
+_unit_monitor = globals().get("_unit_monitor")
+
+def _start_units(publish):
+    global _unit_monitor
+
+    def on_change(states):
+        write_states(states)        # caché para los scripts de la terminal
+        publish(states)
+
+    _unit_monitor = UnitMonitor(DEV_UNITS, on_change)
+    _unit_monitor.start()
+
+
+def _stop_units():
+    _unit_monitor.stop()
+
+
+sampler.register_events("units", _start_units, _stop_units)
+
+
+class Services(_SharedWidget, base._TextBox):
+    """Docker, PostgreSQL y Redis: 🐳🟢 🐘🔴 📦🔴
+
+    Clic izquierdo: notificación con el ActiveState de cada unidad.
+    """
+
+    source = "units"
+
+    def __init__(self, **config):
+        base._TextBox.__init__(self, "", **config)
+        self.update_interval = 0
+        self.states = {}
+        self.add_callbacks({"Button1": self.show_details})
+
+    def _on_sample(self, sample):
+        if isinstance(sample, Exception):
+            return
+        self.states = sample
+        self.update(format_services(sample))
+
+    def show_details(self):
+        lines = [f"{unit}: {self.states.get(unit, '?')}" for unit in DEV_UNITS]
+        send_notification("Servicios", "\n".join(lines))
+
+
+####################################################
+# Carga y temperatura con histéresis (ver modules/sensors.py)
+
+# Se conservan en un reload: cada uno tiene sus archivos de /proc y /sys
+# abiertos y el estado de la histéresis (ver modules/sampler.py)
+_load_average = globals().get("_load_average") or LoadAverage()
+_thermal_sensors = globals().get("_thermal_sensors") or ThermalSensors()
+
+sampler.register("load", _load_average.read)
+sampler.register("thermal", _thermal_sensors.read)
+
+
+class Load(_SharedWidget, base._TextBox):
+    """Carga de 1 minuto: ⚡🟢 0.42"""
+
+    source = "load"
+    defaults = [
+        ("update_interval", 2, "Segundos entre lecturas"),
+        ("format", "⚡{icon} {load}", "Campos: icon, load, load5, load15"),
+    ]
+
+    def __init__(self, **config):
+        base._TextBox.__init__(self, "", **config)
+        self.add_defaults(Load.defaults)
+
+    def _on_sample(self, sample):
+        if isinstance(sample, Exception):
+            return
+        self.update(self.format.format(**sample))
+
+
+class Temperature(_SharedWidget, base._TextBox):
+    """Temperatura del paquete de la CPU: 🟡58°C
+
+    Clic izquierdo: notificación con todos los sensores.
+    """
+
+    source = "thermal"
+    defaults = [
+        ("update_interval", 2, "Segundos entre lecturas"),
+        ("format", "{icon}{package:.0f}°C", "Campos: icon, package, max"),
+    ]
+
+    def __init__(self, **config):
+        base._TextBox.__init__(self, "", **config)
+        self.add_defaults(Temperature.defaults)
+        self.sample = None
+        self.add_callbacks({"Button1": self.show_details})
+
+    def _on_sample(self, sample):
+        if isinstance(sample, Exception):
+            return
+        self.sample = sample
+        # Sin sensores el widget queda vacío, como cpu_temp() en el script
+        self.update("" if sample is None else self.format.format(**sample))
+
+    def show_details(self):
+        if self.sample is None:
+            return
+        lines = [f"{name}: {value:.1f}°C" for name, value in self.sample["sensors"].items()]
+        send_notification(f"Temperatura (máx. {self.sample['max']:.0f}°C)", "\n".join(lines))
+
+
+####################################################
+# Proyectos de ~/Development/projects (ver modules/projects.py)
+
+# Solo aquí, en el hilo del muestreador, se recorren también los proyectos viejos
+_project_index = ProjectIndex(max_age=MAX_AGE)
+
+def _read_projects():
+    # Incremental: solo se recorre lo que cambió desde la última vez (o hace MAX_AGE)
+    _project_index.refresh()
+    return _project_index.counts()
+
+
+sampler.register("projects", _read_projects)
+
+
+class Projects(_SharedWidget, base._TextBox):
+    """Número de proyectos: 📂23
+
+    Clic izquierdo: selector de rofi para abrir uno en VS Code.
+    Clic derecho: notificación con los proyectos por lenguaje.
+    """
+
+    source = "projects"
+    defaults = [
+        ("update_interval", 60, "Segundos entre refrescos del índice"),
+        ("format", "📂{total}", "Campos: total y uno por lenguaje (python, nodejs...)"),
+        ("open_command", "sh -c 'cd ~/.config/qtile && python3 -m modules.projects open'",
+         "Comando del clic izquierdo"),
+    ]
+
+    def __init__(self, **config):
+        base._TextBox.__init__(self, "", **config)
+        self.add_defaults(Projects.defaults)
+        self.counts = {}
+        self.add_callbacks({"Button1": self.open_picker, "Button3": self.show_details})
+
+    def _on_sample(self, sample):
+        if isinstance(sample, Exception):
+            return
+        self.counts = sample
+        fields = {"python": 0, "nodejs": 0, "java": 0, "golang": 0, **sample}
+        self.update(self.format.format(total=sum(sample.values()), **fields))
+
+    def open_picker(self):
+        qtile.spawn(self.open_command)
+
+    def show_details(self):
+        lines = [f"{lang}: {count}" for lang, count in sorted(self.counts.items())]
+        send_notification("Proyectos", "\n".join(lines) or "Sin proyectos")
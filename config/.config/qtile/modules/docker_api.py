@@ -0,0 +1,262 @@
+####################################################
+# Estado de los contenedores de desarrollo en una consulta
+#
+# show_status de dev-manager.sh lanzaba docker ps (y a
+# veces docker ps -a) por cada servicio, más un
+# "cd && docker-compose ps" por cada stack; master-dev.sh
+# y devstatus repetían lo mismo. Aquí se pide la lista
+# de contenedores UNA vez a la API de Docker por su
+# socket unix y se reparte entre los servicios de la
+# tabla SERVICES de dev-manager.sh.
+#
+# Salida (separada por tabuladores, para los scripts):
+#     service   <servicio>   running|stopped|missing|unconfigured
+#     network   <red>        present|absent
+#     container <nombre>     <estado de docker ps>   (solo los que corren)
+#
+# Uso:
+#     cd ~/.config/qtile && python3 -m modules.docker_api
+#     python3 -m modules.docker_api --json
+#     python3 -m modules.docker_api "python:python-dev-env:Python Development:8000" ...
+####################################################
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import sys
+from urllib.parse import quote
+
+
+DOCKER_SOCKET = "/var/run/docker.sock"
+
+# La tabla SERVICES de dev-manager.sh: servicio:contenedor:descripción:puerto
+# ("multiple" en el puerto = stack de docker-compose con varios contenedores)
+DEFAULT_SERVICES = (
+    "python:python-dev-env:Python Development:8000",
+    "nodejs:nodejs-dev-env:Node.js Development:3000",
+    "java:java-dev-env:Java Development:8080",
+    "golang:golang-dev-env:Go Development:9000",
+    "databases:Database Stack:PostgreSQL, MySQL, Redis, MongoDB:multiple",
+    "tools:Tools Stack:Traefik, MailHog, MinIO, Elasticsearch:multiple",
+)
+
+_COMPOSE_PROJECT = "com.docker.compose.project"
+_COMPOSE_WORKDIR = "com.docker.compose.project.working_dir"
+
+
+class DockerError(Exception):
+    pass
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=10):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class DockerAPI:
+    """Cliente mínimo de la API de Docker Engine (una conexión keep-alive)"""
+
+    def __init__(self, socket_path=None):
+        if socket_path is None:
+            host = os.environ.get("DOCKER_HOST", "")
+            socket_path = host[len("unix://"):] if host.startswith("unix://") else DOCKER_SOCKET
+        self.conn = _UnixHTTPConnection(socket_path)
+
+    def get(self, path):
+        try:
+            self.conn.request("GET", path)
+            response = self.conn.getresponse()
+            data = response.read()
+        except OSError as e:
+            raise DockerError(f"no se pudo hablar con Docker: {e}") from e
+        if response.status != 200:
+            raise DockerError(f"GET {path}: {response.status} {data.decode(errors='replace').strip()}")
+        return json.loads(data)
+
+    def containers(self):
+        """Todos los contenedores (como docker ps -a) en una sola petición"""
+        return self.get("/containers/json?all=1")
+
+    def network_exists(self, name):
+        filters = quote(json.dumps({"name": [name]}))
+        # El filtro "name" de Docker busca por subcadena: comparar exacto
+        return any(n["Name"] == name for n in self.get(f"/networks?filters={filters}"))
+
+    def volumes(self, label):
+        """Volúmenes con una etiqueta, p.ej. com.docker.compose.project=databases"""
+        filters = quote(json.dumps({"label": [label]}))
+        # Sin ninguno, Docker devuelve "Volumes": null
+        return sorted(v["Name"] for v in self.get(f"/volumes?filters={filters}")["Volumes"] or [])
+
+    def image_id(self, name):
+        """Id local de una imagen, o None si no está descargada"""
+        try:
+            self.conn.request("GET", f"/images/{quote(name, safe='/:@')}/json")
+            response = self.conn.getresponse()
+            data = response.read()
+        except OSError as e:
+            raise DockerError(f"no se pudo hablar con Docker: {e}") from e
+        if response.status == 404:
+            return None
+        if response.status != 200:
+            raise DockerError(f"imagen {name}: {response.status} {data.decode(errors='replace').strip()}")
+        return json.loads(data)["Id"]
+
+    def pull(self, image):
+        """Progreso de docker pull (una conexión aparte, un JSON por línea)"""
+        name, tag = split_reference(image)
+        conn = _UnixHTTPConnection(self.conn.socket_path, timeout=None)
+        try:
+            conn.request("POST", f"/images/create?fromImage={quote(name)}&tag={quote(tag)}")
+            response = conn.getresponse()
+            if response.status != 200:
+                raise DockerError(f"pull {image}: {response.status} "
+                                  f"{response.read().decode(errors='replace').strip()}")
+            while True:
+                line = response.readline()
+                if not line:
+                    return
+                progress = json.loads(line)
+                if "error" in progress:
+                    raise DockerError(f"pull {image}: {progress['error']}")
+                yield progress
+        except OSError as e:
+            raise DockerError(f"pull {image}: {e}") from e
+        finally:
+            conn.close()
+
+    def events(self, filters):
+        """Eventos de Docker a medida que ocurren (una conexión aparte, streaming)"""
+        conn = _UnixHTTPConnection(self.conn.socket_path, timeout=None)
+        try:
+            conn.request("GET", f"/events?filters={quote(json.dumps(filters))}")
+            response = conn.getresponse()
+            if response.status != 200:
+                raise DockerError(f"GET /events: {response.status}")
+            while True:
+                line = response.readline()
+                if not line:
+                    return
+                yield json.loads(line)
+        except OSError as e:
+            raise DockerError(f"se cortó el flujo de eventos de Docker: {e}") from e
+        finally:
+            conn.close()
+
+    def close(self):
+        self.conn.close()
+
+
+def split_reference(image):
+    """postgres:15 -> (postgres, 15); sin etiqueta es latest (la API bajaría todas)"""
+    if "@" in image:
+        return tuple(image.split("@", 1))
+    name, _, tag = image.rpartition(":")
+    if not name or "/" in tag:      # registry:5000/imagen sin etiqueta
+        return image, "latest"
+    return name, tag
+
+
+def _parse_services(entries):
+    services = []
+    for entry in entries:
+        fields = entry.split(":")
+        name = fields[0]
+        container = fields[1] if len(fields) > 1 else ""
+        stack = len(fields) > 3 and fields[3] == "multiple"
+        services.append((name, None if stack else container))
+    return services
+
+
+def stack_members(containers, project, workdir):
+    """Contenedores de un proyecto de docker-compose (por sus etiquetas)"""
+    return [
+        c for c in containers
+        if (c.get("Labels") or {}).get(_COMPOSE_WORKDIR) == workdir
+        or (c.get("Labels") or {}).get(_COMPOSE_PROJECT) == project
+    ]
+
+
+def snapshot(api, services=DEFAULT_SERVICES, containers_dir=None, network="dev-network"):
+    """Estado de cada servicio, de la red y de los contenedores que corren
+
+    Un servicio de un solo contenedor se busca por nombre exacto (como
+    el docker ps --filter de dev-manager.sh); un stack se busca por las
+    etiquetas de docker-compose de su directorio y está "running" si
+    alguno de sus contenedores corre (como el grep "Up" de antes).
+    """
+    containers_dir = os.path.expanduser(containers_dir or "~/Development/containers")
+    containers = api.containers()
+    by_name = {}
+    for container in containers:
+        for name in container.get("Names") or []:
+            by_name[name.lstrip("/")] = container
+
+    states = {}
+    for service, container_name in _parse_services(services):
+        workdir = os.path.join(containers_dir, service)
+        if container_name is not None:
+            members = [by_name[container_name]] if container_name in by_name else []
+        else:
+            members = stack_members(containers, service, workdir)
+        if any(c["State"] == "running" for c in members):
+            states[service] = "running"
+        elif members:
+            states[service] = "stopped"
+        elif not os.path.isdir(workdir):
+            states[service] = "unconfigured"
+        else:
+            states[service] = "missing"
+
+    running = [
+        (c["Names"][0].lstrip("/"), c.get("Status", ""))
+        for c in containers if c["State"] == "running" and c.get("Names")
+    ]
+    return {
+        "services": states,
+        "network": {"name": network, "exists": api.network_exists(network)},
+        "running": running,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Estado de los contenedores de desarrollo")
+    parser.add_argument("services", nargs="*", default=list(DEFAULT_SERVICES),
+                        help="entradas de la tabla SERVICES (servicio:contenedor:descripción:puerto)")
+    parser.add_argument("--containers-dir", default=os.environ.get("DEV_CONTAINERS"))
+    parser.add_argument("--network", default="dev-network")
+    parser.add_argument("--socket", default=None)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    api = DockerAPI(args.socket)
+    try:
+        result = snapshot(api, args.services, args.containers_dir, args.network)
+    except DockerError as e:
+        print(f"docker_api: {e}", file=sys.stderr)
+        return 1
+    finally:
+        api.close()
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return 0
+    for service, state in result["services"].items():
+        print(f"service\t{service}\t{state}")
+    network = result["network"]
+    print(f"network\t{network['name']}\t{'present' if network['exists'] else 'absent'}")
+    for name, status in result["running"]:
+        print(f"container\t{name}\t{status}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
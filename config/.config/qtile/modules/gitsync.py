@@ -0,0 +1,260 @@
+####################################################
+# Sincronización (git fetch) de los proyectos
+#
+# autostart_dev.sh hacía cada hora un find de todos
+# los .git y un "git fetch --all" repo por repo: un
+# remoto lento o caído frenaba toda la vuelta.
+#
+# GitSync lanza los fetch en paralelo con un límite
+# total y otro por servidor remoto, corta los que pasan
+# del tiempo máximo, salta los repos con FETCH_HEAD
+# reciente y espera cada vez más antes de reintentar
+# los que fallan. La hora del último fetch de cada repo
+# queda en ~/.cache/dev-gitsync.json.
+#
+# Uso (autostart_dev.sh lo lanza cada hora, y
+# mod+shift+g en config_developer.py):
+#     cd ~/.config/qtile && python3 -m modules.gitsync
+#     python3 -m modules.gitsync --force --notify
+####################################################
+
+import argparse
+import fcntl
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+from .repos import PROJECTS_DIR, SKIP_DIRS
+
+
+STATE_FILE = "~/.cache/dev-gitsync.json"
+
+# Sin prompts de contraseña ni de host desconocido: un fetch que
+# necesita a alguien delante falla en vez de quedarse colgado
+_GIT_ENV = {
+    "GIT_TERMINAL_PROMPT": "0",
+    "GIT_SSH_COMMAND": "ssh -o BatchMode=yes -o ConnectTimeout=15",
+}
+
+_RE_SCP = re.compile(r"^(?:[^@/]+@)?([^:/]+):")      # git@github.com:user/repo
+_RE_URL = re.compile(r"^[a-z+]+://(?:[^@/]+@)?([^:/]+)")
+
+
+def remote_host(url):
+    """Servidor de un remoto (github.com, gitlab.com...); "local" para rutas"""
+    if url.startswith("file://"):
+        return "local"
+    for regex in (_RE_URL, _RE_SCP):
+        m = regex.match(url)
+        if m:
+            return m.group(1).lower()
+    return "local"
+
+
+def find_repos(root=PROJECTS_DIR):
+    """Todos los repos bajo root (también anidados), como el find de antes"""
+    repos = []
+    for dirpath, dirnames, _ in os.walk(os.path.expanduser(root)):
+        if ".git" in dirnames:
+            repos.append(dirpath)
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+    return repos
+
+
+def remote_hosts(repo):
+    out = subprocess.run(
+        ["git", "-C", repo, "config", "--get-regexp", r"^remote\..*\.url$"],
+        capture_output=True, text=True,
+    ).stdout
+    return sorted({remote_host(line.split(None, 1)[1]) for line in out.splitlines() if " " in line})
+
+
+class GitSync:
+    """Fetch en paralelo de todos los repos con límites y reintentos
+
+    jobs: fetch simultáneos en total; per_host: simultáneos contra un
+    mismo servidor; timeout: segundos máximos por repo; fresh: no se
+    vuelve a hacer fetch si FETCH_HEAD es más reciente que esto;
+    backoff: espera tras el primer fallo (se duplica con cada fallo
+    seguido, hasta un día).
+    """
+
+    def __init__(self, root=PROJECTS_DIR, jobs=8, per_host=4, timeout=120,
+                 fresh=50 * 60, backoff=15 * 60, state_file=STATE_FILE):
+        self.root = root
+        self.jobs = jobs
+        self.per_host = per_host
+        self.timeout = timeout
+        self.fresh = fresh
+        self.backoff = backoff
+        self.state_file = os.path.expanduser(state_file)
+        self.state = {}
+        self.results = {}           # repo -> "ok", "fresco", "espera", o el error
+        self._cond = threading.Condition()
+        self._running = 0
+        self._hosts = {}            # servidor -> fetch en curso
+
+    # ---------- estado persistente ----------
+
+    def load_state(self):
+        try:
+            with open(self.state_file) as f:
+                self.state = json.load(f)
+        except (OSError, ValueError):
+            self.state = {}
+
+    def save_state(self):
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        tmp = f"{self.state_file}.{os.getpid()}"
+        with open(tmp, "w") as f:
+            json.dump(self.state, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.state_file)
+
+    # ---------- decisión por repo ----------
+
+    def _skip_reason(self, repo, now, force):
+        entry = self.state.get(repo, {})
+        if not force and entry.get("next_try", 0) > now:
+            return "espera"         # falló hace poco: backoff
+        if not force:
+            try:
+                fetched = os.stat(os.path.join(repo, ".git", "FETCH_HEAD")).st_mtime
+            except OSError:
+                fetched = 0
+            if now - fetched < self.fresh:
+                return "fresco"
+        return None
+
+    def _fetch(self, repo):
+        # Grupo de procesos propio: al vencer el tiempo hay que matar
+        # también ssh / git-remote-https, que mantienen abierto stderr
+        proc = subprocess.Popen(
+            ["git", "-C", repo, "fetch", "--all", "--quiet", "--prune"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+            env={**os.environ, **_GIT_ENV}, start_new_session=True,
+        )
+        try:
+            _, stderr = proc.communicate(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.communicate()
+            return f"sin respuesta en {self.timeout}s"
+        if proc.returncode != 0:
+            lines = stderr.strip().splitlines()
+            errors = [line for line in lines if line.startswith(("fatal:", "error:"))]
+            return (errors or lines or [f"git fetch salió con {proc.returncode}"])[0]
+        return None
+
+    def _record(self, repo, error):
+        now = time.time()
+        entry = self.state.setdefault(repo, {})
+        if error is None:
+            entry.update(last_fetch=now, failures=0, next_try=0, error=None)
+        else:
+            failures = entry.get("failures", 0) + 1
+            delay = min(self.backoff * 2 ** (failures - 1), 24 * 3600)
+            entry.update(failures=failures, next_try=now + delay, error=error)
+
+    # ---------- planificador ----------
+
+    def _worker(self, repo, hosts):
+        error = self._fetch(repo)
+        with self._cond:
+            self._record(repo, error)
+            self.results[repo] = "ok" if error is None else error
+            self._running -= 1
+            for host in hosts:
+                self._hosts[host] -= 1
+            self._cond.notify_all()
+
+    def _can_start(self, hosts):
+        return (self._running < self.jobs
+                and all(self._hosts.get(host, 0) < self.per_host for host in hosts))
+
+    def run(self, force=False):
+        self.load_state()
+        now = time.time()
+        pending = []
+        for repo in find_repos(self.root):
+            reason = self._skip_reason(repo, now, force)
+            if reason is not None:
+                self.results[repo] = reason
+                continue
+            hosts = remote_hosts(repo)
+            if not hosts:
+                self.results[repo] = "sin remotos"
+                continue
+            pending.append((repo, hosts))
+
+        # Cada repo arranca en cuanto hay hueco total y en sus servidores;
+        # un servidor lento solo retiene sus propios repos
+        threads = []
+        with self._cond:
+            while pending:
+                ready = next((item for item in pending if self._can_start(item[1])), None)
+                if ready is None:
+                    self._cond.wait()
+                    continue
+                pending.remove(ready)
+                repo, hosts = ready
+                self._running += 1
+                for host in hosts:
+                    self._hosts[host] = self._hosts.get(host, 0) + 1
+                thread = threading.Thread(target=self._worker, args=ready, daemon=True)
+                thread.start()
+                threads.append(thread)
+        for thread in threads:
+            thread.join()
+
+        self.save_state()
+        return self.results
+
+    def summary(self):
+        counts = {}
+        for result in self.results.values():
+            key = result if result in ("ok", "fresco", "espera", "sin remotos") else "error"
+            counts[key] = counts.get(key, 0) + 1
+        return ", ".join(f"{n} {key}" for key, n in sorted(counts.items())) or "sin repos"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="git fetch en paralelo de los proyectos")
+    parser.add_argument("--root", default=PROJECTS_DIR)
+    parser.add_argument("--jobs", type=int, default=8, help="fetch simultáneos")
+    parser.add_argument("--per-host", type=int, default=4,
+                        help="fetch simultáneos contra un mismo servidor")
+    parser.add_argument("--timeout", type=int, default=120, help="segundos máximos por repo")
+    parser.add_argument("--force", action="store_true",
+                        help="ignorar FETCH_HEAD reciente y las esperas por fallos")
+    parser.add_argument("--notify", action="store_true", help="avisar con notify-send al terminar")
+    args = parser.parse_args(argv)
+
+    sync = GitSync(args.root, args.jobs, args.per_host, args.timeout)
+    # Una sola sincronización a la vez (la de cada hora y la del atajo)
+    os.makedirs(os.path.dirname(sync.state_file), exist_ok=True)
+    with open(sync.state_file + ".lock", "w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            print("gitsync: ya hay una sincronización en curso", file=sys.stderr)
+            return 1
+        started = time.monotonic()
+        results = sync.run(force=args.force)
+
+    for repo, result in sorted(results.items()):
+        if result not in ("ok", "fresco", "espera"):
+            print(f"{os.path.relpath(repo, os.path.expanduser(args.root))}: {result}")
+    message = f"{sync.summary()} en {time.monotonic() - started:.1f}s"
+    print(message)
+    if args.notify:
+        subprocess.run(["notify-send", "Sincronización de repos", message])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
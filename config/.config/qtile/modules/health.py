@@ -0,0 +1,283 @@
+####################################################
+# Verificación del sistema de desarrollo en paralelo
+#
+# system_check de master-dev.sh y system_health_check
+# de ~/.dev_logger comprobaban herramientas, servicios,
+# directorios y puertos uno detrás de otro: un
+# "command -v" por herramienta, systemctl, "groups |
+# grep" y un "ss -tulnp | grep" por puerto (ss cuatro
+# veces).
+#
+# Aquí todas las comprobaciones van a la vez; el PATH se
+# recorre una sola vez para todas las herramientas y
+# /proc/net/{tcp,udp}* se lee una sola vez para todos
+# los puertos. Cada resultado lleva lo que tardó.
+#
+# Perfiles:
+#     system   lo de master-dev.sh check (secciones 1-5)
+#     health   lo de dev-check (dependencias y puertos)
+#
+# Uso (master-dev.sh check y dev-check ya lo usan):
+#     cd ~/.config/qtile && python3 -m modules.health system
+#     python3 -m modules.health health --json
+#     python3 -m modules.health health --tsv
+#
+# El código de salida es el número de problemas (0 = todo bien).
+####################################################
+
+import argparse
+import grp
+import json
+import os
+import pwd
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .docker_api import DockerAPI, DockerError
+from .units import query_states
+
+
+####################################################
+# Datos compartidos: se calculan una vez, la primera
+# comprobación que los pide
+
+class _Lazy:
+    def __init__(self, fn):
+        self.fn = fn
+        self._lock = threading.Lock()
+        self._value = None
+        self._done = False
+
+    def __call__(self):
+        with self._lock:
+            if not self._done:
+                self._value = self.fn()
+                self._done = True
+            return self._value
+
+
+def _scan_path():
+    """{nombre: ruta} de lo que hay en el PATH (el primero gana), en un solo recorrido"""
+    found = {}
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            entries = os.scandir(directory or ".")
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name not in found and not entry.is_dir():
+                    found[entry.name] = entry.path
+    return found
+
+
+def _scan_ports(proc_net="/proc/net"):
+    """Puertos en escucha (TCP en LISTEN y UDP ligados), como ss -tuln"""
+    ports = set()
+    for name, listening in (("tcp", "0A"), ("tcp6", "0A"), ("udp", "07"), ("udp6", "07")):
+        try:
+            with open(os.path.join(proc_net, name)) as f:
+                next(f)
+                for line in f:
+                    fields = line.split()
+                    if fields[3] == listening:
+                        ports.add(int(fields[1].rsplit(":", 1)[1], 16))
+        except (OSError, StopIteration):
+            continue
+    return ports
+
+
+executables = _Lazy(_scan_path)
+listening_ports = _Lazy(_scan_ports)
+
+
+####################################################
+# Comprobaciones: devuelven (estado, detalle) con
+# estado "ok", "warn" o "fail"
+
+def tool(name, package=None):
+    def check():
+        # Permiso de ejecución solo de lo que se pregunta, no de todo el PATH
+        path = executables().get(name)
+        if path is not None and os.access(path, os.X_OK):
+            return "ok", name
+        if package:
+            return "fail", f"{name} no está instalado. Instalar con: sudo apt install {package}"
+        return "fail", f"{name} (faltante)"
+    return check
+
+
+def directory(path):
+    return lambda: ("ok", path) if os.path.isdir(path) else ("fail", f"{path} (faltante)")
+
+
+def config_file(path, ok, missing):
+    return lambda: ("ok", ok) if os.path.isfile(os.path.expanduser(path)) else ("fail", missing)
+
+
+def port(number, service):
+    def check():
+        if number in listening_ports():
+            return "warn", f"Puerto {number} ({service}) está en uso"
+        return "ok", f"Puerto {number} ({service}) está disponible"
+    return check
+
+
+def unit_active(unit):
+    def check():
+        state = query_states((unit,)).get(unit)
+        return ("ok", "Servicio activo") if state == "active" else ("fail", "Servicio inactivo")
+    return check
+
+
+def user_in_group(group):
+    def check():
+        user = os.environ.get("USER") or pwd.getpwuid(os.getuid()).pw_name
+        try:
+            entry = grp.getgrnam(group)
+        except KeyError:
+            return "fail", f"No existe el grupo {group}"
+        if user in entry.gr_mem or pwd.getpwnam(user).pw_gid == entry.gr_gid:
+            return "ok", f"Usuario en grupo {group}"
+        return "fail", f"Usuario NO en grupo {group}"
+    return check
+
+
+def docker_responds():
+    api = DockerAPI()
+    try:
+        version = api.get("/version")
+    except DockerError:
+        return "fail", "Docker no responde"
+    finally:
+        api.close()
+    return "ok", f"Docker funcional ({version.get('Version', '?')})"
+
+
+####################################################
+# Perfiles: (sección, nombre, comprobación, requiere)
+
+def _env_dir(var, default):
+    return os.path.expanduser(os.environ.get(var) or default)
+
+
+def system_profile():
+    dev_home = _env_dir("DEV_HOME", "~/Development")
+    checks = [("1. 🛠️  Herramientas básicas", name, tool(name), None)
+              for name in ("bash", "git", "curl", "wget", "docker", "docker-compose")]
+    docker = "2. 🐳 Docker"
+    checks += [
+        (docker, "servicio", unit_active("docker"), None),
+        # Como antes, grupo y API solo se miran con el servicio activo
+        (docker, "grupo", user_in_group("docker"), "servicio"),
+        (docker, "api", docker_responds, "servicio"),
+    ]
+    dirs = (dev_home, _env_dir("DEV_PROJECTS", f"{dev_home}/projects"),
+            _env_dir("DEV_CONTAINERS", f"{dev_home}/containers"),
+            _env_dir("DEV_TOOLS", f"{dev_home}/tools"), _env_dir("DEV_LOGS", f"{dev_home}/logs"))
+    checks += [("3. 📁 Estructura de directorios", path, directory(path), None) for path in dirs]
+    checks += [("4. 📜 Scripts del sistema", name, tool(name), None)
+               for name in ("dev-check", "dev-init", "dev-setup-complete", "tools-check")]
+    config = "5. ⚙️  Configuración integrada"
+    checks += [
+        (config, "dev_config", config_file("~/.dev_config", "Archivo de configuración global",
+                                           "Configuración global faltante"), None),
+        (config, "dev_logger", config_file("~/.dev_logger", "Sistema de logging",
+                                           "Sistema de logging faltante"), None),
+        (config, "dev_functions", config_file("~/.dev_functions", "Funciones de desarrollo",
+                                              "Funciones de desarrollo faltantes"), None),
+    ]
+    return checks
+
+
+def health_profile():
+    deps = (("docker", "docker.io"), ("docker-compose", "docker-compose"), ("git", "git"),
+            ("code", "code"), ("python3", "python3"), ("node", "nodejs"),
+            ("psql", "postgresql-client"), ("mysql", "mysql-client"), ("redis-cli", "redis-tools"))
+    checks = [("deps", name, tool(name, package), None) for name, package in deps]
+    ports = ((5432, "PostgreSQL"), (3306, "MySQL"), (6379, "Redis"), (27017, "MongoDB"))
+    checks += [("ports", str(number), port(number, service), None) for number, service in ports]
+    return checks
+
+
+PROFILES = {"system": system_profile, "health": health_profile}
+
+
+####################################################
+# Motor
+
+def run_checks(checks):
+    """Lanza todas las comprobaciones a la vez; resultados en el orden dado"""
+    futures = {}
+
+    def run(section, name, fn, requires):
+        if requires is not None:
+            # Un hilo por comprobación: esperar a otra no bloquea la cola
+            required = futures[(section, requires)].result()
+            if required["status"] != "ok":
+                return dict(section=section, name=name, status="skip",
+                            detail=f"omitido: {requires} falló", ms=0.0)
+        started = time.perf_counter()
+        try:
+            status, detail = fn()
+        except Exception as e:          # una comprobación rota no tumba las demás
+            status, detail = "fail", f"{name}: {e}"
+        return dict(section=section, name=name, status=status, detail=detail,
+                    ms=round((time.perf_counter() - started) * 1000, 2))
+
+    with ThreadPoolExecutor(max(1, len(checks))) as pool:
+        for section, name, fn, requires in checks:
+            futures[(section, name)] = pool.submit(run, section, name, fn, requires)
+        return [future.result() for future in futures.values()]
+
+
+_ICONS = {"ok": "✅", "warn": "⚠️ ", "fail": "❌", "skip": "⏭️ "}
+
+
+def print_text(results, timing=False):
+    section = None
+    for result in results:
+        if result["status"] == "skip":
+            continue
+        if result["section"] != section:
+            if section is not None:
+                print()
+            section = result["section"]
+            print(f"{section}:")
+        ms = f"  ({result['ms']:.1f} ms)" if timing else ""
+        print(f"   {_ICONS[result['status']]} {result['detail']}{ms}")
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verificación del sistema de desarrollo")
+    parser.add_argument("profile", nargs="?", default="system", choices=sorted(PROFILES))
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--json", action="store_true")
+    output.add_argument("--tsv", action="store_true",
+                        help="sección, nombre, estado, ms y detalle por línea (para los scripts)")
+    parser.add_argument("--timing", action="store_true", help="mostrar lo que tarda cada una")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = run_checks(PROFILES[args.profile]())
+    elapsed = round((time.perf_counter() - started) * 1000, 2)
+    issues = sum(result["status"] == "fail" for result in results)
+
+    if args.json:
+        print(json.dumps({"profile": args.profile, "issues": issues, "ms": elapsed,
+                          "checks": results}, indent=2, ensure_ascii=False))
+    elif args.tsv:
+        for r in results:
+            print(f"{r['section']}\t{r['name']}\t{r['status']}\t{r['ms']}\t{r['detail']}")
+    else:
+        print_text(results, args.timing)
+        if args.timing:
+            print(f"Total: {elapsed:.1f} ms")
+    return min(issues, 125)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+####################################################
+# Actualización de las imágenes de los stacks
+#
+# update_images de dev-manager.sh hacía
+# "docker-compose pull" stack por stack, y update_system
+# de master-dev.sh además un "up -d" de todos, cambiara
+# algo o no.
+#
+# Aquí se leen las imágenes de todos los stacks, se
+# descargan a la vez (con un tope de descargas
+# simultáneas) por la API de Docker y se compara el Id
+# de cada imagen antes y después. Solo se recrean los
+# servicios que están corriendo con una imagen que ya
+# no es la última; los stacks parados no se arrancan.
+# Al final, bytes descargados y tiempo.
+#
+# Uso (dev-manager.sh update y master-dev.sh update):
+#     cd ~/.config/qtile && python3 -m modules.images
+#     python3 -m modules.images --jobs 2 --no-recreate databases tools
+####################################################
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .docker_api import DockerAPI, DockerError, stack_members
+from .stacks import compose_command
+from .volbackup import format_size
+
+
+_COMPOSE_SERVICE = "com.docker.compose.service"
+
+
+def find_stacks(containers_dir):
+    """Directorios con docker-compose.yml, como el bucle de update_system"""
+    stacks = []
+    try:
+        names = sorted(os.listdir(containers_dir))
+    except FileNotFoundError:
+        return stacks           # todavía no se creó ningún contenedor
+    for name in names:
+        if os.path.isfile(os.path.join(containers_dir, name, "docker-compose.yml")):
+            stacks.append(name)
+    return stacks
+
+
+def compose_images(workdir):
+    """{servicio: imagen} de un stack (los que solo tienen build no cuentan)"""
+    result = subprocess.run(
+        compose_command() + ["config", "--format", "json"],
+        cwd=workdir, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise DockerError(lines[-1] if lines else f"docker-compose config salió con {result.returncode}")
+    services = json.loads(result.stdout).get("services", {})
+    return {name: spec["image"] for name, spec in services.items()
+            if spec.get("image") and not spec.get("build")}
+
+
+def pull_image(api, image):
+    """Descarga una imagen y devuelve los bytes bajados"""
+    layers = {}
+    try:
+        for progress in api.pull(image):
+            detail = progress.get("progressDetail") or {}
+            # Solo las capas que se descargan de verdad ("Already exists" no)
+            if progress.get("status") == "Downloading" and detail.get("total"):
+                layers[progress["id"]] = detail["total"]
+    except DockerError:
+        # Registros privados: el cliente docker sabe sus credenciales
+        result = subprocess.run(["docker", "pull", "--quiet", image],
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            raise DockerError(result.stderr.strip() or f"docker pull {image} falló") from None
+    return sum(layers.values())
+
+
+def stale_services(members, services, image_ids):
+    """Servicios que corren con una imagen distinta de la recién descargada"""
+    stale = set()
+    for container in members:
+        service = (container.get("Labels") or {}).get(_COMPOSE_SERVICE)
+        if container["State"] != "running" or service not in services:
+            continue
+        latest = image_ids.get(services[service])
+        if latest is not None and latest != container["ImageID"]:
+            stale.add(service)
+    return sorted(stale)
+
+
+class ImageUpdater:
+    def __init__(self, containers_dir, stacks=None, jobs=4, api=None):
+        self.containers_dir = os.path.expanduser(containers_dir)
+        # None = todos; una lista vacía es que no hay nada que actualizar
+        self.stacks = find_stacks(self.containers_dir) if stacks is None else list(stacks)
+        self.jobs = jobs
+        self.api = api or DockerAPI()
+        self.errors = []
+
+    def run(self, recreate=True, report=print):
+        if not self.stacks:
+            return 0, {}
+        images = {}             # stack -> {servicio: imagen}
+        for stack in self.stacks:
+            try:
+                images[stack] = compose_images(os.path.join(self.containers_dir, stack))
+            except (DockerError, OSError, ValueError) as e:
+                self.errors.append(f"{stack}: {e}")
+        unique = sorted({image for services in images.values() for image in services.values()})
+        before = {image: self.api.image_id(image) for image in unique}
+
+        # Cada descarga va por su propia conexión: el tope es de descargas, no de hilos
+        pulled = {}
+        with ThreadPoolExecutor(self.jobs) as pool:
+            futures = {image: pool.submit(pull_image, self.api, image) for image in unique}
+            for image, future in futures.items():
+                try:
+                    pulled[image] = future.result()
+                except DockerError as e:
+                    self.errors.append(f"{image}: {e}")
+        after = {image: self.api.image_id(image) for image in pulled}
+        for image in pulled:
+            state = "actualizada" if before[image] != after[image] else "sin cambios"
+            size = f" ({format_size(pulled[image])})" if pulled[image] else ""
+            report(f"  {'🆕' if state == 'actualizada' else '✅'} {image}: {state}{size}")
+
+        recreated = {}
+        if recreate:
+            containers = self.api.containers()
+            for stack, services in images.items():
+                workdir = os.path.join(self.containers_dir, stack)
+                stale = stale_services(stack_members(containers, stack, workdir), services, after)
+                if not stale:
+                    continue
+                result = subprocess.run(
+                    compose_command() + ["up", "-d", "--no-deps"] + stale,
+                    cwd=workdir, capture_output=True, text=True,
+                )
+                if result.returncode == 0:
+                    recreated[stack] = stale
+                    report(f"  🔄 {stack}: recreados {', '.join(stale)}")
+                else:
+                    self.errors.append(f"{stack}: no se pudo recrear {', '.join(stale)}")
+        return sum(pulled.values()), recreated
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Actualizar imágenes de los stacks en paralelo")
+    parser.add_argument("stacks", nargs="*", help="por defecto, todos los de --containers-dir")
+    parser.add_argument("--containers-dir",
+                        default=os.environ.get("DEV_CONTAINERS", "~/Development/containers"))
+    parser.add_argument("--jobs", type=int, default=4, help="descargas simultáneas")
+    parser.add_argument("--no-recreate", action="store_true",
+                        help="solo descargar, sin recrear los servicios que corren")
+    args = parser.parse_args(argv)
+
+    updater = ImageUpdater(args.containers_dir, args.stacks or None, args.jobs)
+    started = time.monotonic()
+    try:
+        total, recreated = updater.run(recreate=not args.no_recreate)
+    except DockerError as e:
+        print(f"images: {e}", file=sys.stderr)
+        return 1
+    finally:
+        updater.api.close()
+    services = sum(len(s) for s in recreated.values())
+    print(f"  {format_size(total)} descargados, {services} servicios recreados, "
+          f"{time.monotonic() - started:.1f}s")
+    for error in updater.errors:
+        print(f"images: {error}", file=sys.stderr)
+    return 1 if updater.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
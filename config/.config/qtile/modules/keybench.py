@@ -0,0 +1,371 @@
+####################################################
+# Latencia de atajos: de la pulsación a la ventana
+#
+# No había forma de saber cuánto tardan mod+Return,
+# mod+alt+d o mod+alt+Tab desde que se pulsa la tecla
+# hasta que qtile gestiona la ventana, ni de ver si un
+# cambio en la configuración lo empeora.
+#
+# Aquí se levanta un Xvfb, se carga config.py o
+# config_developer.py en qtile (con una configuración
+# envoltorio que no ejecuta el autostart) y se pulsa,
+# con simulate_keypress por IPC, cada Key que lanza un
+# programa. Los programas se sustituyen en el PATH por
+# un stub que solo abre una ventana, así que los números
+# no dependen de lo que tarde alacritty o rofi en
+# arrancar: miden el camino de qtile (lazy.spawn o
+# modules/spawner.py), el exec y el manage.
+#
+# El reloj es CLOCK_MONOTONIC en los dos procesos: la
+# marca se toma antes de enviar la tecla y el hook
+# client_managed de qtile apunta cuándo llegó la
+# ventana. También se mide el viaje de ida y vuelta del
+# IPC, que va incluido en cada muestra.
+#
+# Se omiten los KeyChord, los comandos por shell (sh -c)
+# y los que usan una ruta absoluta, que no se pueden
+# sustituir por el stub.
+#
+# Uso (necesita qtile, Xvfb y xcffib, lo mismo que la sesión):
+#     cd ~/.config/qtile && python3 -m modules.keybench config.py --runs 30 -o bench.json
+#     python3 -m modules.keybench config_developer.py --baseline bench.json
+#
+# Con --baseline sale con 1 si el p95 de algún atajo
+# supera el de la referencia por más de --threshold.
+####################################################
+
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+QTILE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SHELLS = {"sh", "bash", "dash", "zsh", "fish"}
+
+
+# Configuración que carga qtile: ejecuta la configuración real en su
+# propio espacio de nombres y añade lo que necesita la medición
+WRAPPER = '''\
+# Generado por modules/keybench.py
+import json, os, shlex, sys, time
+sys.path.insert(0, {qtile_dir!r})
+__file__ = {target!r}
+exec(compile(open(__file__).read(), __file__, "exec"))
+
+from libqtile import hook as _kb_hook, qtile as _kb_qtile
+from libqtile.config import Key as _KbKey
+
+# Sin autostart: arrancaría la sesión entera dentro del Xvfb
+# (las suscripciones van por registro: {{"qtile": {{"startup_once": [...]}}}})
+_kb_autostart = [f.__name__ for f in _kb_hook.subscriptions.get("qtile", {{}}).pop("startup_once", [])]
+_KB_DIR = {workdir!r}
+
+
+def _kb_argv(call):
+    if call.name == "spawn":
+        command = call.args[0]
+        return shlex.split(command) if isinstance(command, str) else list(command)
+    if call.name == "function" and getattr(call.args[0], "__module__", None) == "modules.spawner":
+        return list(call.args[1])
+    return None
+
+
+def _kb_keys():
+    found = []
+    for key in keys:
+        if not isinstance(key, _KbKey) or len(key.commands) != 1:
+            continue
+        argv = _kb_argv(key.commands[0])
+        if argv:
+            found.append(dict(modifiers=list(key.modifiers), key=key.key, argv=argv))
+    return found
+
+
+@_kb_hook.subscribe.startup_complete
+def _kb_ready():
+    found = _kb_keys()
+    stub = os.path.join(_KB_DIR, "stub.py")
+    for entry in found:
+        name = entry["argv"][0]
+        link = os.path.join(_KB_DIR, "bin", name)
+        if "/" not in name and name not in {shells!r} and not os.path.lexists(link):
+            os.symlink(stub, link)
+    # El ayudante de spawner ya tenía el PATH en caché sin los stubs
+    spawner = sys.modules.get("modules.spawner")
+    if spawner is not None:
+        spawner.spawner.stop()
+        spawner.spawner.start()
+    # Lo que siga suscrito a startup_once ya se ejecutó: el arnés aborta
+    left = [f.__name__ for f in _kb_hook.subscriptions.get("qtile", {{}}).get("startup_once", [])]
+    with open(os.path.join(_KB_DIR, "keys.json"), "w") as f:
+        json.dump(dict(keys=found, autostart_removed=_kb_autostart, autostart_left=left), f)
+
+
+@_kb_hook.subscribe.client_managed
+def _kb_managed(client):
+    wm_class = client.get_wm_class() or []
+    with open(os.path.join(_KB_DIR, "managed.log"), "a") as f:
+        f.write(f"{{time.monotonic()}}\\t{{json.dumps(wm_class)}}\\n")
+    # Solo los stubs: otra ventana es un error de la medición y se reporta
+    if "keybench" in wm_class:
+        _kb_qtile.call_soon(client.kill)
+'''
+
+# Stub: una ventana con WM_CLASS = nombre del programa, hasta que qtile la cierre
+STUB = '''\
+#!{python}
+import os, sys
+import xcffib, xcffib.xproto as xp
+conn = xcffib.connect()
+screen = conn.get_setup().roots[conn.pref_screen]
+wid = conn.generate_id()
+conn.core.CreateWindow(screen.root_depth, wid, screen.root, 0, 0, 320, 200, 0,
+                       xp.WindowClass.InputOutput, screen.root_visual, 0, [])
+name = os.path.basename(sys.argv[0]).encode()
+wm_class = name + b"\\0keybench\\0"
+conn.core.ChangeProperty(xp.PropMode.Replace, wid, xp.Atom.WM_CLASS, xp.Atom.STRING,
+                         8, len(wm_class), wm_class)
+conn.core.MapWindow(wid)
+conn.flush()
+try:
+    while True:
+        conn.wait_for_event()
+except Exception:
+    pass
+'''
+
+
+def percentile(samples, p):
+    """Rango más cercano, como lo cuentan las herramientas de latencia"""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def summarize(samples):
+    if not samples:
+        return {"samples": 0}
+    return {"samples": len(samples),
+            **{f"p{p}_ms": round(percentile(samples, p) * 1000, 3) for p in (50, 95, 99)},
+            "max_ms": round(max(samples) * 1000, 3)}
+
+
+def key_name(entry):
+    return "+".join(entry["modifiers"] + [entry["key"]])
+
+
+def skip_reason(entry):
+    name = entry["argv"][0]
+    if name in SHELLS:
+        return "comando por shell"
+    if "/" in name:
+        return "ruta absoluta"
+    return None
+
+
+class Session:
+    """Xvfb + qtile con la configuración envoltorio"""
+
+    def __init__(self, config, qtile_cmd="qtile", timeout=20):
+        self.config = os.path.abspath(os.path.join(QTILE_DIR, config))
+        self.qtile_cmd = qtile_cmd
+        self.timeout = timeout
+        self.workdir = tempfile.mkdtemp(prefix="keybench-")
+        self.socket = os.path.join(self.workdir, "qtile.sock")
+        self.xvfb = self.qtile = self.client = None
+        self.autostart_removed = []
+
+    def _wait_for(self, path, proc):
+        deadline = time.monotonic() + self.timeout
+        while not os.path.exists(path):
+            if proc.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError(f"qtile no arrancó (ver {self.workdir}/qtile.log)")
+            time.sleep(0.05)
+
+    def start(self):
+        os.mkdir(os.path.join(self.workdir, "bin"))
+        with open(os.path.join(self.workdir, "stub.py"), "w") as f:
+            f.write(STUB.format(python=sys.executable))
+        os.chmod(os.path.join(self.workdir, "stub.py"), 0o755)
+        wrapper = os.path.join(self.workdir, "config.py")
+        with open(wrapper, "w") as f:
+            f.write(WRAPPER.format(qtile_dir=QTILE_DIR, target=self.config,
+                                   workdir=self.workdir, shells=SHELLS))
+
+        # -displayfd: Xvfb elige un display libre y lo escribe cuando está listo
+        read_fd, write_fd = os.pipe()
+        self.xvfb = subprocess.Popen(
+            ["Xvfb", "-displayfd", str(write_fd), "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+            pass_fds=(write_fd,), stderr=subprocess.DEVNULL,
+        )
+        os.close(write_fd)
+        with os.fdopen(read_fd) as f:
+            display = f.readline().strip()
+        if not display:
+            raise RuntimeError("Xvfb no arrancó")
+
+        env = dict(os.environ, DISPLAY=f":{display}",
+                   PATH=os.path.join(self.workdir, "bin") + os.pathsep + os.environ.get("PATH", ""))
+        env.pop("WAYLAND_DISPLAY", None)
+        with open(os.path.join(self.workdir, "qtile.log"), "w") as log:
+            self.qtile = subprocess.Popen(
+                [self.qtile_cmd, "start", "-b", "x11", "-c", wrapper, "-s", self.socket],
+                env=env, stdout=log, stderr=subprocess.STDOUT,
+            )
+        self._wait_for(os.path.join(self.workdir, "keys.json"), self.qtile)
+
+        from libqtile.command.client import InteractiveCommandClient
+        from libqtile.command.interface import IPCCommandInterface
+        from libqtile.ipc import Client
+        self.client = InteractiveCommandClient(IPCCommandInterface(Client(self.socket)))
+        with open(os.path.join(self.workdir, "keys.json")) as f:
+            loaded = json.load(f)
+        if loaded["autostart_left"]:
+            raise RuntimeError("el autostart sigue suscrito a startup_once: "
+                               + ", ".join(loaded["autostart_left"]))
+        self.autostart_removed = loaded["autostart_removed"]
+        return loaded["keys"]
+
+    def managed_since(self, offset):
+        """Ventanas gestionadas desde offset: [(t, wm_class)], nuevo offset"""
+        try:
+            with open(os.path.join(self.workdir, "managed.log"), "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return [], offset
+        complete = data[:data.rfind(b"\n") + 1]
+        events = []
+        for line in complete.decode().splitlines():
+            stamp, wm_class = line.split("\t", 1)
+            events.append((float(stamp), json.loads(wm_class)))
+        return events, offset + len(complete)
+
+    def stop(self):
+        if self.client is not None:
+            try:
+                self.client.shutdown()
+            except Exception:
+                pass
+        for proc in (self.qtile, self.xvfb):
+            if proc is not None and proc.poll() is None:
+                proc.terminate()
+                try:
+                    proc.wait(5)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+def measure(session, entry, runs, gap, timeout, offset):
+    """Pulsa el atajo runs veces; latencias en segundos y cuántas no llegaron"""
+    samples, missed = [], 0
+    stub = os.path.basename(entry["argv"][0])
+    for _ in range(runs):
+        started = time.monotonic()
+        session.client.simulate_keypress(entry["modifiers"], entry["key"])
+        deadline = started + timeout
+        arrived = None
+        while arrived is None and time.monotonic() < deadline:
+            events, offset = session.managed_since(offset)
+            arrived = next((t for t, wm_class in events if stub in wm_class), None)
+            if arrived is None:
+                time.sleep(0.001)
+        if arrived is None:
+            missed += 1
+        else:
+            samples.append(arrived - started)
+        time.sleep(gap)         # que qtile cierre el stub antes de la siguiente
+    return samples, missed, offset
+
+
+def ipc_roundtrip(session, runs):
+    samples = []
+    for _ in range(runs):
+        started = time.monotonic()
+        session.client.status()
+        samples.append(time.monotonic() - started)
+    return summarize(samples)
+
+
+def regressions(report, baseline, threshold):
+    previous = {k["key"]: k for k in baseline.get("keys", [])}
+    found = []
+    for entry in report["keys"]:
+        old = previous.get(entry["key"])
+        if old and old.get("p95_ms") and entry.get("p95_ms") and \
+                entry["p95_ms"] > old["p95_ms"] * threshold:
+            found.append(f"{entry['key']}: p95 {old['p95_ms']} -> {entry['p95_ms']} ms")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latencia de atajos de qtile bajo Xvfb")
+    parser.add_argument("config", nargs="?", default="config.py",
+                        help="relativo a ~/.config/qtile (config.py o config_developer.py)")
+    parser.add_argument("--runs", type=int, default=20, help="pulsaciones por atajo")
+    parser.add_argument("--gap", type=float, default=0.05, help="pausa entre pulsaciones (s)")
+    parser.add_argument("--timeout", type=float, default=3.0, help="espera máxima por ventana (s)")
+    parser.add_argument("--key", action="append", help="solo estos atajos, p. ej. mod4+Return")
+    parser.add_argument("--qtile", default="qtile", help="ejecutable de qtile")
+    parser.add_argument("-o", "--output", help="escribir el JSON aquí en vez de en la salida")
+    parser.add_argument("--baseline", help="JSON de una medición anterior para comparar")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="regresión si p95 > referencia × esto (por defecto 1.2)")
+    args = parser.parse_args(argv)
+
+    session = Session(args.config, args.qtile)
+    try:
+        entries = session.start()
+        report = {"config": args.config, "runs": args.runs,
+                  "autostart_removed": session.autostart_removed,
+                  "ipc": ipc_roundtrip(session, args.runs), "keys": [], "skipped": []}
+        # Antes de pulsar nada no debería haber aparecido ninguna ventana
+        events, offset = session.managed_since(0)
+        report["unexpected_windows"] = [wm_class for _, wm_class in events]
+        if events:
+            print(f"keybench: ventanas que no abrió ningún atajo: {report['unexpected_windows']}",
+                  file=sys.stderr)
+        for entry in entries:
+            name = key_name(entry)
+            if args.key and name not in args.key:
+                continue
+            reason = skip_reason(entry)
+            if reason:
+                report["skipped"].append({"key": name, "argv": entry["argv"], "reason": reason})
+                continue
+            samples, missed, offset = measure(session, entry, args.runs, args.gap,
+                                              args.timeout, offset)
+            report["keys"].append({"key": name, "argv": entry["argv"], "missed": missed,
+                                   **summarize(samples)})
+            print(f"keybench: {name:28} {report['keys'][-1].get('p50_ms', '-')} ms p50",
+                  file=sys.stderr)
+    except (RuntimeError, OSError) as e:
+        print(f"keybench: {e}", file=sys.stderr)
+        return 1
+    finally:
+        session.stop()
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(report, json.load(f), args.threshold)
+        for line in found:
+            print(f"keybench: regresión {line}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
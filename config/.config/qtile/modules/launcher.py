@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+####################################################
+# Índice del lanzador de aplicaciones (rofi drun)
+#
+# open_launcher(), mod+alt+d (config.py) y mod+r
+# (config_developer.py) abrían "rofi -show drun", y rofi
+# volvía a leer y parsear todos los .desktop (y flatpaks)
+# en cada apertura, siempre en el mismo orden.
+#
+# Aquí un demonio parsea los .desktop una vez, vigila
+# los directorios de aplicaciones con inotify (solo se
+# vuelve a leer el archivo que cambió) y tiene la lista
+# para rofi ya armada en memoria, ordenada por frecencia:
+# cada lanzamiento suma 1 a la puntuación de la app, que
+# se va dividiendo a la mitad cada HALF_LIFE. Rofi lo usa
+# en modo script: cada apertura es copiar esa lista por
+# un socket, tarde lo que tarde el escaneo.
+#
+# El demonio se arranca solo la primera vez que rofi lo
+# pide (y las configuraciones lo arrancan al iniciar
+# qtile); si no responde, esa vez se escanea aquí mismo.
+#
+# Uso:
+#     rofi -show apps -modi "apps:~/.config/qtile/modules/launcher.py rofi"
+#     (desde la configuración: spawn(launcher.rofi_command(...)))
+#     cd ~/.config/qtile && python3 -m modules.launcher serve
+#     python3 -m modules.launcher list [--json]
+#     python3 -m modules.launcher launch firefox.desktop
+####################################################
+
+import argparse
+import json
+import os
+import select
+import shlex
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+if __package__:
+    from . import inotify
+else:
+    # rofi lo ejecuta por ruta, fuera del paquete
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from modules import inotify
+
+
+SOCKET_PATH = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(),
+                           "qtile-launcher.sock")
+FRECENCY_FILE = "~/.local/share/qtile/launcher-frecency.json"
+HALF_LIFE = 7 * 86400
+# Cada cuánto mirar si apareció un directorio que no existía (flatpak recién instalado)
+RECHECK_INTERVAL = 60
+DEBOUNCE = 0.3
+
+# Códigos de Exec que no se rellenan al lanzar sin archivos
+_FIELD_CODES = ("%f", "%F", "%u", "%U", "%d", "%D", "%n", "%N", "%v", "%m")
+
+
+def application_dirs():
+    """Directorios de .desktop, el de más prioridad primero (spec XDG)"""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    data_dirs = (os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share").split(":")
+    dirs = [data_home] + [d for d in data_dirs if d]
+    # Flatpak suele estar en XDG_DATA_DIRS, pero no siempre (sesiones sin su perfil)
+    dirs += [os.path.join(data_home, "flatpak/exports/share"), "/var/lib/flatpak/exports/share"]
+    seen = []
+    for directory in dirs:
+        path = os.path.join(os.path.normpath(directory), "applications")
+        if path not in seen:
+            seen.append(path)
+    return seen
+
+
+####################################################
+# Entradas .desktop
+
+def _locale_keys(key):
+    lang = (os.environ.get("LC_MESSAGES") or os.environ.get("LANG") or "").split(".")[0]
+    keys = []
+    if lang and lang not in ("C", "POSIX"):
+        keys.append(f"{key}[{lang}]")
+        if "_" in lang:
+            keys.append(f"{key}[{lang.split('_')[0]}]")
+    return keys + [key]
+
+
+def parse_desktop(path):
+    """Campos de [Desktop Entry]; None si no es una app que se muestre"""
+    fields = {}
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            section = None
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("["):
+                    if section == "Desktop Entry":
+                        break           # las [Desktop Action ...] no interesan
+                    section = line[1:-1]
+                    continue
+                if section == "Desktop Entry" and "=" in line:
+                    key, value = line.split("=", 1)
+                    fields[key.strip()] = value.strip()
+    except OSError:
+        return None
+    if fields.get("Type", "Application") != "Application" or not fields.get("Exec"):
+        return None
+    if fields.get("NoDisplay") == "true" or fields.get("Hidden") == "true":
+        return None
+    desktops = set(filter(None, os.environ.get("XDG_CURRENT_DESKTOP", "").split(":")))
+    only = set(filter(None, fields.get("OnlyShowIn", "").split(";")))
+    hidden_in = set(filter(None, fields.get("NotShowIn", "").split(";")))
+    if (only and not only & desktops) or hidden_in & desktops:
+        return None
+
+    def get(key):
+        return next((fields[k] for k in _locale_keys(key) if k in fields), "")
+
+    return {
+        "name": get("Name"),
+        "generic": get("GenericName"),
+        "keywords": get("Keywords").replace(";", " ").strip(),
+        "icon": fields.get("Icon", ""),
+        "exec": fields["Exec"],
+        "terminal": fields.get("Terminal") == "true",
+        "path": fields.get("Path") or None,
+        "tryexec": fields.get("TryExec") or None,
+    }
+
+
+def exec_argv(entry, desktop_file):
+    """Exec sin los códigos de campo, como lo lanzaría rofi sin archivos"""
+    argv = []
+    for token in shlex.split(entry["exec"]):
+        if token in _FIELD_CODES:
+            continue
+        if token == "%i":
+            if entry["icon"]:
+                argv += ["--icon", entry["icon"]]
+            continue
+        token = token.replace("%c", entry["name"]).replace("%k", desktop_file)
+        for code in _FIELD_CODES:
+            token = token.replace(code, "")
+        argv.append(token.replace("%%", "%"))
+    if entry["terminal"]:
+        argv = [os.environ.get("TERMINAL", "alacritty"), "-e"] + argv
+    return argv
+
+
+####################################################
+# Frecencia
+
+class Frecency:
+
+    def __init__(self, path=FRECENCY_FILE):
+        self.path = os.path.expanduser(path)
+        try:
+            with open(self.path) as f:
+                self.scores = json.load(f)      # id -> [puntuación, último uso]
+        except (OSError, ValueError):
+            self.scores = {}
+
+    def score(self, desktop_id, now):
+        value = self.scores.get(desktop_id)
+        if value is None:
+            return 0.0
+        score, last = value
+        return score * 0.5 ** ((now - last) / HALF_LIFE)
+
+    def bump(self, desktop_id):
+        now = time.time()
+        self.scores[desktop_id] = [self.score(desktop_id, now) + 1, now]
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}"
+        with open(tmp, "w") as f:
+            json.dump(self.scores, f)
+        os.replace(tmp, self.path)
+
+
+####################################################
+# Índice
+
+class DesktopIndex:
+
+    def __init__(self, dirs=None, frecency=None):
+        self.dirs = dirs or application_dirs()
+        self.frecency = frecency or Frecency()
+        self.files = {}         # ruta -> (id, entrada o None)
+        self._rendered = None
+
+    def _desktop_id(self, path):
+        for directory in self.dirs:
+            if path.startswith(directory + os.sep):
+                return os.path.relpath(path, directory).replace(os.sep, "-")
+        return os.path.basename(path)
+
+    def update(self, path):
+        """Vuelve a leer un .desktop (o lo olvida si ya no está)"""
+        if not path.endswith(".desktop"):
+            return
+        if os.path.isfile(path):
+            self.files[path] = (self._desktop_id(path), parse_desktop(path))
+        else:
+            self.files.pop(path, None)
+        self._rendered = None
+
+    def scan_dir(self, top):
+        for dirpath, _, filenames in os.walk(top):
+            for filename in filenames:
+                self.update(os.path.join(dirpath, filename))
+
+    def scan(self):
+        self.files = {}
+        for directory in self.dirs:
+            self.scan_dir(directory)
+
+    def entries(self):
+        """[(id, ruta, entrada)] por frecencia y nombre; el primer directorio gana"""
+        rank = {directory: i for i, directory in enumerate(self.dirs)}
+        best = {}
+        for path, (desktop_id, entry) in self.files.items():
+            priority = min((rank[d] for d in self.dirs if path.startswith(d + os.sep)),
+                           default=len(self.dirs))
+            if desktop_id not in best or priority < best[desktop_id][0]:
+                best[desktop_id] = (priority, path, entry)
+        now = time.time()
+        result = []
+        for desktop_id, (_, path, entry) in best.items():
+            # Una entrada oculta en un directorio de más prioridad tapa a las demás
+            if entry is None:
+                continue
+            if entry["tryexec"] and not _executable(entry["tryexec"]):
+                continue
+            result.append((desktop_id, path, entry))
+        result.sort(key=lambda e: (-self.frecency.score(e[0], now), e[2]["name"].lower()))
+        return result
+
+    def rofi_lines(self):
+        """Salida para el modo script de rofi, armada una vez por cambio"""
+        if self._rendered is None:
+            lines = ["\0prompt\x1fapps", "\0no-custom\x1ftrue"]
+            for desktop_id, _, entry in self.entries():
+                meta = f"{entry['generic']} {entry['keywords']}".strip()
+                lines.append(f"{entry['name']}\0icon\x1f{entry['icon']}\x1finfo\x1f{desktop_id}"
+                             f"\x1fmeta\x1f{meta}")
+            self._rendered = ("\n".join(lines) + "\n").encode()
+        return self._rendered
+
+    def launch(self, desktop_id):
+        for found_id, path, entry in self.entries():
+            if found_id == desktop_id:
+                cwd = entry["path"] or os.path.expanduser("~")
+                subprocess.Popen(exec_argv(entry, path), cwd=cwd, start_new_session=True,
+                                 stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
+                self.frecency.bump(desktop_id)
+                self._rendered = None
+                return True
+        return False
+
+
+def _executable(name):
+    if "/" in name:
+        return os.access(name, os.X_OK)
+    return any(os.access(os.path.join(d, name), os.X_OK)
+               for d in os.environ.get("PATH", "").split(os.pathsep) if d)
+
+
+####################################################
+# Demonio
+
+class LauncherDaemon:
+
+    def __init__(self, index, socket_path=SOCKET_PATH):
+        self.index = index
+        self.socket_path = socket_path
+        self._ino = None
+        self._watches = {}          # wd -> directorio
+        self._missing = []
+
+    def _bind(self):
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.socket_path)
+        except OSError:
+            # ¿Otro demonio vivo o un socket abandonado?
+            if request("ping", self.socket_path) is not None:
+                server.close()
+                return None
+            os.unlink(self.socket_path)
+            server.bind(self.socket_path)
+        server.listen(8)
+        return server
+
+    def _watch_tree(self, top):
+        for dirpath, _, _ in os.walk(top):
+            try:
+                wd = self._ino.add_watch(dirpath, inotify.IN_CHANGES | inotify.IN_ATTRIB
+                                         | inotify.IN_ONLYDIR)
+            except OSError:
+                continue
+            self._watches[wd] = dirpath
+
+    def _watch_dirs(self):
+        self._missing = []
+        for directory in self.index.dirs:
+            if os.path.isdir(directory):
+                self._watch_tree(directory)
+            else:
+                self._missing.append(directory)
+
+    def _recheck_missing(self):
+        for directory in list(self._missing):
+            if os.path.isdir(directory):
+                self._missing.remove(directory)
+                self._watch_tree(directory)
+                self.index.scan_dir(directory)
+
+    def _handle_events(self):
+        changed = set()
+        for wd, mask, name in self._ino.read():
+            if mask & inotify.IN_Q_OVERFLOW:
+                return None         # se perdieron eventos: escanear todo
+            if mask & inotify.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            path = os.path.join(directory, name)
+            if mask & inotify.IN_ISDIR:
+                if mask & (inotify.IN_CREATE | inotify.IN_MOVED_TO):
+                    self._watch_tree(path)
+                    self.index.scan_dir(path)
+                elif mask & (inotify.IN_DELETE | inotify.IN_MOVED_FROM):
+                    for known in [p for p in self.index.files if p.startswith(path + os.sep)]:
+                        changed.add(known)
+                continue
+            changed.add(path)
+        return changed
+
+    def _serve_client(self, conn):
+        with conn:
+            conn.settimeout(2)
+            try:
+                line = conn.makefile("rb").readline().decode().strip()
+            except (OSError, UnicodeDecodeError):
+                return
+            command, _, argument = line.partition(" ")
+            if command == "list":
+                reply = self.index.rofi_lines()
+            elif command == "launch":
+                reply = b"ok\n" if self.index.launch(argument) else b"unknown\n"
+            elif command == "ping":
+                reply = b"pong\n"
+            else:
+                reply = b"?\n"
+            try:
+                conn.sendall(reply)
+            except OSError:
+                pass
+
+    def run(self):
+        server = self._bind()
+        if server is None:
+            return 0
+        # Para que el finally borre el socket también con kill/pkill
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            self._ino = inotify.Inotify()
+        except OSError as e:
+            print(f"launcher: inotify no disponible: {e}", file=sys.stderr)
+        self.index.scan()
+        if self._ino is not None:
+            self._watch_dirs()
+        self.index.rofi_lines()
+
+        pending = set()
+        deadline = None
+        last_recheck = time.monotonic()
+        try:
+            while True:
+                timeout = RECHECK_INTERVAL if deadline is None else max(0.0, deadline - time.monotonic())
+                ready, _, _ = select.select([server] + ([self._ino] if self._ino else []),
+                                            [], [], timeout)
+                if server in ready:
+                    conn, _ = server.accept()
+                    self._serve_client(conn)
+                if self._ino is not None and self._ino in ready:
+                    changed = self._handle_events()
+                    if changed is None:
+                        self.index.scan()
+                    else:
+                        pending |= changed
+                    # Esperar a que termine la ráfaga (apt, flatpak install...)
+                    deadline = time.monotonic() + DEBOUNCE
+                if deadline is not None and time.monotonic() >= deadline:
+                    for path in pending:
+                        self.index.update(path)
+                    pending.clear()
+                    deadline = None
+                    self.index.rofi_lines()
+                if time.monotonic() - last_recheck >= RECHECK_INTERVAL:
+                    self._recheck_missing()
+                    last_recheck = time.monotonic()
+        finally:
+            server.close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+
+####################################################
+# Cliente
+
+def request(line, socket_path=SOCKET_PATH, timeout=2):
+    """Respuesta del demonio; None si no hay demonio"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(timeout)
+            conn.connect(socket_path)
+            conn.sendall(line.encode() + b"\n")
+            chunks = []
+            while True:
+                chunk = conn.recv(256 * 1024)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            return b"".join(chunks)
+    except OSError:
+        return None
+
+
+def ensure_daemon():
+    """Arranca el demonio en segundo plano si no está respondiendo"""
+    if request("ping") is not None:
+        return
+    here = os.path.dirname(os.path.abspath(__file__))
+    subprocess.Popen([sys.executable, "-m", "modules.launcher", "serve"],
+                     cwd=os.path.dirname(here), start_new_session=True,
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+
+
+def rofi_command(*rofi_args):
+    """argv de rofi con el lanzador en modo script (para spawn())"""
+    script = f"{shlex.quote(sys.executable)} {shlex.quote(os.path.abspath(__file__))} rofi"
+    return ["rofi", *rofi_args, "-modi", f"apps:{script}", "-show", "apps"]
+
+
+def rofi_mode():
+    """Un paso del modo script: listar o lanzar lo elegido"""
+    if os.environ.get("ROFI_RETV", "0") == "1":
+        desktop_id = os.environ.get("ROFI_INFO", "")
+        if request(f"launch {desktop_id}") is None:
+            index = DesktopIndex()
+            index.scan()
+            index.launch(desktop_id)
+        return 0
+    output = request("list")
+    if output is None:
+        ensure_daemon()
+        index = DesktopIndex()
+        index.scan()
+        output = index.rofi_lines()
+    sys.stdout.buffer.write(output)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Índice de aplicaciones para rofi")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("serve", help="demonio con el índice en memoria")
+    sub.add_parser("rofi", help="modo script de rofi (lo llama rofi)")
+    p = sub.add_parser("list")
+    p.add_argument("--json", action="store_true")
+    p = sub.add_parser("launch")
+    p.add_argument("desktop_id")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        return LauncherDaemon(DesktopIndex()).run()
+    if args.command == "rofi":
+        return rofi_mode()
+    index = DesktopIndex()
+    index.scan()
+    if args.command == "launch":
+        if request(f"launch {args.desktop_id}") == b"ok\n" or index.launch(args.desktop_id):
+            return 0
+        print(f"launcher: {args.desktop_id} no encontrado", file=sys.stderr)
+        return 1
+    now = time.time()
+    entries = index.entries()
+    if args.json:
+        print(json.dumps([dict(entry, id=desktop_id, file=path,
+                               frecency=round(index.frecency.score(desktop_id, now), 3))
+                          for desktop_id, path, entry in entries], indent=2, ensure_ascii=False))
+    else:
+        for desktop_id, _, entry in entries:
+            print(f"{index.frecency.score(desktop_id, now):6.2f}  {entry['name']:32} {desktop_id}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+####################################################
+# Perfil de tiempos de carga de la configuración
+#
+# Opcional: se activa con QTILE_PROFILE=1 en el entorno
+# de la sesión o creando ~/.config/qtile/profile.conf
+# (sirve para activarlo sin cerrar sesión, el siguiente
+# reload ya queda medido).
+#
+# La configuración llama a mark("fase") al terminar
+# cada fase; el tiempo desde la marca anterior se suma
+# a esa fase. Al final report() escribe el desglose en
+# ~/.config/qtile/startup_profile.log, al lado de
+# startup.log, y avisa de las fases que superan su
+# presupuesto.
+#
+# Las barras no se construyen al cargar la configuración
+# sino cuando cada pantalla recibe una salida (ver
+# modules/screens.py), después de report(): "widgets" y
+# "screens" solo miden las declaraciones. LazyScreen
+# mide cada barra (widgets, decodificar las imágenes...)
+# y la añade al log con bar() como fase "bars".
+#
+# profile.conf (milisegundos, todas las líneas opcionales):
+#     default = 50
+#     bars = 150
+####################################################
+
+import os
+import time
+from datetime import datetime
+
+from libqtile.log_utils import logger
+
+
+QTILE_DIR = os.path.expanduser("~/.config/qtile")
+PROFILE_CONF = os.path.join(QTILE_DIR, "profile.conf")
+PROFILE_LOG = os.path.join(QTILE_DIR, "startup_profile.log")
+
+PHASES = ("imports", "keys", "groups", "layouts", "widgets", "screens", "hooks")
+DEFAULT_BUDGET_MS = 50.0
+
+
+def _read_budgets():
+    budgets = {"default": DEFAULT_BUDGET_MS}
+    try:
+        with open(PROFILE_CONF) as conf:
+            for line in conf:
+                line = line.split("#", 1)[0].strip()
+                if "=" not in line:
+                    continue
+                phase, value = (part.strip() for part in line.split("=", 1))
+                try:
+                    budgets[phase] = float(value)
+                except ValueError:
+                    logger.warning("profile.conf: valor inválido para %s: %s", phase, value)
+    except FileNotFoundError:
+        pass
+    return budgets
+
+
+class StartupProfiler:
+    """Acumula el tiempo de cada fase de la carga de la configuración"""
+
+    def __init__(self, name, started):
+        self.name = name
+        self.last = started
+        self.started = started
+        self.phases = {}
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self.last)
+        self.last = now
+
+    def _over_budget(self, phase, ms, budgets):
+        budget = budgets.get(phase, budgets["default"])
+        if ms > budget:
+            return f"  ⚠ supera el presupuesto ({budget:.0f} ms)"
+        return ""
+
+    def report(self):
+        budgets = _read_budgets()
+        total = (time.perf_counter() - self.started) * 1000
+        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        lines = [f"=== Perfil de carga: {self.name} ({stamp}) ==="]
+        over = []
+        ordered = [p for p in PHASES if p in self.phases]
+        ordered += [p for p in self.phases if p not in PHASES]
+        for phase in ordered:
+            ms = self.phases[phase] * 1000
+            flag = self._over_budget(phase, ms, budgets)
+            if flag:
+                over.append(phase)
+            lines.append(f"{phase:<10} {ms:9.2f} ms{flag}")
+        lines.append(f"{'TOTAL':<10} {total:9.2f} ms")
+        lines.append("")
+
+        with open(PROFILE_LOG, "a") as log:
+            log.write("\n".join(lines) + "\n")
+        if over:
+            logger.warning("Carga de %s: fases sobre presupuesto: %s (ver %s)",
+                           self.name, ", ".join(over), PROFILE_LOG)
+
+    def bar(self, screen, seconds):
+        """Construcción de la barra de una pantalla, que llega después de report()"""
+        ms = seconds * 1000
+        flag = self._over_budget("bars", ms, _read_budgets())
+        with open(PROFILE_LOG, "a") as log:
+            log.write(f"{'bars':<10} {ms:9.2f} ms{flag}  ({self.name}, pantalla {screen})\n")
+        if flag:
+            logger.warning("Barra de la pantalla %s sobre presupuesto: %.0f ms (ver %s)",
+                           screen, ms, PROFILE_LOG)
+
+
+class _NullProfiler:
+    """Perfil desactivado: mark() y report() no hacen nada"""
+
+    def mark(self, phase):
+        pass
+
+    def report(self):
+        pass
+
+    def bar(self, screen, seconds):
+        pass
+
+
+def enabled():
+    return os.environ.get("QTILE_PROFILE") == "1" or os.path.exists(PROFILE_CONF)
+
+
+def start(name, started=None):
+    """Devuelve un perfilador nuevo para esta carga de la configuración
+
+    started: time.perf_counter() tomado en la primera línea de la
+    configuración, para que la fase "imports" incluya libqtile.
+    """
+    if not enabled():
+        return _NullProfiler()
+    if started is None:
+        started = time.perf_counter()
+    return StartupProfiler(name, started)
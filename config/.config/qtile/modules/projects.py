@@ -0,0 +1,298 @@
+####################################################
+# Índice de proyectos de ~/Development/projects
+#
+# listprojects y devstatus (~/.dev_functions) y la
+# sección PROYECTOS de master-dev.sh status lanzaban un
+# "find -maxdepth 1" por lenguaje en cada llamada, solo
+# para contar.
+#
+# Aquí cada proyecto queda en ~/Development/.projects.json
+# con su lenguaje, última modificación, rama y cambios de
+# git y tamaño. Al refrescar solo se vuelve a mirar lo
+# que cambió: un directorio de lenguaje con el mismo mtime
+# tiene los mismos proyectos, y un proyecto con la misma
+# firma (mtime de su raíz, de lo que hay en ella y de
+# .git/HEAD e index) no se vuelve a recorrer. Como los
+# cambios profundos no tocan esa firma, el widget de la
+# barra (que refresca en segundo plano) recorre
+# igualmente cada proyecto cuya entrada tenga más de
+# MAX_AGE segundos; los comandos no, para no hacer
+# esperar a nadie (refresh --force lo recorre todo).
+# counts solo necesita saber qué proyectos hay y no
+# recorre ninguno.
+#
+# Lo usan listprojects, devstatus, master-dev.sh status,
+# el widget Projects de la barra (modules/dev_widgets.py)
+# y el selector de rofi (mod+shift+p).
+#
+# Uso:
+#     cd ~/.config/qtile && python3 -m modules.projects list [--lang python] [--tsv|--json]
+#     python3 -m modules.projects counts
+#     python3 -m modules.projects open        # rofi, búsqueda difusa, abre en VS Code
+####################################################
+
+import argparse
+import html
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .repos import PROJECTS_DIR, SKIP_DIRS, RepoState
+from .volbackup import format_size
+
+
+INDEX_FILE = "~/Development/.projects.json"
+MAX_AGE = 10 * 60
+
+# Directorios de ~/Development/projects que agrupan proyectos por lenguaje
+LANG_DIRS = ("python", "nodejs", "java", "golang", "shared")
+
+# Para los proyectos que están sueltos en la raíz
+LANG_MARKERS = (
+    ("python", ("pyproject.toml", "setup.py", "requirements.txt", "Pipfile")),
+    ("nodejs", ("package.json",)),
+    ("java", ("pom.xml", "build.gradle", "build.gradle.kts")),
+    ("golang", ("go.mod",)),
+)
+
+LANG_ICONS = {"python": "🐍", "nodejs": "🟩", "java": "☕", "golang": "🐹", "shared": "📁"}
+
+
+def detect_lang(path):
+    for lang, markers in LANG_MARKERS:
+        if any(os.path.exists(os.path.join(path, marker)) for marker in markers):
+            return lang
+    return "otros"
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0
+
+
+def signature(path):
+    """Firma barata: cambia si se toca algo en la raíz del proyecto o en git"""
+    latest = _mtime(path)
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    latest = max(latest, entry.stat(follow_symlinks=False).st_mtime)
+                except OSError:
+                    pass
+    except OSError:
+        return None
+    return [latest, _mtime(os.path.join(path, ".git", "HEAD")),
+            _mtime(os.path.join(path, ".git", "index"))]
+
+
+def scan_project(name, path, lang):
+    """Recorre el proyecto (sin node_modules, venvs...) y mira su git"""
+    size = 0
+    latest = _mtime(path)
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for filename in filenames:
+            try:
+                st = os.lstat(os.path.join(dirpath, filename))
+            except OSError:
+                continue
+            size += st.st_size
+            latest = max(latest, st.st_mtime)
+    record = {"name": name, "path": path, "lang": lang, "mtime": latest, "size": size,
+              "branch": None, "changes": 0, "git": False,
+              "sig": signature(path), "scanned": time.time()}
+    if os.path.isdir(os.path.join(path, ".git")):
+        repo = RepoState(name, path)
+        repo.refresh()
+        record.update(git=repo.error is None, branch=repo.branch, changes=repo.changes)
+    return record
+
+
+class ProjectIndex:
+    def __init__(self, root=PROJECTS_DIR, path=INDEX_FILE, max_age=None):
+        self.root = os.path.expanduser(root)
+        self.path = os.path.expanduser(path)
+        self.max_age = max_age
+        self.dirs = {}          # directorio de lenguaje -> [mtime, [proyectos]]
+        self.records = {}       # ruta -> registro
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("root") == self.root:
+            self.dirs = data.get("dirs", {})
+            self.records = data.get("projects", {})
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}"
+        with open(tmp, "w") as f:
+            json.dump({"root": self.root, "dirs": self.dirs, "projects": self.records}, f)
+        os.replace(tmp, self.path)
+
+    # ---------- refresco incremental ----------
+
+    def _children(self, directory):
+        """Subdirectorios de un directorio, reusando la lista si su mtime no cambió"""
+        mtime = _mtime(directory)
+        cached = self.dirs.get(directory)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            with os.scandir(directory) as entries:
+                names = sorted(e.name for e in entries
+                               if e.is_dir() and not e.name.startswith("."))
+        except OSError:
+            names = []
+        self.dirs[directory] = [mtime, names]
+        return names
+
+    def discover(self):
+        """{ruta: (nombre, lenguaje)} de todos los proyectos"""
+        found = {}
+        for name in self._children(self.root):
+            path = os.path.join(self.root, name)
+            if name in LANG_DIRS:
+                for child in self._children(path):
+                    found[os.path.join(path, child)] = (child, name)
+            else:
+                found[path] = (name, detect_lang(path))
+        return found
+
+    def refresh(self, force=False):
+        """Actualiza el índice; devuelve cuántos proyectos se volvieron a recorrer"""
+        if not os.path.isdir(self.root):
+            self.records = {}
+            return 0
+        found = self.discover()
+        now = time.time()
+        stale = []
+        for path, (name, lang) in found.items():
+            record = self.records.get(path)
+            if (force or record is None or record["lang"] != lang
+                    or (self.max_age is not None and now - record["scanned"] > self.max_age)
+                    or record["sig"] != signature(path)):
+                stale.append((name, path, lang))
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            scanned = list(pool.map(lambda args: scan_project(*args), stale))
+        records = {path: self.records[path] for path in found if path in self.records}
+        records.update((record["path"], record) for record in scanned)
+        removed = len(self.records) - len(set(self.records) & set(records))
+        self.records = records
+        if stale or removed:
+            self.save()
+        return len(stale)
+
+    # ---------- consultas ----------
+
+    def projects(self, lang=None):
+        """Proyectos, los tocados más recientemente primero"""
+        records = [r for r in self.records.values() if lang is None or r["lang"] == lang]
+        return sorted(records, key=lambda r: r["mtime"], reverse=True)
+
+    def counts(self):
+        """Proyectos por lenguaje; basta con discover(), sin recorrer ninguno"""
+        counts = {}
+        if not os.path.isdir(self.root):
+            return counts
+        for _, lang in self.discover().values():
+            counts[lang] = counts.get(lang, 0) + 1
+        return counts
+
+
+def format_git(record):
+    if not record["git"]:
+        return ""
+    status = f"📝{record['changes']}" if record["changes"] else "✅"
+    return f"{status} {record['branch']}"
+
+
+def _age(seconds):
+    for unit, size in (("d", 86400), ("h", 3600), ("min", 60)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit}"
+    return "ahora"
+
+
+def open_with_rofi(index, editor="code"):
+    """Selector de rofi con búsqueda difusa; abre el elegido en el editor"""
+    records = index.projects()
+    lines = [f"{LANG_ICONS.get(r['lang'], '📁')} {html.escape(r['name'])}  <span alpha='50%'>"
+             f"{r['lang']} · {format_git(r) or 'sin git'} · hace {_age(time.time() - r['mtime'])}"
+             f"</span>" for r in records]
+    result = subprocess.run(
+        ["rofi", "-dmenu", "-i", "-matching", "fuzzy", "-markup-rows",
+         "-format", "i", "-p", "proyecto"],
+        input="\n".join(lines), capture_output=True, text=True,
+    )
+    if result.returncode != 0 or not result.stdout.strip():
+        return 1
+    path = records[int(result.stdout.strip())]["path"]
+    subprocess.Popen(shlex.split(editor) + [path], start_new_session=True)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Índice de proyectos de desarrollo")
+    parser.add_argument("--root", default=os.environ.get("DEV_PROJECTS", PROJECTS_DIR))
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("list")
+    p.add_argument("--lang")
+    output = p.add_mutually_exclusive_group()
+    output.add_argument("--tsv", action="store_true",
+                        help="nombre, lenguaje, rama, cambios, tamaño, mtime y ruta")
+    output.add_argument("--json", action="store_true")
+    sub.add_parser("counts", help="lenguaje y número de proyectos por línea")
+    p = sub.add_parser("open", help="elegir un proyecto con rofi y abrirlo")
+    p.add_argument("--editor", default=os.environ.get("DEV_EDITOR", "code"))
+    p = sub.add_parser("refresh")
+    p.add_argument("--force", action="store_true", help="recorrer todos los proyectos")
+    args = parser.parse_args(argv)
+
+    index = ProjectIndex(args.root)
+    if args.command == "refresh":
+        started = time.monotonic()
+        scanned = index.refresh(force=args.force)
+        print(f"{len(index.records)} proyectos, {scanned} recorridos en {time.monotonic() - started:.2f}s")
+        return 0
+    if args.command == "counts":
+        for lang, count in sorted(index.counts().items()):
+            print(f"{lang}\t{count}")
+        return 0
+    index.refresh()
+
+    if args.command == "open":
+        return open_with_rofi(index, args.editor)
+    elif args.command == "list":
+        projects = index.projects(args.lang)
+        if args.json:
+            print(json.dumps(projects, indent=2, ensure_ascii=False))
+        elif args.tsv:
+            for r in projects:
+                print(f"{r['name']}\t{r['lang']}\t{r['branch'] or ''}\t{r['changes']}\t"
+                      f"{r['size']}\t{int(r['mtime'])}\t{r['path']}")
+        else:
+            # Como listprojects: agrupados por lenguaje, con git y tamaño
+            for lang in sorted({r["lang"] for r in projects}):
+                group = sorted((r for r in projects if r["lang"] == lang), key=lambda r: r["name"])
+                print(f"🔸 {lang} ({len(group)} proyectos):")
+                for r in group:
+                    print(f"    {r['name']:30} {format_git(r):24} {format_size(r['size']):>10}"
+                          f"  hace {_age(time.time() - r['mtime'])}")
+                print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
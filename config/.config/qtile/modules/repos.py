@@ -0,0 +1,297 @@
+####################################################
+# Índice del estado git de los proyectos
+#
+# git_status() de bar_developer.sh entraba a cada repo
+# de ~/Development/projects y corría git diff-index cada
+# 2 segundos: con 40 repos, disco y CPU sin descanso.
+#
+# RepoIndex descubre los repos una vez, vigila con
+# inotify su .git y su árbol de trabajo, y solo vuelve a
+# calcular el estado de los repos donde algo cambió
+# (agrupando los eventos de ~200 ms, y como mucho
+# MAX_DELAY desde el primero aunque sigan llegando). Los
+# repos quietos no se vuelven a leer. Un repo que no se
+# puede vigilar entero (sin watches libres o demasiados
+# directorios) se vuelve a leer cada POLL_INTERVAL.
+#
+# No depende de libqtile: lo usan statusd (dwm) y el
+# widget de la barra de qtile (modules/dev_widgets.py).
+####################################################
+
+import copy
+import errno
+import os
+import select
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import inotify
+
+
+PROJECTS_DIR = "~/Development/projects"
+
+# Directorios que no se vigilan: pesados y casi siempre ignorados por git
+SKIP_DIRS = {
+    ".git", "node_modules", ".venv", "venv", "__pycache__", "target",
+    "build", "dist", ".mypy_cache", ".pytest_cache", ".tox", ".gradle",
+    ".idea", ".next",
+}
+
+# Límite de directorios del árbol de trabajo vigilados por repo (.git aparte);
+# si el árbol tiene más, el repo pasa a leerse cada POLL_INTERVAL
+MAX_WATCHES_PER_REPO = 2000
+# Espera máxima desde el primer evento pendiente, aunque la ráfaga no acabe
+MAX_DELAY = 2.0
+POLL_INTERVAL = 30
+
+
+class RepoState:
+    """Estado de un repo: rama, cambios sin commit y ahead/behind"""
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+        self.branch = None
+        self.changes = 0
+        self.ahead = 0
+        self.behind = 0
+        self.error = None
+
+    @property
+    def dirty(self):
+        return self.changes > 0
+
+    def refresh(self):
+        # --no-optional-locks: git status no reescribe .git/index, así
+        # que leer el estado no genera nuevos eventos de inotify
+        result = subprocess.run(
+            ["git", "--no-optional-locks", "-C", self.path,
+             "status", "--porcelain=v2", "--branch", "--untracked-files=no"],
+            capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            self.error = result.stderr.strip() or "git status falló"
+            self.changes = 0
+            return
+        self.error = None
+        changes = 0
+        for line in result.stdout.splitlines():
+            if line.startswith("# branch.head "):
+                self.branch = line.split(" ", 2)[2]
+            elif line.startswith("# branch.ab "):
+                ahead, behind = line.split()[2:4]
+                self.ahead, self.behind = int(ahead), -int(behind)
+            elif not line.startswith("#"):
+                changes += 1
+        self.changes = changes
+
+    def __repr__(self):
+        return f"<RepoState {self.name} {self.branch} cambios={self.changes}>"
+
+
+class RepoIndex:
+    """Repos de PROJECTS_DIR con su estado, actualizado por inotify
+
+    on_change(index) se llama desde el hilo del índice cada vez que el
+    estado de algún repo cambia.
+    """
+
+    def __init__(self, root=PROJECTS_DIR, on_change=None, debounce=0.2):
+        self.root = os.path.expanduser(root)
+        self.on_change = on_change
+        self.debounce = debounce
+        self.repos = {}             # nombre -> RepoState
+        self._lock = threading.Lock()
+        self._watches = {}          # wd -> nombre del repo ("" = raíz)
+        self._wd_paths = {}         # wd -> directorio
+        self._polled = set()        # repos sin vigilancia completa ("" = raíz)
+        self._watch_error = False
+        self._ino = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    # ---------- consultas (desde cualquier hilo) ----------
+
+    def exists(self):
+        return os.path.isdir(self.root)
+
+    def dirty_count(self):
+        with self._lock:
+            return sum(1 for repo in self.repos.values() if repo.dirty)
+
+    def details(self):
+        """Copia del estado de cada repo, ordenada por nombre"""
+        with self._lock:
+            repos = [copy.copy(repo) for repo in self.repos.values()]
+        return sorted(repos, key=lambda repo: repo.name)
+
+    def summary(self):
+        """Lo que mostraba git_status() en la barra: 📝N, ✅ o ❓"""
+        if not self.exists():
+            return "❓"
+        dirty = self.dirty_count()
+        return f"📝{dirty}" if dirty else "✅"
+
+    # ---------- ciclo de vida ----------
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="repo-index", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def scan(self):
+        """Descubre los repos y calcula su estado (una vez, en paralelo)"""
+        repos = {}
+        if self.exists():
+            for entry in os.scandir(self.root):
+                if entry.is_dir() and os.path.isdir(os.path.join(entry.path, ".git")):
+                    repos[entry.name] = RepoState(entry.name, entry.path)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(RepoState.refresh, repos.values()))
+        with self._lock:
+            self.repos = repos
+
+    def _run(self):
+        try:
+            self._ino = inotify.Inotify()
+        except OSError as e:
+            print(f"repos: inotify no disponible: {e}", file=sys.stderr)
+            return
+        self.scan()
+        self._watch_root()
+        for name in list(self.repos):
+            self._watch_repo(name)
+        self._notify()
+
+        pending = set()
+        first = deadline = None
+        next_poll = time.monotonic() + POLL_INTERVAL
+        while not self._stopped.is_set():
+            timeout = 1.0 if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self._ino], [], [], timeout)
+            now = time.monotonic()
+            if ready:
+                pending |= self._handle_events()
+                # Esperar a que termine la ráfaga (git checkout, npm install...),
+                # pero no más de MAX_DELAY: un build que escribe sin parar no
+                # puede dejar la barra sin actualizar
+                first = first or now
+                deadline = min(now + self.debounce, first + MAX_DELAY)
+            if self._polled and now >= next_poll:
+                pending |= self._polled
+                deadline = now
+                next_poll = now + POLL_INTERVAL
+            if deadline is not None and now >= deadline:
+                self._recompute(pending)
+                pending.clear()
+                first = deadline = None
+        self._ino.close()
+
+    # ---------- vigilancia ----------
+
+    def _add_watch(self, path, name, mask):
+        try:
+            wd = self._ino.add_watch(path, mask | inotify.IN_ONLYDIR)
+        except OSError as e:
+            # ENOENT/EACCES: un directorio que ya no está o no se puede leer
+            if e.errno in (errno.ENOSPC, errno.ENOMEM):
+                self._poll(name, f"sin watches de inotify ({e.strerror}; "
+                                 "ver fs.inotify.max_user_watches)")
+            return False
+        self._watches[wd] = name
+        self._wd_paths[wd] = path
+        return True
+
+    def _watch_root(self):
+        if self.exists():
+            self._add_watch(self.root, "", inotify.IN_CREATE | inotify.IN_DELETE
+                            | inotify.IN_MOVED_TO | inotify.IN_MOVED_FROM)
+
+    def _watch_repo(self, name):
+        path = self.repos[name].path
+        # .git: index, HEAD y refs se reescriben con rename desde *.lock
+        self._add_watch(os.path.join(path, ".git"), name, inotify.IN_CHANGES)
+        self._add_watch(os.path.join(path, ".git", "refs", "heads"), name, inotify.IN_CHANGES)
+        self._watch_tree(path, name)
+
+    def _watch_tree(self, top, name):
+        count = 0
+        for dirpath, dirnames, _ in os.walk(top):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            if name in self._polled:
+                break
+            if count >= MAX_WATCHES_PER_REPO:
+                self._poll(name, f"más de {MAX_WATCHES_PER_REPO} directorios")
+                break
+            if self._add_watch(dirpath, name, inotify.IN_CHANGES):
+                count += 1
+
+    def _poll(self, name, reason):
+        """El repo ya no se vigila entero: se vuelve a leer cada POLL_INTERVAL"""
+        if not self._watch_error:
+            print(f"repos: {reason}; {name or self.root} y los que sigan se leerán "
+                  f"cada {POLL_INTERVAL}s", file=sys.stderr)
+            self._watch_error = True
+        self._polled.add(name)
+
+    def _handle_events(self):
+        changed = set()
+        for wd, mask, filename in self._ino.read():
+            if mask & inotify.IN_Q_OVERFLOW:
+                # Se perdieron eventos: recalcular todo
+                return set(self.repos) | {""}
+            if mask & inotify.IN_IGNORED:
+                self._watches.pop(wd, None)
+                self._wd_paths.pop(wd, None)
+                continue
+            name = self._watches.get(wd)
+            if name is None:
+                continue
+            if name == "":
+                # Un proyecto nuevo, renombrado o borrado en la raíz
+                changed.add("")
+                continue
+            if filename.endswith(".lock"):
+                continue        # git todavía está escribiendo; llegará el rename
+            if mask & inotify.IN_ISDIR and mask & (inotify.IN_CREATE | inotify.IN_MOVED_TO):
+                if filename not in SKIP_DIRS:
+                    self._watch_tree(os.path.join(self._wd_paths[wd], filename), name)
+            changed.add(name)
+        return changed
+
+    def _recompute(self, names):
+        if "" in names:
+            self._rediscover()
+            names = names - {""}
+        for name in names:
+            repo = self.repos.get(name)
+            if repo is not None:
+                repo.refresh()
+        self._notify()
+
+    def _rediscover(self):
+        current = set()
+        if self.exists():
+            for entry in os.scandir(self.root):
+                if entry.is_dir() and os.path.isdir(os.path.join(entry.path, ".git")):
+                    current.add(entry.name)
+        with self._lock:
+            for name in set(self.repos) - current:
+                del self.repos[name]
+                self._polled.discard(name)
+            added = current - set(self.repos)
+            for name in added:
+                self.repos[name] = RepoState(name, os.path.join(self.root, name))
+        for name in added:
+            self.repos[name].refresh()
+            self._watch_repo(name)
+
+    def _notify(self):
+        if self.on_change is not None:
+            self.on_change(self)
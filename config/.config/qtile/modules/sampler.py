@@ -0,0 +1,314 @@
+####################################################
+# Muestreador compartido para los widgets de la barra
+#
+# Con dos (o más) pantallas cada barra tiene su propia
+# copia de CPU, RAM, volumen, batería y reloj, y cada
+# copia leía /proc y /sys con su propio temporizador.
+# Aquí cada fuente de datos se lee UNA vez por ciclo
+# y el resultado se reparte a todos los widgets que
+# la muestran, sin importar cuántas pantallas haya.
+####################################################
+
+import time
+from datetime import datetime, timezone
+
+import psutil
+
+from libqtile import qtile, widget
+from libqtile.log_utils import logger
+from libqtile.widget.battery import load_battery
+
+from .volume import VolumeMonitor
+
+
+_SIN_VALOR = object()
+
+
+class _Source:
+    """Una fuente de datos y los widgets suscritos a ella"""
+
+    def __init__(self, reader=None, align=False, start=None, stop=None):
+        self.reader = reader
+        self.align = align          # alinear los ciclos al reloj (p.ej. al minuto)
+        self.start = start          # fuentes por eventos: start(publicar) / stop()
+        self.stop = stop
+        self.running = False
+        self.subscribers = {}       # callback -> intervalo pedido por el widget
+        self.value = _SIN_VALOR
+        self.timer = None
+        self.timer_interval = None
+        self.pending = False
+
+    @property
+    def interval(self):
+        # La fuente se lee al ritmo del widget más exigente
+        return min(self.subscribers.values())
+
+
+class SharedSampler:
+    """Lee cada fuente una sola vez por ciclo y reparte el valor"""
+
+    def __init__(self):
+        self._sources = {}
+
+    def register(self, name, reader, align=False):
+        """Registra una fuente; el lector se ejecuta en el pool de hilos de qtile
+
+        En un reload la fuente ya existe: se cambia el lector y se
+        conservan los widgets suscritos y el temporizador.
+        """
+        source = self._sources.setdefault(name, _Source(reader, align))
+        source.reader, source.align = reader, align
+
+    def register_events(self, name, start, stop):
+        """Registra una fuente que avisa sola cuando cambia (sin temporizador)
+
+        start(publicar) arranca la fuente con el primer widget suscrito;
+        publicar(valor) se puede llamar desde cualquier hilo. stop() la
+        detiene cuando ya no quedan widgets. En un reload se conserva la
+        fuente ya registrada: su stop() es el que va con su start().
+        """
+        self._sources.setdefault(name, _Source(start=start, stop=stop))
+
+    def subscribe(self, name, callback, interval):
+        source = self._sources[name]
+        source.subscribers[callback] = interval
+        # Un widget nuevo (otra pantalla, reload) recibe el último valor al instante
+        if source.value is not _SIN_VALOR:
+            callback(source.value)
+        if source.start is not None:
+            if not source.running:
+                source.running = True
+                source.start(
+                    lambda value: qtile.call_soon_threadsafe(self._publish, source, value)
+                )
+        elif source.timer is None and not source.pending:
+            qtile.call_soon(self._tick, source)
+        elif source.timer is not None and source.interval < source.timer_interval:
+            self._schedule(source)
+
+    def unsubscribe(self, name, callback):
+        source = self._sources.get(name)
+        if source is None:
+            return
+        source.subscribers.pop(callback, None)
+        if not source.subscribers:
+            self._cancel(source)
+            source.value = _SIN_VALOR
+            if source.running:
+                source.running = False
+                source.stop()
+
+    def refresh(self, name):
+        """Fuerza una lectura inmediata (p.ej. después de una tecla de volumen)"""
+        source = self._sources.get(name)
+        if source is None or not source.subscribers or source.reader is None:
+            return
+        self._cancel(source)
+        self._tick(source)
+
+    def _tick(self, source):
+        source.timer = None
+        if not source.subscribers:
+            return
+        if not source.pending:
+            source.pending = True
+            future = qtile.run_in_executor(source.reader)
+            future.add_done_callback(lambda f: self._deliver(source, f))
+        self._schedule(source)
+
+    def _deliver(self, source, future):
+        source.pending = False
+        try:
+            value = future.result()
+        except Exception as e:
+            logger.exception("Error leyendo una fuente del muestreador compartido")
+            value = e
+        self._publish(source, value)
+
+    def _publish(self, source, value):
+        source.value = value
+        for callback in list(source.subscribers):
+            callback(value)
+
+    def _schedule(self, source):
+        self._cancel(source)
+        interval = source.interval
+        delay = interval
+        if source.align:
+            delay = interval - (time.time() % interval)
+        source.timer = qtile.call_later(delay, self._tick, source)
+        source.timer_interval = interval
+
+    def _cancel(self, source):
+        if source.timer is not None:
+            source.timer.cancel()
+            source.timer = None
+
+
+####################################################
+# Lectores de cada fuente
+
+def _read_cpu():
+    freq = psutil.cpu_freq()
+    return {
+        "load_percent": round(psutil.cpu_percent(), 1),
+        "freq_current": round(freq.current / 1000, 1),
+        "freq_max": round(freq.max / 1000, 1),
+        "freq_min": round(freq.min / 1000, 1),
+    }
+
+
+def _read_memory():
+    return psutil.virtual_memory(), psutil.swap_memory()
+
+
+def _read_clock():
+    return datetime.now(timezone.utc)
+
+
+_battery = None
+
+def _read_battery():
+    global _battery
+    if _battery is None:
+        _battery = load_battery()
+    try:
+        return _battery.update_status()
+    except RuntimeError as e:
+        return e
+
+
+# El volumen llega por eventos del servidor de audio (ver modules/volume.py)
+# (el monitor en marcha se conserva en un reload, ver más abajo)
+_volume_monitor = globals().get("_volume_monitor")
+
+def _start_volume(publish):
+    global _volume_monitor
+    # widget.Volume usa -1 para "silenciado"
+    _volume_monitor = VolumeMonitor(
+        lambda percent, muted: publish(-1 if muted else percent)
+    )
+    _volume_monitor.start()
+
+
+def _stop_volume():
+    _volume_monitor.stop()
+
+
+# qtile vuelve a ejecutar este módulo en lazy.reload_config() (importlib.reload,
+# mismo espacio de nombres) ANTES de finalizar los widgets viejos: se reusa el
+# muestreador que ya existe para que sus temporizadores y suscripciones sigan
+# siendo los que los widgets viejos cancelan en finalize().
+sampler = globals().get("sampler") or SharedSampler()
+sampler.register("cpu", _read_cpu)
+sampler.register("memory", _read_memory)
+sampler.register("clock", _read_clock, align=True)
+sampler.register("battery", _read_battery)
+sampler.register_events("volume", _start_volume, _stop_volume)
+
+
+####################################################
+# Widgets que leen del muestreador en vez de su propio temporizador
+# Se usan igual que los de libqtile: SharedCPU(format=..., background=...)
+
+class _SharedWidget:
+    """Cambia el temporizador propio del widget por una suscripción"""
+
+    source = None           # cada subclase define también _on_sample(muestra)
+
+    def timer_setup(self):
+        # Se guarda el muestreador al que se suscribió: finalize() tiene que
+        # darse de baja de ese mismo, aunque el módulo se haya recargado
+        self._sampler = sampler
+        self._sampler.subscribe(self.source, self._on_sample, self.update_interval)
+
+    def finalize(self):
+        subscribed = getattr(self, "_sampler", None)
+        if subscribed is not None:
+            subscribed.unsubscribe(self.source, self._on_sample)
+        super().finalize()
+
+
+class SharedCPU(_SharedWidget, widget.CPU):
+    source = "cpu"
+
+    def _on_sample(self, sample):
+        self.update(self.format.format(**sample))
+
+
+class SharedMemory(_SharedWidget, widget.Memory):
+    source = "memory"
+
+    def _on_sample(self, sample):
+        mem, swap = sample
+        calc_mem = self.measures[self.measure_mem]
+        calc_swap = self.measures[self.measure_swap]
+        val = {
+            "MemUsed": mem.used / calc_mem,
+            "MemTotal": mem.total / calc_mem,
+            "MemFree": mem.free / calc_mem,
+            "MemPercent": mem.percent,
+            "Available": mem.available / calc_mem,
+            "Buffers": mem.buffers / calc_mem,
+            "Active": mem.active / calc_mem,
+            "Inactive": mem.inactive / calc_mem,
+            "Shmem": mem.shared / calc_mem,
+            "SwapTotal": swap.total / calc_swap,
+            "SwapFree": swap.free / calc_swap,
+            "SwapUsed": swap.used / calc_swap,
+            "SwapPercent": swap.percent,
+            "mm": self.measure_mem,
+            "ms": self.measure_swap,
+        }
+        self.update(self.format.format(**val))
+
+
+class SharedClock(_SharedWidget, widget.Clock):
+    source = "clock"
+
+    def _on_sample(self, sample):
+        if self.timezone is not None:
+            now = sample.astimezone(self.timezone)
+        else:
+            now = sample.astimezone()
+        self.update((now + self.DELTA).strftime(self.format))
+
+
+class SharedBattery(_SharedWidget, widget.Battery):
+    source = "battery"
+
+    def _on_sample(self, sample):
+        if isinstance(sample, Exception):
+            self.update(f"Error: {sample}")
+        else:
+            self.update(self.build_string(sample))
+
+
+class SharedBatteryIcon(_SharedWidget, widget.BatteryIcon):
+    source = "battery"
+
+    def _on_sample(self, sample):
+        if isinstance(sample, Exception):
+            icon = "battery-missing"
+        else:
+            icon = self._get_icon_key(sample)
+        if icon != self.current_icon:
+            self.current_icon = icon
+            self.draw()
+
+
+class SharedVolume(_SharedWidget, widget.Volume):
+    source = "volume"
+
+    def update(self):
+        # Los clics y la rueda del ratón llaman a update(): el cambio ya
+        # llega como evento del servidor de audio, no hace falta consultar
+        pass
+
+    def _on_sample(self, sample):
+        if isinstance(sample, Exception) or sample == self.volume:
+            return
+        self.volume = sample
+        self._update_drawer()
+        self.bar.draw()
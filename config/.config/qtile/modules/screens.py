@@ -0,0 +1,49 @@
+####################################################
+# Pantallas con barra perezosa
+#
+# Antes config_developer.py llamaba a
+# "xrandr --listmonitors" al importar la configuración
+# (bloqueando la carga en un proceso hijo) y contaba las
+# líneas de la salida para decidir si agregar la segunda
+# pantalla.
+#
+# Qtile ya obtiene las salidas de RandR desde el backend
+# X sin lanzar procesos, y con reconfigure_screens = True
+# vuelve a asignar config.screens[i] a cada salida en
+# cada screen_change. Solo usa tantas entradas de
+# config.screens como salidas conectadas haya, así que
+# basta declarar las pantallas posibles: LazyScreen
+# construye su barra la primera vez que qtile le asigna
+# una salida. Al conectar un monitor solo se construye la
+# barra de esa pantalla; las demás se reutilizan.
+#
+# Como la barra se construye después de cargar la
+# configuración, su tiempo se apunta aparte en el perfil
+# de carga (profile.bar(), ver modules/profiler.py).
+####################################################
+
+import time
+
+from libqtile.config import Screen
+
+
+class LazyScreen(Screen):
+    """Screen cuya barra superior se construye al asignarle una salida
+
+    bar_factory: función sin argumentos que devuelve el bar.Bar
+    profile: el perfil de carga de la configuración (profiler.start())
+    """
+
+    def __init__(self, bar_factory, profile=None, **config):
+        Screen.__init__(self, **config)
+        self.bar_factory = bar_factory
+        self.profile = profile
+
+    def _configure(self, qtile, index, *args, **kwargs):
+        if self.top is None:
+            started = time.perf_counter()
+            self.top = self.bar_factory()
+            if self.profile is not None:
+                self.profile.bar(index, time.perf_counter() - started)
+        Screen._configure(self, qtile, index, *args, **kwargs)
+
@@ -0,0 +1,244 @@
+####################################################
+# Carga y temperatura leídas directo de /proc y /sys
+#
+# load_average() de bar_developer.sh lanzaba uptime,
+# dos awk, sed y cut en cada refresco, y cpu_temp() solo
+# miraba thermal_zone0 con cat. Aquí cada archivo se
+# abre una vez y se relee con pread; la temperatura se
+# toma de todas las zonas térmicas y sensores hwmon
+# (máxima y del paquete de la CPU).
+#
+# Los colores llevan histéresis: para bajar de nivel el
+# valor tiene que bajar un margen por debajo del umbral,
+# así la barra no parpadea cuando la carga o la
+# temperatura rondan el límite.
+#
+# Microbenchmark del coste por refresco:
+#     cd ~/.config/qtile && python3 -m modules.sensors --bench
+#
+# No depende de libqtile: lo usan statusd (dwm) y los
+# widgets de modules/dev_widgets.py.
+####################################################
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import time
+
+
+####################################################
+# Lectura de /proc y /sys con descriptores persistentes
+
+class ProcFile:
+    """Archivo de /proc o /sys que se abre una vez y se relee con pread"""
+
+    def __init__(self, path):
+        self.path = path
+        self.fd = None
+
+    def read(self):
+        if self.fd is None:
+            self.fd = os.open(self.path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            return os.pread(self.fd, 65536, 0).decode()
+        except OSError:
+            # El archivo desapareció (p.ej. una interfaz de red): reabrir
+            self.close()
+            raise
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+class Hysteresis:
+    """Nivel (0, 1, 2...) de un valor según umbrales crecientes
+
+    Se sube de nivel cuando el valor llega al umbral y solo se baja cuando
+    cae `margin` por debajo de él.
+    """
+
+    def __init__(self, thresholds, margin):
+        self.thresholds = thresholds
+        self.margin = margin
+        self.level = 0
+
+    def __call__(self, value):
+        level = self.level
+        while level < len(self.thresholds) and value >= self.thresholds[level]:
+            level += 1
+        while level > 0 and value < self.thresholds[level - 1] - self.margin:
+            level -= 1
+        self.level = level
+        return level
+
+
+####################################################
+# Carga del sistema
+
+class LoadAverage:
+    """Carga de 1 minuto de /proc/loadavg con su color
+
+    Mismo corte que el script (parte entera > 1 amarillo, > 2 rojo), con
+    un margen de 0.25 para volver al color anterior.
+    """
+
+    ICONS = ("🟢", "🟡", "🔴")
+
+    def __init__(self, path="/proc/loadavg"):
+        self._file = ProcFile(path)
+        self._level = Hysteresis((2, 3), margin=0.25)
+
+    def read(self):
+        load1, load5, load15 = self._file.read().split()[:3]
+        return {
+            "load": load1,
+            "load5": load5,
+            "load15": load15,
+            "icon": self.ICONS[self._level(float(load1))],
+        }
+
+
+####################################################
+# Temperatura
+
+# Sensores que miden el paquete/die de la CPU, por orden de preferencia
+_PACKAGE_LABELS = ("Package id 0", "Tdie", "Tctl")
+_PACKAGE_ZONES = ("x86_pkg_temp",)
+
+
+def _read_text(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+class ThermalSensors:
+    """Todas las zonas de /sys/class/thermal y sensores de /sys/class/hwmon
+
+    Se descubren una vez; si un sensor desaparece se vuelven a buscar.
+    read() devuelve la temperatura máxima, la del paquete de la CPU (o la
+    máxima si no hay sensor de paquete) y el color con histéresis.
+    """
+
+    ICONS = ("❄️", "🟡", "🔥")
+
+    def __init__(self, sysfs="/sys/class"):
+        self.sysfs = sysfs
+        self.sensors = []       # (nombre, ProcFile, es_paquete)
+        self._level = Hysteresis((51, 71), margin=3)
+        self.discover()
+
+    def discover(self):
+        for _, sensor, _ in self.sensors:
+            sensor.close()
+        sensors = []
+        for zone in sorted(glob.glob(os.path.join(self.sysfs, "thermal", "thermal_zone*"))):
+            kind = _read_text(os.path.join(zone, "type")) or os.path.basename(zone)
+            sensors.append((kind, ProcFile(os.path.join(zone, "temp")), kind in _PACKAGE_ZONES))
+        for hwmon in sorted(glob.glob(os.path.join(self.sysfs, "hwmon", "hwmon*"))):
+            chip = _read_text(os.path.join(hwmon, "name")) or os.path.basename(hwmon)
+            for path in sorted(glob.glob(os.path.join(hwmon, "temp*_input"))):
+                label = _read_text(path[:-len("_input")] + "_label")
+                name = f"{chip} {label or os.path.basename(path)}"
+                sensors.append((name, ProcFile(path), label in _PACKAGE_LABELS))
+        # El sensor de paquete preferido va primero
+        sensors.sort(key=lambda s: not s[2])
+        self.sensors = sensors
+
+    def read(self, rediscover=True):
+        temps = {}
+        package = None
+        for name, sensor, is_package in self.sensors:
+            try:
+                value = int(sensor.read()) / 1000
+            except FileNotFoundError:
+                if not rediscover:
+                    continue
+                # Sensor que ya no existe (módulo descargado, hwmon renumerado)
+                self.discover()
+                return self.read(rediscover=False)
+            except (OSError, ValueError):
+                continue        # zonas que no dan lectura (p.ej. desactivadas)
+            temps[name] = value
+            if is_package and package is None:
+                package = value
+        if not temps:
+            return None
+        hottest = max(temps.values())
+        if package is None:
+            package = hottest
+        return {
+            "package": package,
+            "max": hottest,
+            "sensors": temps,
+            "icon": self.ICONS[self._level(package)],
+        }
+
+
+def format_load(sample):
+    """⚡ se añade en la plantilla: 🟢 0.42"""
+    return f"{sample['icon']} {sample['load']}"
+
+
+def format_temp(sample):
+    """🔥72°C, como cpu_temp(); vacío si no hay sensores"""
+    if sample is None:
+        return ""
+    return f"{sample['icon']}{int(sample['package'])}°C"
+
+
+####################################################
+# Microbenchmark
+
+_SHELL_LOAD = ("uptime | awk -F'load average:' '{print $2}' | awk '{print $1}' "
+               "| sed 's/,//' | cut -d'.' -f1")
+_SHELL_TEMP = "cat /sys/class/thermal/thermal_zone0/temp"
+
+
+def _per_call(fn, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def bench(rounds):
+    load = LoadAverage()
+    thermal = ThermalSensors()
+    shell = lambda cmd: subprocess.run(["bash", "-c", cmd], capture_output=True)
+    rows = [
+        ("carga (pread)", _per_call(load.read, rounds)),
+        (f"temperatura (pread, {len(thermal.sensors)} sensores)", _per_call(thermal.read, rounds)),
+        ("carga (uptime|awk|awk|sed|cut)", _per_call(lambda: shell(_SHELL_LOAD), max(1, rounds // 100))),
+        ("temperatura (cat)", _per_call(lambda: shell(_SHELL_TEMP), max(1, rounds // 100))),
+    ]
+    for name, seconds in rows:
+        print(f"{name:42} {seconds * 1e6:10.1f} µs/refresco")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Carga y temperatura desde /proc y /sys")
+    parser.add_argument("--bench", action="store_true", help="medir el coste por refresco")
+    parser.add_argument("--rounds", type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        bench(args.rounds)
+        return 0
+    print(format_load(LoadAverage().read()))
+    thermal = ThermalSensors().read()
+    print(format_temp(thermal))
+    if thermal is not None:
+        for name, value in thermal["sensors"].items():
+            print(f"  {name}: {value:.1f}°C")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,410 @@
+####################################################
+# Snapshots incrementales de los proyectos
+#
+# quickbackup (~/.dev_functions), backup_system
+# (master-dev.sh) y create_backup (~/.dev_logger) hacían
+# un tar -czf completo de ~/Development/projects cada
+# vez, node_modules, venvs y compilados incluidos.
+#
+# Aquí se guarda un índice con mtime, tamaño e inodo de
+# cada archivo: en el siguiente snapshot solo se leen los
+# que cambiaron. Por defecto se saltan los directorios
+# pesados de siempre y lo que digan los .gitignore de
+# cada proyecto. Los datos van a un almacén de trozos
+# deduplicado (el de modules/volbackup.py).
+#
+# Cada snapshot guarda solo lo que cambió desde el
+# anterior; cada --full-every snapshots se escribe uno
+# completo para que la cadena no crezca sin fin, y prune
+# borra los viejos compactando el primero que queda.
+#
+# Almacén: ~/Development/backups/snapshots
+#     chunks/                trozos comprimidos (compartidos)
+#     <nombre>/index.json    estado del último snapshot
+#     <nombre>/NNNNNN-<fecha>.json
+#
+# Uso (quickbackup, backup_system y create_backup ya lo usan):
+#     cd ~/.config/qtile && python3 -m modules.snapshots backup ~/Development/projects
+#     python3 -m modules.snapshots list --name projects
+#     python3 -m modules.snapshots restore latest [rutas...] --target /tmp/restaurado
+#     python3 -m modules.snapshots prune --keep 20
+####################################################
+
+import argparse
+import collections
+import fcntl
+import json
+import os
+import re
+import stat
+import sys
+import time
+
+from .volbackup import CHUNK_SIZE, BackupError, ChunkStore, format_size
+
+
+SNAPSHOTS_DIR = "~/Development/backups/snapshots"
+
+# Se saltan siempre (se regeneran con npm install, pip, mvn, go build...)
+DEFAULT_EXCLUDES = (
+    "node_modules/", ".venv/", "venv/", "__pycache__/", "*.pyc",
+    ".pytest_cache/", ".mypy_cache/", ".tox/", ".gradle/", ".next/",
+    ".nuxt/", "target/", "dist/", "build/", ".cache/",
+)
+
+_RE_SNAPSHOT = re.compile(r"^(\d{6})-[\d-]+\.json$")
+
+
+####################################################
+# Reglas estilo .gitignore
+
+def _glob_regex(glob):
+    out = []
+    i = 0
+    while i < len(glob):
+        if glob.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif glob.startswith("/**", i) and i + 3 == len(glob):
+            out.append("/.*")
+            i += 3
+        elif glob[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif glob[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif glob[i] == "[" and "]" in glob[i + 1:]:
+            end = glob.index("]", i + 1)
+            out.append("[" + glob[i + 1:end].replace("!", "^", 1) + "]")
+            i = end + 1
+        else:
+            out.append(re.escape(glob[i]))
+            i += 1
+    return "".join(out)
+
+
+def parse_rules(lines, base=""):
+    """(base, regex, negada, solo_directorios) por cada patrón"""
+    rules = []
+    for line in lines:
+        line = line.rstrip("\n").rstrip(" ")
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if "/" in line:
+            regex = _glob_regex(line.lstrip("/"))       # relativo al .gitignore
+        else:
+            regex = "(?:.*/)?" + _glob_regex(line)      # a cualquier profundidad
+        rules.append((base, re.compile(regex), negate, dir_only))
+    return rules
+
+
+def ignored(rules, path, is_dir):
+    # Como git: gana la última regla que coincide
+    for base, regex, negate, dir_only in reversed(rules):
+        if dir_only and not is_dir:
+            continue
+        if base:
+            if not path.startswith(base + "/"):
+                continue
+            sub = path[len(base) + 1:]
+        else:
+            sub = path
+        if regex.fullmatch(sub):
+            return not negate
+    return False
+
+
+####################################################
+# Recorrido del árbol
+
+def scan(root, rules, use_gitignore=True):
+    """{ruta relativa: lstat} de los archivos y enlaces que entran en el snapshot"""
+    found = {}
+
+    def walk(dirpath, rel, rules):
+        if use_gitignore:
+            try:
+                with open(os.path.join(dirpath, ".gitignore")) as f:
+                    rules = rules + parse_rules(f, rel)
+            except OSError:
+                pass
+        try:
+            entries = list(os.scandir(dirpath))
+        except OSError:
+            return
+        for entry in entries:
+            path = f"{rel}/{entry.name}" if rel else entry.name
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            is_dir = stat.S_ISDIR(st.st_mode)
+            if ignored(rules, path, is_dir):
+                continue
+            if is_dir:
+                walk(entry.path, path, rules)
+            elif stat.S_ISREG(st.st_mode) or stat.S_ISLNK(st.st_mode):
+                found[path] = st
+
+    walk(root, "", rules)
+    return found
+
+
+####################################################
+# Cadena de snapshots
+
+class SnapshotSet:
+    """Los snapshots de un directorio (projects, containers...)"""
+
+    def __init__(self, name, store_dir=SNAPSHOTS_DIR, jobs=None):
+        self.name = name
+        self.store = ChunkStore(store_dir, jobs)
+        self.dir = os.path.join(self.store.root, name)
+        self.index_path = os.path.join(self.dir, "index.json")
+
+    def snapshots(self):
+        try:
+            return sorted(n for n in os.listdir(self.dir) if _RE_SNAPSHOT.match(n))
+        except FileNotFoundError:
+            return []
+
+    def load(self, snapshot):
+        with open(os.path.join(self.dir, snapshot)) as f:
+            return json.load(f)
+
+    def _write(self, path, data):
+        with open(path + ".tmp", "w") as f:
+            json.dump(data, f)
+        os.replace(path + ".tmp", path)
+
+    def resolve(self, snapshot):
+        snapshots = self.snapshots()
+        if snapshot == "latest" and snapshots:
+            return snapshots[-1]
+        for name in snapshots:
+            stem = name[:-len(".json")]
+            if snapshot in (name, stem) or (snapshot.isdigit() and int(stem[:6]) == int(snapshot)):
+                return name
+        raise BackupError(f"no existe el snapshot {snapshot} de {self.name}")
+
+    def state_at(self, snapshot):
+        """Archivos tal como estaban en `snapshot`: el último completo + los cambios"""
+        chain = self.snapshots()
+        chain = chain[:chain.index(snapshot) + 1]
+        start = max(i for i, name in enumerate(chain) if self.load(name)["full"])
+        files = {}
+        for name in chain[start:]:
+            data = self.load(name)
+            for path in data.get("deleted", []):
+                files.pop(path, None)
+            files.update(data["files"])
+        return files
+
+    def _load_index(self):
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            snapshots = self.snapshots()
+            # Sin índice (borrado, de otra máquina): rehacerlo desde la cadena
+            return self.state_at(snapshots[-1]) if snapshots else {}
+
+    # ---------- crear ----------
+
+    def _store_file(self, path, inflight):
+        futures = []
+        with open(path, "rb") as f:
+            for piece in iter(lambda: f.read(CHUNK_SIZE), b""):
+                future = self.store.put(piece)
+                futures.append(future)
+                inflight.append(future)
+                # No tener en memoria más trozos de los que se comprimen a la vez
+                while len(inflight) > 16:
+                    inflight.popleft().result()
+        return futures
+
+    def backup(self, root, excludes=DEFAULT_EXCLUDES, use_gitignore=True, full_every=10):
+        root = os.path.expanduser(root)
+        if not os.path.isdir(root):
+            raise BackupError(f"no existe {root}")
+        os.makedirs(self.dir, exist_ok=True)
+        index = self._load_index()
+        current = scan(root, parse_rules(excludes), use_gitignore)
+
+        files = {}
+        pending = []
+        inflight = collections.deque()
+        unchanged = 0
+        for path, st in current.items():
+            old = index.get(path)
+            # Mismo mtime, tamaño e inodo: no se vuelve a leer
+            if old and (old["m"], old["s"], old["i"]) == (st.st_mtime_ns, st.st_size, st.st_ino):
+                files[path] = old
+                unchanged += 1
+                continue
+            entry = {"m": st.st_mtime_ns, "s": st.st_size, "i": st.st_ino,
+                     "mode": stat.S_IMODE(st.st_mode)}
+            full_path = os.path.join(root, path)
+            try:
+                if stat.S_ISLNK(st.st_mode):
+                    entry["l"] = os.readlink(full_path)
+                else:
+                    pending.append((entry, self._store_file(full_path, inflight)))
+            except OSError:
+                continue        # desapareció mientras tanto
+            files[path] = entry
+        for entry, futures in pending:
+            entry["c"] = [future.result() for future in futures]
+
+        snapshots = self.snapshots()
+        number = int(snapshots[-1][:6]) + 1 if snapshots else 1
+        last_full = max((i for i, n in enumerate(snapshots) if self.load(n)["full"]), default=None)
+        full = last_full is None or len(snapshots) - last_full >= full_every
+        changed = {p: e for p, e in files.items() if index.get(p) != e}
+        deleted = sorted(set(index) - set(files))
+        snapshot = f"{number:06d}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        self._write(os.path.join(self.dir, snapshot), {
+            "root": root, "created": time.time(), "full": full,
+            "files": files if full else changed,
+            "deleted": [] if full else deleted,
+        })
+        self._write(self.index_path, files)
+        return {"snapshot": snapshot, "full": full, "files": len(files),
+                "changed": len(changed), "deleted": len(deleted), "unchanged": unchanged}
+
+    # ---------- restaurar ----------
+
+    def restore(self, snapshot, target, paths=()):
+        snapshot = self.resolve(snapshot)
+        files = self.state_at(snapshot)
+        target = os.path.expanduser(target)
+        prefixes = tuple(p.rstrip("/") for p in paths)
+        count = 0
+        for path, entry in sorted(files.items()):
+            if prefixes and not any(path == p or path.startswith(p + "/") for p in prefixes):
+                continue
+            dest = os.path.join(target, path)
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            if os.path.lexists(dest):
+                os.unlink(dest)
+            count += 1
+            if "l" in entry:
+                os.symlink(entry["l"], dest)
+                continue
+            with open(dest, "wb") as f:
+                for digest in entry["c"]:
+                    f.write(self.store.get(digest))
+            os.chmod(dest, entry["mode"])
+            os.utime(dest, ns=(entry["m"], entry["m"]))
+        return snapshot, count
+
+    # ---------- compactar ----------
+
+    def prune(self, keep):
+        """Deja los últimos `keep` snapshots; el primero pasa a ser completo"""
+        # snapshots[:-0] está vacío: con 0 no se borraría nada
+        if keep < 1:
+            raise BackupError(f"--keep tiene que ser al menos 1 (es {keep})")
+        snapshots = self.snapshots()
+        if len(snapshots) <= keep:
+            return 0
+        first = snapshots[-keep]
+        data = self.load(first)
+        if not data["full"]:
+            data.update(full=True, files=self.state_at(first), deleted=[])
+            self._write(os.path.join(self.dir, first), data)
+        for name in snapshots[:-keep]:
+            os.unlink(os.path.join(self.dir, name))
+        return len(snapshots) - keep
+
+    def close(self):
+        self.store.close()
+
+
+def collect_garbage(store_dir=SNAPSHOTS_DIR):
+    """Borra los trozos que ningún snapshot de ningún nombre usa"""
+    root = os.path.expanduser(store_dir)
+    used = set()
+    for name in os.listdir(root):
+        if name == "chunks" or not os.path.isdir(os.path.join(root, name)):
+            continue
+        snapshot_set = SnapshotSet(name, store_dir, jobs=1)
+        for snapshot in snapshot_set.snapshots():
+            for entry in snapshot_set.load(snapshot)["files"].values():
+                used.update(entry.get("c", ()))
+        snapshot_set.close()
+    freed = 0
+    for dirpath, _, names in os.walk(os.path.join(root, "chunks")):
+        for chunk in names:
+            if chunk not in used:
+                path = os.path.join(dirpath, chunk)
+                freed += os.path.getsize(path)
+                os.unlink(path)
+    return freed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Snapshots incrementales de directorios")
+    parser.add_argument("--store", default=SNAPSHOTS_DIR)
+    parser.add_argument("--name", default=None, help="por defecto, el nombre del directorio")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("backup")
+    p.add_argument("root")
+    p.add_argument("--exclude", action="append", default=[], help="patrón extra estilo .gitignore")
+    p.add_argument("--no-defaults", action="store_true", help="no saltar node_modules, venvs...")
+    p.add_argument("--no-gitignore", action="store_true", help="no hacer caso de los .gitignore")
+    p.add_argument("--full-every", type=int, default=10)
+    sub.add_parser("list")
+    p = sub.add_parser("restore")
+    p.add_argument("snapshot", help="número, fecha o 'latest'")
+    p.add_argument("paths", nargs="*", help="solo estas rutas (relativas)")
+    p.add_argument("--target", required=True)
+    p = sub.add_parser("prune")
+    p.add_argument("--keep", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    name = args.name or (os.path.basename(os.path.normpath(args.root))
+                         if args.command == "backup" else "projects")
+    snapshot_set = SnapshotSet(name, args.store)
+    os.makedirs(snapshot_set.store.root, exist_ok=True)
+    started = time.monotonic()
+    # Un snapshot a la vez por almacén (cron, quickbackup, backup_system)
+    with open(os.path.join(snapshot_set.store.root, ".lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            if args.command == "backup":
+                excludes = (() if args.no_defaults else DEFAULT_EXCLUDES) + tuple(args.exclude)
+                r = snapshot_set.backup(args.root, excludes, not args.no_gitignore, args.full_every)
+                kind = "completo" if r["full"] else "incremental"
+                print(f"  {name} {r['snapshot'][:-5]} ({kind}): {r['files']} archivos, "
+                      f"{r['changed']} cambiados, {r['deleted']} borrados, "
+                      f"{format_size(snapshot_set.store.written)} nuevos, "
+                      f"{time.monotonic() - started:.1f}s")
+            elif args.command == "list":
+                for snapshot in snapshot_set.snapshots():
+                    data = snapshot_set.load(snapshot)
+                    kind = "completo" if data["full"] else "incremental"
+                    print(f"{snapshot[:-5]}  {kind:11}  {len(data['files'])} archivos")
+            elif args.command == "restore":
+                snapshot, count = snapshot_set.restore(args.snapshot, args.target, args.paths)
+                print(f"  {count} archivos de {snapshot[:-5]} restaurados en {args.target}")
+            else:
+                removed = snapshot_set.prune(args.keep)
+                freed = collect_garbage(args.store)
+                print(f"  {removed} snapshots borrados, {format_size(freed)} liberados")
+        except BackupError as e:
+            print(f"snapshots: {e}", file=sys.stderr)
+            return 1
+        finally:
+            snapshot_set.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+####################################################
+# Lanzador precalentado para los atajos de teclado
+#
+# Casi todos los atajos son lazy.spawn("..."): cada
+# pulsación volvía a partir la cadena y hacía fork del
+# proceso de qtile entero (cientos de MB de mapas de
+# memoria que copiar) para lanzar un wpctl o un
+# brightnessctl; con las teclas multimedia se pulsan
+# varias seguidas.
+#
+# Aquí un proceso pequeño, arrancado una vez junto con
+# qtile, recibe por una tubería el argv ya partido (se
+# parte al cargar la configuración), resuelve el
+# ejecutable con un caché del PATH y lo lanza con
+# posix_spawn (vfork, sin copiar memoria). Si el
+# ayudante no está, se usa qtile.spawn como siempre.
+#
+# En la configuración:
+#     from modules.spawner import spawn
+#     Key([], "XF86AudioMute", spawn("wpctl set-mute @DEFAULT_AUDIO_SINK@ toggle")),
+#
+# Microbenchmark (fork de un proceso grande vs posix_spawn):
+#     python3 ~/.config/qtile/modules/spawner.py --bench
+#
+# El ayudante solo usa la biblioteca estándar: se lanza
+# por ruta, sin el paquete modules ni libqtile.
+####################################################
+
+import json
+import os
+import shlex
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+
+####################################################
+# Lado del ayudante
+
+class PathCache:
+    """Nombre -> ruta de los ejecutables del PATH, reescaneado solo si cambia"""
+
+    def __init__(self, path=None):
+        self.dirs = [d for d in (path or os.environ.get("PATH", "")).split(os.pathsep) if d]
+        self.names = {}
+        self.mtimes = None
+        self.scan()
+
+    def _dir_mtimes(self):
+        mtimes = []
+        for directory in self.dirs:
+            try:
+                mtimes.append(os.stat(directory).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return mtimes
+
+    def scan(self):
+        names = {}
+        for directory in self.dirs:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        names.setdefault(entry.name, entry.path)
+            except OSError:
+                continue
+        self.names = names
+        self.mtimes = self._dir_mtimes()
+
+    def resolve(self, name):
+        if "/" in name:
+            return name
+        path = self.names.get(name)
+        # Programa recién instalado: algún directorio del PATH cambió
+        if path is None and self._dir_mtimes() != self.mtimes:
+            self.scan()
+            path = self.names.get(name)
+        return path
+
+
+def _reap(signum, frame):
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+# Como qtile.spawn: el programa no hereda la tubería de órdenes como stdin
+# ni la salida del ayudante; 0, 1 y 2 apuntan a /dev/null
+_NULL_FDS = [(os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_RDWR, 0) for fd in (0, 1, 2)]
+
+
+def spawn_argv(paths, argv):
+    path = paths.resolve(argv[0])
+    if path is None:
+        raise FileNotFoundError(f"{argv[0]}: no está en el PATH")
+    try:
+        # setsid: como qtile.spawn, el programa no depende de la sesión de qtile
+        return os.posix_spawn(path, argv, os.environ, file_actions=_NULL_FDS, setsid=True,
+                              setsigdef=(signal.SIGCHLD, signal.SIGPIPE))
+    except FileNotFoundError:
+        paths.scan()            # se desinstaló o movió: reintentar una vez
+        return os.posix_spawn(paths.resolve(argv[0]) or path, argv, os.environ,
+                              file_actions=_NULL_FDS, setsid=True,
+                              setsigdef=(signal.SIGCHLD, signal.SIGPIPE))
+
+
+def serve(stream=None):
+    """Lee un argv en JSON por línea y lo lanza; termina cuando qtile cierra la tubería"""
+    stream = stream or sys.stdin.buffer
+    signal.signal(signal.SIGCHLD, _reap)
+    paths = PathCache()
+    for line in stream:
+        try:
+            spawn_argv(paths, json.loads(line))
+        except (OSError, ValueError, IndexError) as e:
+            print(f"spawner: {e}", file=sys.stderr, flush=True)
+
+
+####################################################
+# Lado de qtile
+
+class Spawner:
+    """Conexión con el ayudante; se relanza si muere"""
+
+    def __init__(self):
+        self.proc = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        if self.proc is not None and self.proc.poll() is None:
+            return
+        self.proc = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--serve"],
+            stdin=subprocess.PIPE, start_new_session=True,
+        )
+
+    def spawn(self, argv):
+        """True si el ayudante aceptó el comando"""
+        line = (json.dumps(argv) + "\n").encode()
+        with self._lock:
+            for _ in range(2):
+                try:
+                    self.start()
+                    self.proc.stdin.write(line)
+                    self.proc.stdin.flush()
+                    return True
+                except OSError:
+                    self.proc = None        # murió: arrancar otro y reintentar
+        return False
+
+    def stop(self):
+        if self.proc is not None:
+            self.proc.stdin.close()
+            self.proc = None
+
+
+# qtile vuelve a ejecutar el módulo en reload_config(): reusar la conexión, o
+# cada recarga dejaría vivo otro ayudante con su tubería abierta
+spawner = globals().get("spawner") or Spawner()
+
+
+def _spawn(qtile, argv, command):
+    if not spawner.spawn(argv):
+        qtile.spawn(command)
+
+
+def spawn(command):
+    """Como lazy.spawn(command), pero por el ayudante y con el argv ya partido"""
+    from libqtile.lazy import lazy
+    argv = shlex.split(command) if isinstance(command, str) else list(command)
+    return lazy.function(_spawn, argv, command)
+
+
+####################################################
+# Microbenchmark
+
+def bench(rounds, ballast_mb):
+    # Memoria de relleno para parecerse a qtile: el fork copia sus mapas
+    ballast = bytearray(ballast_mb * 1024 * 1024)
+    for i in range(0, len(ballast), 4096):
+        ballast[i] = 1
+    paths = PathCache()
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+    def fork_exec():
+        subprocess.Popen(["true"]).wait()
+
+    def posix_spawn():
+        pid = spawn_argv(paths, ["true"])
+        os.waitpid(pid, 0)
+
+    for name, fn in (("fork+exec (subprocess)", fork_exec), ("posix_spawn", posix_spawn)):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        per_call = (time.perf_counter() - started) / rounds
+        print(f"{name:24} {per_call * 1e6:10.1f} µs/lanzamiento ({ballast_mb} MB residentes)")
+
+
+if __name__ == "__main__":
+    if "--serve" in sys.argv:
+        serve()
+    elif "--bench" in sys.argv:
+        bench(rounds=200, ballast_mb=300)
+    else:
+        print("uso: spawner.py --serve | --bench", file=sys.stderr)
+        sys.exit(2)
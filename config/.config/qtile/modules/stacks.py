@@ -0,0 +1,225 @@
+####################################################
+# Arranque de los stacks de desarrollo por dependencias
+#
+# start_all de dev-manager.sh levantaba databases,
+# tools, python, nodejs, java y golang uno detrás de
+# otro con un "sleep 3" fijo entre cada uno, sin saber
+# si postgres ya aceptaba conexiones.
+#
+# Aquí cada stack arranca en cuanto sus dependencias
+# están sanas: los independientes a la vez, y la espera
+# es por las señales reales de Docker (eventos
+# health_status / start / die), no por sleeps. Un
+# contenedor con healthcheck cuenta cuando está
+# "healthy"; uno sin healthcheck, cuando está corriendo.
+# Al final se muestra cuánto tardó cada stack en estar
+# sano.
+#
+# Uso (dev-manager.sh start-all ya lo usa):
+#     cd ~/.config/qtile && python3 -m modules.stacks databases tools python
+#     python3 -m modules.stacks --depends python=databases --depends tools= ...
+####################################################
+
+import argparse
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+from .docker_api import DockerAPI, DockerError, stack_members
+
+
+# Quién espera a quién: los entornos de lenguaje se conectan a las bases
+# de datos (migraciones, tests), así que arrancan cuando estas están sanas
+DEFAULT_DEPENDS = {
+    "databases": [],
+    "tools": [],
+    "python": ["databases"],
+    "nodejs": ["databases"],
+    "java": ["databases"],
+    "golang": ["databases"],
+}
+
+
+def compose_command():
+    if shutil.which("docker-compose"):
+        return ["docker-compose"]
+    return ["docker", "compose"]
+
+
+def container_health(container):
+    """"ready", "starting" o "failed" según State y Status de la API"""
+    state = container.get("State")
+    status = container.get("Status", "")
+    if state in ("exited", "dead"):
+        return "failed"
+    if state != "running":
+        return "starting"       # created, restarting...
+    if "(unhealthy)" in status:
+        return "failed"
+    if "(health: starting)" in status:
+        return "starting"
+    return "ready"              # (healthy) o sin healthcheck
+
+
+class Stack:
+    def __init__(self, name, workdir, depends):
+        self.name = name
+        self.workdir = workdir
+        self.depends = depends
+        self.state = "pending"      # pending, starting, waiting, healthy, failed, skipped
+        self.started = None
+        self.elapsed = None
+        self.error = None
+        self.reported = False
+
+
+class StackStarter:
+    """Levanta los stacks por orden de dependencias y espera a que estén sanos"""
+
+    def __init__(self, stacks, containers_dir, depends=None, timeout=180, api=None):
+        depends = DEFAULT_DEPENDS if depends is None else depends
+        containers_dir = os.path.expanduser(containers_dir)
+        self.stacks = {
+            name: Stack(name, os.path.join(containers_dir, name),
+                        [d for d in depends.get(name, []) if d in stacks])
+            for name in stacks
+        }
+        self.timeout = timeout
+        self.api = api or DockerAPI()
+        self._queue = queue.Queue()
+
+    # ---------- hilos auxiliares ----------
+
+    def _watch_events(self):
+        filters = {"type": ["container"], "event": ["start", "die", "health_status"]}
+        try:
+            for event in self.api.events(filters):
+                self._queue.put(("event", event))
+        except DockerError as e:
+            self._queue.put(("events-error", str(e)))
+
+    def _compose_up(self, stack):
+        try:
+            result = subprocess.run(
+                compose_command() + ["up", "-d"],
+                cwd=stack.workdir, capture_output=True, text=True,
+            )
+        except OSError as e:
+            self._queue.put(("up", (stack, f"no se pudo lanzar docker-compose: {e}")))
+            return
+        error = None
+        if result.returncode != 0:
+            lines = result.stderr.strip().splitlines()
+            error = lines[-1] if lines else f"docker-compose salió con {result.returncode}"
+        self._queue.put(("up", (stack, error)))
+
+    # ---------- planificación ----------
+
+    def _launch_ready(self):
+        for stack in self.stacks.values():
+            if stack.state != "pending":
+                continue
+            deps = [self.stacks[d] for d in stack.depends]
+            if any(d.state in ("failed", "skipped") for d in deps):
+                stack.state = "skipped"
+                stack.error = "dependencia fallida: " + ", ".join(
+                    d.name for d in deps if d.state in ("failed", "skipped"))
+            elif all(d.state == "healthy" for d in deps):
+                stack.state = "starting"
+                stack.started = time.monotonic()
+                threading.Thread(target=self._compose_up, args=(stack,), daemon=True).start()
+
+    def _check_waiting(self):
+        waiting = [s for s in self.stacks.values() if s.state == "waiting"]
+        if not waiting:
+            return
+        containers = self.api.containers()
+        now = time.monotonic()
+        for stack in waiting:
+            members = stack_members(containers, stack.name, stack.workdir)
+            health = [container_health(c) for c in members]
+            if members and all(h == "ready" for h in health):
+                stack.state = "healthy"
+                stack.elapsed = now - stack.started
+            elif "failed" in health:
+                stack.state = "failed"
+                bad = [c["Names"][0].lstrip("/") for c, h in zip(members, health) if h == "failed"]
+                stack.error = "contenedor caído o unhealthy: " + ", ".join(bad)
+            elif now - stack.started > self.timeout:
+                stack.state = "failed"
+                stack.error = f"no estuvo sano en {self.timeout}s"
+
+    def _busy(self):
+        return any(s.state in ("pending", "starting", "waiting") for s in self.stacks.values())
+
+    def run(self, report=print):
+        # Suscribirse a los eventos ANTES de arrancar nada para no perder ninguno
+        threading.Thread(target=self._watch_events, daemon=True).start()
+        self._launch_ready()
+        while self._busy():
+            try:
+                kind, payload = self._queue.get(timeout=2)
+            except queue.Empty:
+                kind = "tick"       # por si se cortaron los eventos
+            if kind == "up":
+                stack, error = payload
+                if error is None:
+                    stack.state = "waiting"
+                    report(f"  ⏳ {stack.name}: contenedores creados, esperando healthchecks...")
+                else:
+                    stack.state = "failed"
+                    stack.error = error
+            self._check_waiting()
+            for stack in self.stacks.values():
+                if stack.state in ("healthy", "failed", "skipped") and not stack.reported:
+                    stack.reported = True
+                    report(self.describe(stack))
+            self._launch_ready()
+        return all(s.state == "healthy" for s in self.stacks.values())
+
+    @staticmethod
+    def describe(stack):
+        if stack.state == "healthy":
+            return f"  🟢 {stack.name}: sano en {stack.elapsed:.1f}s"
+        if stack.state == "skipped":
+            return f"  ⚪ {stack.name}: no se arrancó ({stack.error})"
+        return f"  🔴 {stack.name}: {stack.error}"
+
+
+def _parse_depends(items):
+    depends = dict(DEFAULT_DEPENDS)
+    for item in items:
+        name, _, deps = item.partition("=")
+        depends[name] = [d for d in deps.split(",") if d]
+    return depends
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Arranque de stacks por dependencias")
+    parser.add_argument("stacks", nargs="+")
+    parser.add_argument("--containers-dir",
+                        default=os.environ.get("DEV_CONTAINERS", "~/Development/containers"))
+    parser.add_argument("--depends", action="append", default=[], metavar="STACK=DEP1,DEP2",
+                        help="cambiar las dependencias de un stack (vacío = ninguna)")
+    parser.add_argument("--timeout", type=int, default=180,
+                        help="segundos máximos por stack hasta estar sano")
+    args = parser.parse_args(argv)
+
+    starter = StackStarter(args.stacks, args.containers_dir,
+                           _parse_depends(args.depends), args.timeout)
+    started = time.monotonic()
+    try:
+        ok = starter.run()
+    except DockerError as e:
+        print(f"stacks: {e}", file=sys.stderr)
+        return 1
+    print(f"  Total: {time.monotonic() - started:.1f}s")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
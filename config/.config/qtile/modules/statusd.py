@@ -0,0 +1,397 @@
+####################################################
+# Demonio de estado para la barra de dwm
+#
+# dwmbar/bar.sh lanzaba cada segundo clock.sh,
+# memoria.sh, wifi_ip.sh, disk_root.sh, volume.sh y
+# disk_home.sh, y cada uno lanzaba date, free, df, awk,
+# sed, pactl o hostname: cientos de procesos por minuto
+# solo para la barra, más un xsetroot por vuelta.
+#
+# Este demonio da la misma salida leyendo /proc y /sys
+# directamente, refresca cada segmento con su propio
+# intervalo y solo cambia el nombre de la ventana raíz
+# cuando el texto cambia.
+#
+# El volumen no se consulta: lo empuja VolumeMonitor
+# (modules/volume.py) cuando el servidor de audio avisa
+# de un cambio. Igual el estado git y los servicios del
+# perfil developer: los empujan RepoIndex (modules/repos.py)
+# y UnitMonitor (modules/units.py).
+#
+# Uso (bar.sh ya lo lanza si python3 está disponible):
+#     cd ~/.config/qtile && python3 -m modules.statusd
+#     python3 -m modules.statusd --profile developer   # bar_developer.sh
+#     python3 -m modules.statusd --stdout     # imprime en vez de xsetroot
+#     python3 -m modules.statusd --once       # una sola línea y sale
+#     pkill -USR1 -f modules.statusd          # refrescar todo ya
+#
+# No depende de libqtile: los segmentos también se pueden
+# importar desde la configuración de qtile.
+####################################################
+
+import argparse
+import fcntl
+import math
+import os
+import shutil
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+from .dbus_client import SYSTEM_BUS_SOCKET
+from .repos import RepoIndex
+from .sensors import LoadAverage, ProcFile, ThermalSensors, format_load, format_temp
+from .units import DEV_UNITS, UnitMonitor, format_services, query_states, write_states
+from .volume import VolumeMonitor, read_volume
+
+
+def human(n):
+    """Tamaño como lo muestran df -h y free -h (sin la "i"): 9.8G, 15G, 512M"""
+    for unit in ("B", "K", "M", "G", "T", "P"):
+        if n < 1024 or unit == "P":
+            break
+        n /= 1024
+    if unit == "B":
+        return f"{int(n)}B"
+    if n < 10:
+        return f"{math.ceil(n * 10) / 10:.1f}{unit}"
+    return f"{math.ceil(n)}{unit}"
+
+
+####################################################
+# Segmentos (misma salida que dwmbar/scripts/*.sh)
+
+_meminfo = ProcFile("/proc/meminfo")
+
+def memory():
+    info = {}
+    for line in _meminfo.read().splitlines():
+        key, value = line.split(":", 1)
+        info[key] = int(value.split()[0]) * 1024
+    total = info["MemTotal"]
+    used = total - info.get("MemAvailable", info["MemFree"])
+    return f" :{human(used)}/{human(total)} "
+
+
+def clock():
+    now = time.localtime()
+    hour = int(time.strftime("%I", now))
+    icon = chr(0xF144A + hour)
+    text = f" {time.strftime('%d/%m/%Y', now)} {icon} {time.strftime('%I:%M%p', now)}"
+    return " ".join(text.split())
+
+
+_SIOCGIFADDR = 0x8915
+
+def _ipv4_addresses():
+    addrs = []
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for iface in sorted(os.listdir("/sys/class/net")):
+            if iface == "lo":
+                continue
+            try:
+                req = struct.pack("256s", iface[:15].encode())
+                res = fcntl.ioctl(sock.fileno(), _SIOCGIFADDR, req)
+            except OSError:
+                continue        # interfaz sin IPv4
+            addrs.append(socket.inet_ntoa(res[20:24]))
+    return addrs
+
+
+def _ipv6_addresses():
+    addrs = []
+    try:
+        with open("/proc/net/if_inet6") as f:
+            for line in f:
+                hexaddr, _, _, scope, _, iface = line.split()
+                if iface == "lo" or scope != "00":
+                    continue    # solo direcciones globales, como hostname -I
+                raw = bytes.fromhex(hexaddr)
+                addrs.append(socket.inet_ntop(socket.AF_INET6, raw))
+    except FileNotFoundError:
+        pass
+    return addrs
+
+
+def wifi_ip():
+    return " ".join(f" :{' '.join(_ipv4_addresses() + _ipv6_addresses())}".split())
+
+
+def disk_root():
+    st = os.statvfs("/")
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    size = st.f_blocks * st.f_frsize
+    return f" {human(used)} / {human(size)} ^d^"
+
+
+def disk_home():
+    st = os.statvfs(os.path.expanduser("~"))
+    avail = st.f_bavail * st.f_frsize
+    size = st.f_blocks * st.f_frsize
+    return f" {human(avail)}/{human(size)}"
+
+
+def volume():
+    state = read_volume()
+    if state is None:
+        return ""
+    return format_volume(*state)
+
+
+def format_volume(percent, muted):
+    if muted:
+        return "  "
+    if percent > 100:
+        return "  100%"
+    if percent >= 50:
+        return f" \U000f057e {percent}%"
+    return f"  {percent}%"
+
+
+####################################################
+# Segmentos de bar_developer.sh
+
+def services():
+    # Lectura única (--once, SIGUSR1); en marcha normal el segmento lo
+    # actualiza UnitMonitor con las señales de systemd
+    return format_services(query_states())
+
+
+# Carga y temperatura con histéresis (ver modules/sensors.py)
+_load = LoadAverage()
+_thermal = None
+
+def load_average():
+    return format_load(_load.read())
+
+
+def cpu_temp():
+    global _thermal
+    if _thermal is None:
+        _thermal = ThermalSensors()
+    return format_temp(_thermal.read())
+
+
+def git_summary():
+    # Recorrido completo de una vez (--once, SIGUSR1); en marcha normal
+    # el segmento lo actualiza RepoIndex por inotify
+    index = RepoIndex()
+    index.scan()
+    return index.summary()
+
+
+def datetime_dev():
+    return time.strftime("📅%Y-%m-%d %H:%M")
+
+
+####################################################
+# Motor del demonio
+
+class Segment:
+    """Un bloque de la barra y cada cuánto se refresca
+
+    align=True alinea el refresco al reloj (el reloj cambia al minuto justo).
+    """
+
+    def __init__(self, name, render, interval, align=False):
+        self.name = name
+        self.render = render
+        self.interval = interval
+        self.align = align
+        self.text = ""
+        self.due = 0.0
+
+    def schedule(self, now):
+        delay = self.interval
+        if self.align:
+            delay = self.interval - (time.time() % self.interval)
+        self.due = now + delay
+
+
+class StatusDaemon:
+    """Refresca los segmentos que tocan y publica el texto si cambió
+
+    template: formato con los nombres de los segmentos, ej. "{mem} {clock}"
+    output: función que recibe el texto final (nombre de la raíz, stdout...)
+    """
+
+    def __init__(self, segments, template, output):
+        self.segments = {segment.name: segment for segment in segments}
+        self.template = template
+        self.output = output
+        self.last = None
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._forced = set()
+
+    def refresh(self, name=None):
+        """Pide refrescar un segmento (o todos); se puede llamar desde otro hilo"""
+        with self._lock:
+            self._forced.update([name] if name else self.segments)
+        self._wake.set()
+
+    def update(self, name, text):
+        """Publica un texto calculado fuera del demonio (proveedores por eventos)"""
+        with self._lock:
+            self.segments[name].text = text
+        self._wake.set()
+
+    def tick(self):
+        now = time.monotonic()
+        with self._lock:
+            forced, self._forced = self._forced, set()
+        for segment in self.segments.values():
+            if segment.interval is None and segment.name not in forced:
+                continue        # lo actualiza un proveedor con update()
+            if segment.name in forced or now >= segment.due:
+                try:
+                    segment.text = segment.render()
+                except Exception as e:
+                    print(f"statusd: {segment.name}: {e}", file=sys.stderr)
+                if segment.interval is not None:
+                    segment.schedule(now)
+
+        text = self.template.format(**{n: s.text for n, s in self.segments.items()})
+        if text != self.last:
+            self.output(text)
+            self.last = text
+        return text
+
+    def next_timeout(self):
+        dues = [s.due for s in self.segments.values() if s.interval is not None]
+        if not dues:
+            return None
+        return max(0.0, min(dues) - time.monotonic())
+
+    def run(self):
+        while True:
+            self.tick()
+            self._wake.wait(self.next_timeout())
+            self._wake.clear()
+
+
+class RootWindowName:
+    """Cambia WM_NAME de la ventana raíz (lo que hace xsetroot -name) sin procesos"""
+
+    def __init__(self):
+        try:
+            import xcffib
+            import xcffib.xproto
+        except ImportError:
+            self.conn = None
+            return
+        self.xproto = xcffib.xproto
+        self.conn = xcffib.connect()
+        self.root = self.conn.get_setup().roots[self.conn.pref_screen].root
+
+    def __call__(self, text):
+        if self.conn is None:
+            subprocess.run(["xsetroot", "-name", text])
+            return
+        data = text.encode()
+        self.conn.core.ChangeProperty(
+            self.xproto.PropMode.Replace, self.root,
+            self.xproto.Atom.WM_NAME, self.xproto.Atom.STRING,
+            8, len(data), data,
+        )
+        self.conn.flush()
+
+
+def basic_bar():
+    """Los segmentos y el formato de dwmbar/bar.sh"""
+    segments = [
+        Segment("clock", clock, 60, align=True),
+        Segment("mem", memory, 2),
+        Segment("wifi_ip", wifi_ip, 30),
+        Segment("disk_root", disk_root, 60),
+        # Sin intervalo: lo actualiza VolumeMonitor con cada evento de audio
+        Segment("vol", volume, None),
+        Segment("disk_home", disk_home, 60),
+    ]
+    # template = "{mem} {wifi_ip} {clock} {vol}"
+    template = "{mem} {clock} {vol}"
+    return segments, template
+
+
+def developer_bar():
+    """Los segmentos y el formato de dwmbar/bar_developer.sh"""
+    segments = [
+        # Sin intervalo: lo actualiza UnitMonitor cuando systemd avisa
+        Segment("services", services, None),
+        # Sin intervalo: lo actualiza RepoIndex cuando cambia un repo
+        Segment("git", git_summary, None),
+        Segment("load", load_average, 2),
+        Segment("temp", cpu_temp, 2),
+        Segment("mem", memory, 2),
+        Segment("disk_root", disk_root, 60),
+        Segment("wifi_ip", wifi_ip, 30),
+        Segment("vol", volume, None),
+        Segment("datetime", datetime_dev, 60, align=True),
+    ]
+    template = ("{services} | 📋{git} | ⚡{load} | {temp} | 🧠{mem} | "
+                "💾{disk_root} | 🌐{wifi_ip} | 🔊{vol} | {datetime}")
+    return segments, template
+
+
+PROFILES = {
+    "basic": basic_bar,
+    "developer": developer_bar,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barra de estado para dwm")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="basic")
+    parser.add_argument("--stdout", action="store_true",
+                        help="imprimir cada cambio en vez de fijar el nombre de la raíz")
+    parser.add_argument("--once", action="store_true",
+                        help="imprimir una sola línea y salir")
+    args = parser.parse_args(argv)
+
+    import locale
+    locale.setlocale(locale.LC_TIME, "")    # %p como lo muestra date
+
+    segments, template = PROFILES[args.profile]()
+    if args.once or args.stdout:
+        output = lambda text: print(text, flush=True)
+    else:
+        output = RootWindowName()
+    daemon = StatusDaemon(segments, template, output)
+    if args.once:
+        daemon.refresh()
+        daemon.tick()
+        return 0
+
+    if "vol" in daemon.segments:
+        if shutil.which("pactl"):
+            monitor = VolumeMonitor(
+                lambda percent, muted: daemon.update("vol", format_volume(percent, muted))
+            )
+            monitor.start()
+        else:
+            # Sin pactl no hay eventos: consultar cada 2 segundos
+            daemon.segments["vol"].interval = 2
+
+    if "services" in daemon.segments:
+        if os.path.exists(SYSTEM_BUS_SOCKET):
+            def on_units(states):
+                write_states(states)        # caché para los scripts
+                daemon.update("services", format_services(states))
+            UnitMonitor(DEV_UNITS, on_units).start()
+        else:
+            daemon.segments["services"].interval = 2
+
+    if "git" in daemon.segments:
+        repos = RepoIndex(on_change=lambda index: daemon.update("git", index.summary()))
+        repos.start()
+
+    signal.signal(signal.SIGUSR1, lambda *_: daemon.refresh())
+    daemon.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+####################################################
+# Registro de ventanas "sticky" (visibles en todos los grupos)
+#
+# Antes era una lista con búsquedas "in"/remove lineales
+# y en cada cambio de grupo se llamaba window.togroup()
+# para cada ventana, incluso las que ya estaban en el
+# grupo destino; cada togroup() hacía su propio
+# layout_all() y robaba el foco.
+#
+# Aquí el registro va por id de ventana (O(1) para
+# agregar, quitar y consultar), solo se mueven las
+# ventanas que no están ya en el grupo y ninguna le quita
+# el foco a la ventana del grupo destino (mientras se
+# mueve, can_steal_focus = False y _Group.add() solo
+# redistribuye, sin enfocar). qtile vuelve a
+# ejecutar este módulo en lazy.reload_config() (en el
+# mismo espacio de nombres), así que el registro que ya
+# existe se reusa y las ventanas siguen siendo sticky
+# después de recargar.
+####################################################
+
+from libqtile import qtile
+
+
+class StickyRegistry:
+
+    def __init__(self):
+        self._wids = {}     # wid -> None (conjunto ordenado)
+
+    def __contains__(self, window):
+        return window.wid in self._wids
+
+    def __len__(self):
+        return len(self._wids)
+
+    def add(self, window):
+        self._wids[window.wid] = None
+
+    def discard(self, window):
+        self._wids.pop(window.wid, None)
+
+    def toggle(self, window):
+        """Devuelve True si la ventana quedó sticky"""
+        if window.wid in self._wids:
+            del self._wids[window.wid]
+            return False
+        self._wids[window.wid] = None
+        return True
+
+    def windows(self):
+        for wid in list(self._wids):
+            window = qtile.windows_map.get(wid)
+            if window is None:
+                # La ventana ya no existe (p.ej. se cerró durante un reload)
+                del self._wids[wid]
+            else:
+                yield window
+
+    def follow(self, group):
+        """Lleva las ventanas sticky al grupo sin quitarle el foco a nadie"""
+        for window in self.windows():
+            old = window.group
+            if old is group:
+                continue
+            # Lo mismo que window.togroup(), sin enfocar la ventana movida
+            window.hide()
+            if old is not None:
+                if old.screen:
+                    window.x -= old.screen.x
+                old.remove(window)
+            if group.screen and window.x < group.screen.x:
+                window.x += group.screen.x
+            steal = window.can_steal_focus
+            window.can_steal_focus = False
+            try:
+                group.add(window)
+            finally:
+                window.can_steal_focus = steal
+
+
+sticky = globals().get("sticky") or StickyRegistry()
@@ -0,0 +1,278 @@
+####################################################
+# Selector de ventanas dentro de qtile, en orden MRU
+#
+# mod+alt+Tab (config.py) y mod+w (config_developer.py)
+# arrancaban un rofi nuevo en cada uso, y rofi volvía a
+# pedir al servidor X el título, la clase y el icono de
+# todas las ventanas antes de dibujar nada.
+#
+# Aquí el índice vive en qtile y se mantiene con los
+# hooks: client_focus pone la ventana delante,
+# client_name_updated cambia su título y client_killed
+# la quita. Abrir el selector solo es dibujar un Popup
+# que ya existe; cada tecla filtra (subsecuencia difusa,
+# empates por uso más reciente) y redibuja.
+#
+# Teclas con el selector abierto:
+#     escribir        filtrar
+#     Tab/↓  ↑        siguiente/anterior (el atajo otra vez también avanza)
+#     Return          ir a la ventana
+#     Escape          cerrar (también un clic en el popup)
+#
+# Si otra ventana toma el foco con el selector abierto
+# (un clic fuera), el selector se cierra.
+#
+# El popup lee las teclas como el widget Prompt, por la
+# ventana interna de X11; en Wayland se lanza el rofi de
+# siempre.
+####################################################
+
+import html
+from collections import OrderedDict
+
+from libqtile import hook, qtile
+from libqtile.lazy import lazy
+from libqtile.log_utils import logger
+
+
+STYLE = dict(
+    font="sans",
+    fontsize=13,
+    foreground="#E0DEF4",
+    background="#1F1D2E",
+    border="#00DC6C",
+    border_width=2,
+    opacity=0.95,
+    wrap=False,
+)
+SELECTED = "#00DC6C"
+WIDTH = 720
+ROWS = 14
+LINE_HEIGHT = 22
+PADDING = 10
+
+
+class _Entry:
+    __slots__ = ("window", "title", "wm_class", "key")
+
+    def __init__(self, window):
+        self.window = window
+        wm_class = window.get_wm_class() or []
+        self.wm_class = wm_class[-1] if wm_class else ""
+        self.rename(window.name or "")
+
+    def rename(self, title):
+        self.title = title
+        self.key = f"{self.title} {self.wm_class}".lower()
+
+
+def fuzzy_score(query, text):
+    """Puntuación de query como subsecuencia de text; None si no aparece
+
+    Premia las letras seguidas y las que empiezan palabra.
+    """
+    score = 0
+    position = 0
+    previous = -2
+    for char in query:
+        found = text.find(char, position)
+        if found < 0:
+            return None
+        if found == previous + 1:
+            score += 3
+        if found == 0 or not text[found - 1].isalnum():
+            score += 2
+        score -= (found - position) * 0.01
+        previous = found
+        position = found + 1
+    return score
+
+
+class WindowSwitcher:
+
+    def __init__(self):
+        self._entries = OrderedDict()   # wid -> _Entry, la más reciente primero
+        self._seeded = False
+        self.popup = None
+        self.shown = False
+        self.query = ""
+        self.matches = []
+        self.selected = 0
+        self._previous = None
+
+    # ---------- índice ----------
+
+    def subscribe(self):
+        """Hooks que mantienen el índice (qtile no repite una suscripción ya hecha)"""
+        hook.subscribe.client_focus(self._focused)
+        hook.subscribe.client_killed(self._killed)
+        hook.subscribe.client_name_updated(self._renamed)
+
+    def _visible(self, window):
+        # Sin grupo o en un ScratchPad (etiqueta vacía): no se puede ir a ella
+        return window.group is not None and bool(window.group.label)
+
+    def _entry(self, window):
+        entry = self._entries.get(window.wid)
+        if entry is None:
+            entry = self._entries[window.wid] = _Entry(window)
+        return entry
+
+    def _seed(self):
+        # La primera vez: las ventanas que ya había antes de los hooks
+        for window in qtile.windows_map.values():
+            if getattr(window, "group", None) is not None and hasattr(window, "get_wm_class"):
+                self._entry(window)
+        current = qtile.current_window
+        if current is not None:
+            self._focused(current)
+        self._seeded = True
+
+    def _focused(self, window):
+        if self.shown:
+            self._hide()        # el foco se fue a otra ventana: las teclas ya no llegan
+        self._entry(window)
+        self._entries.move_to_end(window.wid, last=False)
+
+    def _killed(self, window):
+        self._entries.pop(window.wid, None)
+
+    def _renamed(self, window):
+        entry = self._entries.get(window.wid)
+        if entry is not None:
+            entry.rename(window.name or "")
+
+    # ---------- popup ----------
+
+    def lazy_open(self, fallback=None):
+        return lazy.function(lambda qtile: self.open(fallback))
+
+    def open(self, fallback=None):
+        if qtile.core.name != "x11":
+            if fallback:
+                qtile.spawn(fallback)
+            return
+        if self.shown:
+            self.popup.win.focus(False)
+            self._move(1)           # el atajo repetido avanza, como alt+tab
+            return
+        if not self._seeded:
+            self._seed()
+        self._previous = qtile.current_window
+        self.query = ""
+        self._filter()
+        # Como alt+tab: empieza en la ventana anterior
+        self.selected = 1 if len(self.matches) > 1 else 0
+        self._show()
+
+    def _show(self):
+        screen = qtile.current_screen
+        height = ROWS * LINE_HEIGHT + 2 * PADDING + LINE_HEIGHT
+        if self.popup is None:
+            from libqtile.popup import Popup
+            self.popup = Popup(qtile, width=WIDTH, height=height, **STYLE)
+            self.popup.win.process_key_press = self._on_key
+            # Popup oculta la ventana con un clic y no sabría que está cerrado
+            self.popup.win.process_button_click = self._on_click
+        self.popup.x = screen.x + (screen.width - WIDTH) // 2
+        self.popup.y = screen.y + (screen.height - height) // 3
+        self.popup.place()
+        self.popup.unhide()
+        self.shown = True
+        self._draw()
+        self.popup.win.focus(False)
+
+    def _hide(self):
+        self.popup.hide()
+        self.shown = False
+
+    def _filter(self):
+        entries = [e for e in self._entries.values() if self._visible(e.window)]
+        if not self.query:
+            self.matches = entries
+        else:
+            scored = []
+            for rank, entry in enumerate(entries):
+                score = fuzzy_score(self.query, entry.key)
+                if score is not None:
+                    scored.append((-score, rank, entry))
+            self.matches = [entry for _, _, entry in sorted(scored, key=lambda s: s[:2])]
+        self.selected = 0
+
+    def _move(self, step):
+        if self.matches:
+            self.selected = (self.selected + step) % len(self.matches)
+        self._draw()
+
+    def _draw(self):
+        # Ventana de ROWS filas que sigue a la selección
+        first = max(0, min(self.selected - ROWS // 2, len(self.matches) - ROWS))
+        lines = [f"<b>❯ {html.escape(self.query)}</b>"
+                 f"<span alpha='50%'>  {len(self.matches)}/{len(self._entries)}</span>"]
+        for index in range(first, min(first + ROWS, len(self.matches))):
+            entry = self.matches[index]
+            group = entry.window.group.label or entry.window.group.name
+            text = (f"{html.escape(group)}  {html.escape(entry.title)}"
+                    f"<span alpha='60%'>  {html.escape(entry.wm_class)}</span>")
+            if index == self.selected:
+                text = f"<span foreground='{SELECTED}'><b>{text}</b></span>"
+            lines.append(text)
+        self.popup.clear()
+        self.popup.text = "\n".join(lines)
+        self.popup.draw_text(x=PADDING, y=PADDING)
+        self.popup.draw()
+
+    def _cancel(self):
+        self._hide()
+        if self._previous is not None and self._previous.group is not None:
+            self._previous.group.focus(self._previous)
+
+    def _on_click(self, x, y, button):
+        if button == 1:
+            self._cancel()
+
+    def _on_key(self, keysym, *args):
+        from libqtile.backend.x11.xkeysyms import keysyms
+        if keysym == keysyms["Escape"]:
+            self._cancel()
+        elif keysym in (keysyms["Return"], keysyms["KP_Enter"]):
+            self._hide()
+            if self.matches:
+                self._activate(self.matches[self.selected].window)
+        elif keysym in (keysyms["Tab"], keysyms["Down"]):
+            self._move(1)
+        elif keysym in (keysyms["ISO_Left_Tab"], keysyms["Up"]):
+            self._move(-1)
+        elif keysym == keysyms["BackSpace"]:
+            self.query = self.query[:-1]
+            self._filter()
+            self._draw()
+        elif 0x20 <= keysym <= 0x7e:
+            self.query += chr(keysym).lower()
+            self._filter()
+            self._draw()
+
+    def _activate(self, window):
+        group = window.group
+        try:
+            if group.screen is None:
+                qtile.current_screen.set_group(group)
+            elif group.screen is not qtile.current_screen:
+                qtile.focus_screen(group.screen.index)
+            window.minimized = False
+            group.focus(window)
+            if window.floating:
+                window.bring_to_front()
+        except Exception:
+            logger.exception("switcher: no se pudo ir a la ventana %s", window.name)
+
+
+# En un reload se crea otro selector: la ventana interna del popup anterior se
+# cierra y el índice MRU pasa al nuevo
+_previous_switcher = globals().get("window_switcher")
+window_switcher = WindowSwitcher()
+if _previous_switcher is not None:
+    if _previous_switcher.popup is not None:
+        _previous_switcher.popup.kill()
+    window_switcher._entries = _previous_switcher._entries
+    window_switcher._seeded = _previous_switcher._seeded
@@ -0,0 +1,216 @@
+####################################################
+# Estado de los servicios de desarrollo (systemd)
+#
+# bar_developer.sh lanzaba "systemctl is-active" para
+# docker, postgresql y redis-server cada 2 segundos, y
+# master-dev.sh, ~/.dev_logger y autostart_dev.sh
+# repetían las mismas consultas con sus propios procesos.
+#
+# UnitMonitor se suscribe una vez a systemd por D-Bus y
+# recibe PropertiesChanged de cada unidad: el mapa de
+# ActiveState queda en memoria sin consultar nada. El
+# mapa también se escribe en un archivo de estado en
+# $XDG_RUNTIME_DIR (tmpfs) para que los scripts lo lean
+# con builtins de bash (unit_active de units.sh), sin
+# lanzar ningún proceso.
+#
+# Uso desde la terminal:
+#     cd ~/.config/qtile && python3 -m modules.units docker redis-server
+#     python3 -m modules.units --serve    # solo el caché, sin barra
+####################################################
+
+import argparse
+import os
+import subprocess
+import sys
+import threading
+
+from .dbus_client import Connection, DBusError
+
+
+# Los servicios que muestran las barras de desarrollo
+DEV_SERVICES = (("🐳", "docker"), ("🐘", "postgresql"), ("📦", "redis-server"))
+DEV_UNITS = tuple(unit for _, unit in DEV_SERVICES)
+
+STATE_FILE = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or f"/tmp/dev-units-{os.getuid()}",
+    "dev-units.state",
+)
+
+_SYSTEMD = "org.freedesktop.systemd1"
+_UNIT_IFACE = "org.freedesktop.systemd1.Unit"
+
+
+def unit_path(unit):
+    """Ruta D-Bus de una unidad, con el mismo escape que usa systemd"""
+    if "." not in unit:
+        unit += ".service"
+    escaped = "".join(
+        c if c.isascii() and (c.isalpha() or (c.isdigit() and i > 0)) else f"_{ord(c):02x}"
+        for i, c in enumerate(unit)
+    )
+    return "/org/freedesktop/systemd1/unit/" + escaped
+
+
+def _active_state(conn, unit):
+    try:
+        return conn.get_property(_SYSTEMD, unit_path(unit), _UNIT_IFACE, "ActiveState")
+    except DBusError:
+        return "inactive"       # lo mismo que responde systemctl is-active
+
+
+def format_services(states):
+    """🐳🟢 🐘🔴 📦🔴, como check_service en bar_developer.sh"""
+    return " ".join(
+        f"{icon}{'🟢' if states.get(unit) == 'active' else '🔴'}"
+        for icon, unit in DEV_SERVICES
+    )
+
+
+####################################################
+# Archivo de estado para los scripts
+
+def write_states(states, path=STATE_FILE):
+    """Escribe el mapa de forma atómica; la primera línea es el pid del dueño"""
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}"
+    with open(tmp, "w") as f:
+        f.write(f"pid {os.getpid()}\n")
+        for unit, state in sorted(states.items()):
+            f.write(f"{unit} {state}\n")
+    os.replace(tmp, path)
+
+
+def read_states(path=STATE_FILE):
+    """El mapa guardado, o None si no existe o el proceso que lo escribía murió"""
+    try:
+        with open(path) as f:
+            lines = [line.split() for line in f if line.strip()]
+    except OSError:
+        return None
+    if not lines or lines[0][0] != "pid":
+        return None
+    try:
+        os.kill(int(lines[0][1]), 0)
+    except (OSError, ValueError):
+        return None
+    return {key: value for key, value in lines[1:]}
+
+
+def query_states(units=DEV_UNITS):
+    """ActiveState de cada unidad: caché, D-Bus directo o systemctl, en ese orden"""
+    states = read_states()
+    if states is not None and all(unit in states for unit in units):
+        return {unit: states[unit] for unit in units}
+    try:
+        conn = Connection()
+        try:
+            return {unit: _active_state(conn, unit) for unit in units}
+        finally:
+            conn.close()
+    except (OSError, ConnectionError, DBusError):
+        out = subprocess.run(
+            ["systemctl", "is-active", *units], capture_output=True, text=True,
+        ).stdout.split()
+        return dict(zip(units, out))
+
+
+####################################################
+# Monitor por señales
+
+class UnitMonitor:
+    """Sigue el ActiveState de unas unidades por señales de systemd
+
+    callback(estados) se llama desde el hilo del monitor con una copia del
+    mapa completo, al empezar y cada vez que alguna unidad cambia.
+    """
+
+    def __init__(self, units, callback, address=None):
+        self.units = tuple(units)
+        self.callback = callback
+        self.address = address
+        self.states = {}
+        self._conn = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="unit-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._conn is not None:
+            self._conn.close()
+
+    def _set(self, states):
+        states = {**self.states, **states}
+        if states != self.states:
+            self.states = states
+            self.callback(dict(states))
+
+    def _run(self):
+        backoff = 1
+        while not self._stopped.is_set():
+            try:
+                self._watch()
+            except (OSError, ConnectionError, DBusError) as e:
+                if self._stopped.is_set():
+                    return
+                print(f"units: {e}", file=sys.stderr)
+            else:
+                backoff = 1
+            # systemd o el bus se reiniciaron: esperar y volver a suscribirse
+            self._stopped.wait(backoff)
+            backoff = min(backoff * 2, 30)
+
+    def _watch(self):
+        conn = self._conn = Connection(self.address)
+        try:
+            # Sin Subscribe() systemd no emite las señales de las unidades
+            conn.call(_SYSTEMD, "/org/freedesktop/systemd1",
+                      "org.freedesktop.systemd1.Manager", "Subscribe")
+            paths = {unit_path(unit): unit for unit in self.units}
+            for path in paths:
+                conn.add_match(
+                    "type='signal',interface='org.freedesktop.DBus.Properties',"
+                    f"member='PropertiesChanged',path='{path}'"
+                )
+            self._set({unit: _active_state(conn, unit) for unit in self.units})
+            while not self._stopped.is_set():
+                signal = conn.next_signal()
+                unit = paths.get(signal.path)
+                if unit is None or signal.body[0] != _UNIT_IFACE:
+                    continue
+                changed, invalidated = signal.body[1], signal.body[2]
+                if "ActiveState" in changed:
+                    self._set({unit: changed["ActiveState"]})
+                elif "ActiveState" in invalidated:
+                    self._set({unit: _active_state(conn, unit)})
+        finally:
+            self._conn = None
+            conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Estado de los servicios de desarrollo")
+    parser.add_argument("units", nargs="*", default=list(DEV_UNITS))
+    parser.add_argument("--serve", action="store_true",
+                        help="mantener el caché de estado sin ninguna barra")
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        monitor = UnitMonitor(args.units, write_states)
+        monitor.start()
+        threading.Event().wait()
+
+    states = query_states(args.units)
+    for unit in args.units:
+        print(f"{unit} {states.get(unit, 'unknown')}")
+    # Igual que systemctl is-active: 0 solo si todas están activas
+    return 0 if all(states.get(unit) == "active" for unit in args.units) else 3
+
+
+if __name__ == "__main__":
+    sys.exit(main())
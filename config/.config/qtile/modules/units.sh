@@ -0,0 +1,25 @@
+####################################################
+# unit_active para los scripts de bash
+#
+# Lee el archivo de estado que mantiene units.py
+# (UnitMonitor) con builtins, sin lanzar procesos; si no
+# hay caché vivo, pregunta a systemctl. Lo cargan
+# bar_developer.sh, autostart_dev.sh, ~/.dev_logger y
+# master-dev.sh:
+#     . ~/.config/qtile/modules/units.sh
+#     unit_active docker && echo "docker corre"
+####################################################
+
+unit_active() {
+    local state_file="${XDG_RUNTIME_DIR:-/tmp/dev-units-$UID}/dev-units.state"
+    local key value
+    if [ -r "$state_file" ]; then
+        while read -r key value; do
+            case "$key" in
+                pid) kill -0 "$value" 2>/dev/null || break ;;
+                "$1") [ "$value" = "active" ]; return ;;
+            esac
+        done < "$state_file"
+    fi
+    systemctl is-active --quiet "$1" 2>/dev/null
+}
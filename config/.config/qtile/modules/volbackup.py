@@ -0,0 +1,437 @@
+####################################################
+# Backup de los volúmenes de datos con deduplicación
+#
+# backup_volumes de dev-manager.sh lanzaba cuatro
+# "docker run alpine tar czf" uno detrás de otro: gzip
+# en un solo hilo y copia completa cada noche aunque
+# la base de datos apenas hubiera cambiado.
+#
+# Aquí los volúmenes se leen a la vez, cada uno como un
+# flujo tar que se trocea sobre la marcha: cada archivo
+# del volumen empieza un trozo nuevo y se parte en
+# bloques de 4 MiB según su propio offset, así que un
+# archivo que crece o cambia no desplaza los trozos de
+# los demás (y las bases de datos reescriben páginas en
+# su sitio). Cada trozo se guarda una sola vez, por su
+# sha256, comprimido con zstd (o zlib si no está el
+# módulo zstandard) en varios hilos. Cada backup es un
+# manifiesto con la lista de archivos y trozos.
+#
+# Almacén: ~/Development/backups/store
+#     chunks/ab/abcdef...     trozos comprimidos
+#     manifests/<fecha>/<volumen>.json
+#
+# Restaurar no toca el volumen hasta el final: primero
+# se comprueba que estén todos los trozos, el contenido se
+# extrae a un directorio aparte dentro del volumen y solo
+# si llegó entero sustituye al actual.
+#
+# Uso (dev-manager.sh backup / restore):
+#     cd ~/.config/qtile && python3 -m modules.volbackup backup --project databases
+#     python3 -m modules.volbackup backup databases_postgres-data ...
+#     python3 -m modules.volbackup list
+#     python3 -m modules.volbackup restore 20250101-030000 [volúmenes]
+#     python3 -m modules.volbackup prune --keep 7
+####################################################
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from .docker_api import DockerAPI, DockerError
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+STORE_DIR = "~/Development/backups/store"
+CHUNK_SIZE = 4 * 1024 * 1024
+HELPER_IMAGE = "alpine"
+
+# Campos de la cabecera tar que se guardan en el manifiesto
+_TAR_FIELDS = ("name", "mode", "uid", "gid", "size", "mtime", "linkname",
+               "uname", "gname", "devmajor", "devminor")
+
+
+class BackupError(Exception):
+    pass
+
+
+####################################################
+# Almacén de trozos
+
+class ChunkStore:
+    """Trozos comprimidos direccionados por el sha256 de su contenido"""
+
+    def __init__(self, root=STORE_DIR, jobs=None):
+        self.root = os.path.expanduser(root)
+        self.chunks_dir = os.path.join(self.root, "chunks")
+        self.manifests_dir = os.path.join(self.root, "manifests")
+        self.pool = ThreadPoolExecutor(jobs or os.cpu_count() or 2)
+        self._lock = threading.Lock()
+        self.written = 0            # bytes comprimidos escritos en esta ejecución
+        self.reused = 0             # bytes sin comprimir que ya estaban
+
+    def _path(self, digest):
+        return os.path.join(self.chunks_dir, digest[:2], digest)
+
+    @staticmethod
+    def _compress(data):
+        if zstandard is not None:
+            return b"Z" + zstandard.ZstdCompressor(level=3).compress(data)
+        return b"z" + zlib.compress(data, 6)
+
+    @staticmethod
+    def _decompress(blob):
+        if blob[:1] == b"Z":
+            if zstandard is None:
+                raise BackupError("el backup usa zstd: instala python3-zstandard")
+            return zstandard.ZstdDecompressor().decompress(blob[1:])
+        return zlib.decompress(blob[1:])
+
+    def _put(self, data):
+        # sha256 y la compresión sueltan el GIL: los hilos trabajan en paralelo
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if os.path.exists(path):
+            with self._lock:
+                self.reused += len(data)
+            return digest
+        blob = self._compress(data)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+        with self._lock:
+            self.written += len(blob)
+        return digest
+
+    def put(self, data):
+        return self.pool.submit(self._put, data)
+
+    def get(self, digest):
+        try:
+            with open(self._path(digest), "rb") as f:
+                data = self._decompress(f.read())
+        except FileNotFoundError:
+            raise BackupError(f"falta el trozo {digest}") from None
+        except (zlib.error, ValueError) as e:     # ZstdError hereda de ValueError
+            raise BackupError(f"trozo {digest} ilegible: {e}") from None
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise BackupError(f"trozo {digest} corrupto")
+        return data
+
+    def missing(self, digests):
+        return [digest for digest in digests if not os.path.exists(self._path(digest))]
+
+    # ---------- manifiestos ----------
+
+    def backups(self):
+        try:
+            return sorted(os.listdir(self.manifests_dir))
+        except FileNotFoundError:
+            return []
+
+    def manifest_path(self, backup, volume):
+        return os.path.join(self.manifests_dir, backup, f"{volume}.json")
+
+    def load_manifest(self, backup, volume):
+        try:
+            with open(self.manifest_path(backup, volume)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise BackupError(f"{volume} no está en el backup {backup}") from None
+
+    def save_manifest(self, backup, volume, manifest):
+        path = self.manifest_path(backup, volume)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "w") as f:
+            json.dump(manifest, f)
+        os.replace(path + ".tmp", path)
+
+    def volumes(self, backup):
+        return sorted(name[:-len(".json")] for name in os.listdir(os.path.join(self.manifests_dir, backup))
+                      if name.endswith(".json"))
+
+    def close(self):
+        self.pool.shutdown()
+
+
+####################################################
+# Backup
+
+def _docker_tar(volume):
+    return subprocess.Popen(
+        ["docker", "run", "--rm", "-v", f"{volume}:/data:ro", HELPER_IMAGE,
+         "tar", "cf", "-", "-C", "/", "data"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+
+
+def _member_info(member):
+    info = {field: getattr(member, field) for field in _TAR_FIELDS}
+    info["type"] = member.type.decode()
+    if member.pax_headers:
+        info["pax"] = member.pax_headers
+    return info
+
+
+def backup_volume(store, volume, backup, max_pending=8):
+    """Trocea el tar del volumen y guarda su manifiesto; devuelve los bytes leídos"""
+    proc = _docker_tar(volume)
+    files = []
+    pending = []                # (lista de trozos del archivo, futuro) en vuelo
+    total = 0
+    tar_error = None
+    try:
+        with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+            for member in tar:
+                entry = _member_info(member)
+                entry["chunks"] = []
+                files.append(entry)
+                if not member.isfile():
+                    continue
+                data = tar.extractfile(member)
+                while True:
+                    piece = data.read(CHUNK_SIZE)
+                    if not piece:
+                        break
+                    total += len(piece)
+                    entry["chunks"].append(None)
+                    pending.append((entry["chunks"], len(entry["chunks"]) - 1, store.put(piece)))
+                    # No acumular en memoria más trozos de los que se comprimen
+                    while len(pending) >= max_pending:
+                        chunks, index, future = pending.pop(0)
+                        chunks[index] = future.result()
+    except tarfile.TarError as e:
+        tar_error = e
+        proc.stdout.close()
+    finally:
+        for chunks, index, future in pending:
+            chunks[index] = future.result()
+        stderr = proc.stderr.read().decode(errors="replace").strip()
+        proc.wait()
+    # Si docker falló, su mensaje explica más que el del tar cortado
+    if proc.returncode != 0:
+        raise BackupError(f"{volume}: {stderr or f'docker salió con {proc.returncode}'}")
+    if tar_error is not None:
+        raise BackupError(f"{volume}: tar ilegible ({tar_error})")
+
+    store.save_manifest(backup, volume, {
+        "volume": volume, "created": time.time(), "bytes": total, "files": files,
+    })
+    return total
+
+
+####################################################
+# Restauración
+
+def _tarinfo(entry):
+    member = tarfile.TarInfo(entry["name"])
+    for field in _TAR_FIELDS:
+        setattr(member, field, entry[field])
+    member.type = entry["type"].encode()
+    member.pax_headers = entry.get("pax", {})
+    return member
+
+
+class _ChunkReader:
+    """Archivo de solo lectura que va descomprimiendo sus trozos en orden"""
+
+    def __init__(self, store, digests):
+        self.store = store
+        self.digests = iter(digests)
+        self.buffer = b""
+
+    def read(self, size=-1):
+        while size < 0 or len(self.buffer) < size:
+            digest = next(self.digests, None)
+            if digest is None:
+                break
+            self.buffer += self.store.get(digest)
+        if size < 0:
+            size = len(self.buffer)
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+
+# Se extrae en $T; solo si el tar terminó con la marca de RESTORE_DONE (la
+# última entrada, que se escribe cuando todos los trozos se leyeron bien) se
+# vacía /data y se mueve ahí lo extraído. Si no, /data queda como estaba.
+RESTORE_DONE = "volbackup-restore.ok"
+_RESTORE_SCRIPT = f"""
+T=/data/.volbackup-restore
+rm -rf "$T" && mkdir "$T" || exit 1
+if ! tar xf - -C "$T" || [ ! -f "$T/{RESTORE_DONE}" ] || [ ! -d "$T/data" ]; then
+    rm -rf "$T"
+    echo "restauración incompleta: el volumen no se tocó" >&2
+    exit 1
+fi
+find /data -mindepth 1 -maxdepth 1 ! -name .volbackup-restore -exec rm -rf {{}} + &&
+find "$T/data" -mindepth 1 -maxdepth 1 -exec mv {{}} /data/ \; &&
+chown "$(stat -c %u:%g "$T/data")" /data && chmod "$(stat -c %a "$T/data")" /data &&
+rm -rf "$T"
+"""
+
+
+def restore_volume(store, volume, backup):
+    """Sustituye el contenido del volumen por el del backup
+
+    Necesita espacio libre en el volumen para una copia más mientras dura.
+    """
+    manifest = store.load_manifest(backup, volume)
+    missing = store.missing(d for entry in manifest["files"] for d in entry["chunks"])
+    if missing:
+        raise BackupError(f"{volume}: faltan {len(missing)} trozos del backup {backup} "
+                          f"(p.ej. {missing[0]}); el volumen no se tocó")
+    proc = subprocess.Popen(
+        ["docker", "run", "--rm", "-i", "-v", f"{volume}:/data", HELPER_IMAGE,
+         "sh", "-c", _RESTORE_SCRIPT],
+        stdin=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    try:
+        with tarfile.open(fileobj=proc.stdin, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+            for entry in manifest["files"]:
+                member = _tarinfo(entry)
+                reader = _ChunkReader(store, entry["chunks"]) if member.isfile() else None
+                tar.addfile(member, reader)
+            tar.addfile(tarfile.TarInfo(RESTORE_DONE))
+    except BrokenPipeError:
+        pass                    # docker terminó antes: el error sale abajo
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        stderr = proc.stderr.read().decode(errors="replace").strip()
+        proc.wait()
+    if proc.returncode != 0:
+        raise BackupError(f"{volume}: {stderr or f'docker salió con {proc.returncode}'}")
+    return manifest["bytes"]
+
+
+####################################################
+# Limpieza
+
+def prune(store, keep):
+    """Deja los últimos `keep` backups y borra los trozos que nadie usa"""
+    backups = store.backups()
+    for backup in backups[:-keep] if keep > 0 else backups:
+        shutil.rmtree(os.path.join(store.manifests_dir, backup))
+    used = set()
+    for backup in store.backups():
+        for volume in store.volumes(backup):
+            for entry in store.load_manifest(backup, volume)["files"]:
+                used.update(entry["chunks"])
+    freed = 0
+    for dirpath, _, names in os.walk(store.chunks_dir):
+        for name in names:
+            if name not in used:
+                path = os.path.join(dirpath, name)
+                freed += os.path.getsize(path)
+                os.unlink(path)
+    return freed
+
+
+def compose_volumes(project):
+    """Volúmenes de un proyecto de docker-compose, con el prefijo que les puso"""
+    api = DockerAPI()
+    try:
+        return api.volumes(f"com.docker.compose.project={project}")
+    except DockerError as e:
+        raise BackupError(str(e)) from None
+    finally:
+        api.close()
+
+
+def format_size(n):
+    """1.5 MiB, 300 B..."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if n < 1024 or unit == "GiB":
+            return f"{n:.1f} {unit}" if unit != "B" else f"{n} B"
+        n /= 1024
+
+
+def _run_parallel(volumes, fn):
+    """fn(volumen) para todos los volúmenes a la vez; devuelve errores"""
+    errors = []
+    with ThreadPoolExecutor(len(volumes)) as pool:
+        futures = {volume: pool.submit(fn, volume) for volume in volumes}
+        for volume, future in futures.items():
+            try:
+                print(f"  {volume}: {format_size(future.result())}")
+            except BackupError as e:
+                errors.append(str(e))
+    return errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backup deduplicado de volúmenes de Docker")
+    parser.add_argument("--store", default=STORE_DIR)
+    parser.add_argument("--jobs", type=int, default=None, help="hilos de compresión")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("backup")
+    p.add_argument("volumes", nargs="*")
+    p.add_argument("--project", help="también los volúmenes de este proyecto de docker-compose")
+    sub.add_parser("list")
+    p = sub.add_parser("restore")
+    p.add_argument("backup", help="fecha del backup (ver list) o 'latest'")
+    p.add_argument("volumes", nargs="*", help="por defecto, todos los del backup")
+    p = sub.add_parser("prune")
+    p.add_argument("--keep", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    store = ChunkStore(args.store, args.jobs)
+    started = time.monotonic()
+    try:
+        if args.command == "backup":
+            volumes = list(args.volumes)
+            if args.project:
+                volumes += compose_volumes(args.project)
+            if not volumes:
+                raise BackupError("no hay volúmenes que guardar")
+            backup = time.strftime("%Y%m%d-%H%M%S")
+            errors = _run_parallel(volumes, lambda v: backup_volume(store, v, backup))
+            print(f"  Backup {backup}: {format_size(store.written)} nuevos, "
+                  f"{format_size(store.reused)} ya guardados, {time.monotonic() - started:.1f}s")
+        elif args.command == "restore":
+            backups = store.backups()
+            backup = backups[-1] if args.backup == "latest" and backups else args.backup
+            if backup not in backups:
+                raise BackupError(f"no existe el backup {args.backup}")
+            volumes = args.volumes or store.volumes(backup)
+            errors = _run_parallel(volumes, lambda v: restore_volume(store, v, backup))
+            print(f"  Restaurado {backup} en {time.monotonic() - started:.1f}s")
+        elif args.command == "list":
+            errors = []
+            for backup in store.backups():
+                volumes = store.volumes(backup)
+                total = sum(store.load_manifest(backup, v)["bytes"] for v in volumes)
+                print(f"{backup}  {format_size(total):>10}  {' '.join(volumes)}")
+        else:
+            errors = []
+            print(f"  Liberados {format_size(prune(store, args.keep))}")
+    except BackupError as e:
+        errors = [str(e)]
+    finally:
+        store.close()
+
+    for error in errors:
+        print(f"volbackup: {error}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+####################################################
+# Volumen por eventos (PipeWire / PulseAudio)
+#
+# volume.sh llamaba dos veces a "pactl list sinks" y
+# buscaba el texto traducido "Volumen:" cada segundo, y
+# widget.Volume de qtile consultaba amixer por su lado.
+#
+# VolumeMonitor deja un solo "pactl subscribe" abierto
+# (pipewire-pulse lo entiende) y solo lee el volumen
+# cuando llega un evento del sink o del servidor (tecla
+# de volumen, cambio de salida...). Sin cambios no se
+# consulta nada. El último estado queda en .state y se
+# avisa al callback solo si cambió. Sin pactl (no viene
+# con pipewire) no hay eventos: se lee con wpctl cada
+# POLL_INTERVAL segundos, como hace statusd.
+#
+# No depende de libqtile: lo usan tanto statusd (dwm)
+# como el muestreador de la barra de qtile.
+####################################################
+
+import re
+import subprocess
+import sys
+import threading
+
+
+_RE_WPCTL = re.compile(r"Volume:\s*([\d.]+)(\s*\[MUTED\])?")
+# "Event 'change' on sink #54" o "... on server #..."; no "sink-input"
+_RE_EVENT = re.compile(r"on (?:sink|server) #")
+POLL_INTERVAL = 2
+
+
+def read_volume():
+    """(porcentaje, silenciado) del sink por defecto, o None si no hay audio"""
+    try:
+        out = subprocess.run(
+            ["wpctl", "get-volume", "@DEFAULT_AUDIO_SINK@"],
+            capture_output=True, text=True,
+        ).stdout
+    except FileNotFoundError:
+        return None
+    m = _RE_WPCTL.search(out)
+    if m is None:
+        return None
+    return round(float(m.group(1)) * 100), bool(m.group(2))
+
+
+class VolumeMonitor:
+    """Escucha los eventos del servidor de audio y avisa cuando cambia el volumen
+
+    callback(porcentaje, silenciado) se llama desde el hilo del monitor.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.state = None
+        self._proc = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="volume-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._proc is not None:
+            self._proc.terminate()
+
+    def _emit(self):
+        state = read_volume()
+        if state is not None and state != self.state:
+            self.state = state
+            self.callback(*state)
+
+    def _run(self):
+        backoff = 1
+        while not self._stopped.is_set():
+            # Estado inicial (y después de reiniciar pipewire)
+            self._emit()
+            try:
+                self._proc = subprocess.Popen(
+                    ["pactl", "subscribe"],
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+                )
+            except FileNotFoundError:
+                print(f"volume: pactl no está instalado (pulseaudio-utils), leyendo "
+                      f"cada {POLL_INTERVAL}s", file=sys.stderr)
+                self._poll()
+                return
+            for line in self._proc.stdout:
+                if _RE_EVENT.search(line):
+                    self._emit()
+                    backoff = 1
+            self._proc.wait()
+            # El servidor de audio se reinició: esperar y volver a suscribirse
+            self._stopped.wait(backoff)
+            backoff = min(backoff * 2, 30)
+
+    def _poll(self):
+        while not self._stopped.wait(POLL_INTERVAL):
+            self._emit()
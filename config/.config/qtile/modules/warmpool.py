@@ -0,0 +1,204 @@
+####################################################
+# Ventanas precalentadas en un ScratchPad
+#
+# mod+Return abría un terminator/alacritty nuevo cada
+# vez, y los clics en CPU/RAM de la barra (open_btop) y
+# mod+m/mod+shift+m un "alacritty -e btop/htop" nuevo:
+# cientos de ms de arranque de terminal antes de ver
+# nada.
+#
+# Aquí cada pool tiene ya arrancadas, ocultas en el
+# ScratchPad "warm", las instancias que se le pidan.
+# Mostrar una es moverla al grupo actual (un solo map);
+# el pool se rellena solo un momento después, para no
+# competir con la ventana que se acaba de abrir. Si la
+# memoria disponible baja de LOW_AVAILABLE se cierran las
+# instancias ocultas y no se rellena hasta que supera
+# HIGH_AVAILABLE (se usa la lectura de memoria del
+# muestreador compartido, la misma del widget).
+#
+# Las ventanas del pool se reconocen por el pid del
+# proceso lanzado (_NET_WM_PID); si un programa no lo
+# pone, su ventana se queda como una ventana normal; por
+# eso los programas de instancia única (terminator sin
+# -u) no sirven: la ventana nueva lleva el pid del primer
+# proceso.
+#
+# qtile vuelve a ejecutar este módulo en reload_config():
+# el registro que ya existe se reusa, con las ventanas
+# ocultas que ya tenía, y resume() desde el cuerpo de la
+# configuración lo vuelve a poner en marcha (en un
+# reload startup_complete no llega).
+#
+# En la configuración:
+#     warm_pools.add("terminal", terminal, size=1)
+#     Key([mod], "Return", warm_pools.lazy_show("terminal")),
+#     groups.append(ScratchPad(warm_pools.group, []))
+#     warm_pools.resume()
+# y los hooks client_new -> claim(), client_killed ->
+# discard() y startup_complete -> start().
+####################################################
+
+import time
+
+from libqtile import qtile
+from libqtile.lazy import lazy
+from libqtile.log_utils import logger
+
+from .sampler import sampler
+
+
+# Fracción de memoria disponible (con histéresis)
+LOW_AVAILABLE = 0.10
+HIGH_AVAILABLE = 0.15
+MEMORY_INTERVAL = 30
+# Segundos tras usar una instancia antes de lanzar la siguiente
+REFILL_DELAY = 1.0
+# Un proceso que no abre ventana en este tiempo deja de esperarse
+PENDING_TIMEOUT = 15.0
+
+
+class WarmPool:
+
+    def __init__(self, name, command, size):
+        self.name = name
+        self.command = command
+        self.size = size
+        self.idle = []          # ventanas ocultas, la más antigua primero
+        self.pending = {}       # pid -> cuándo se lanzó
+
+    def expire(self, now):
+        for pid, started in list(self.pending.items()):
+            if now - started > PENDING_TIMEOUT:
+                del self.pending[pid]
+
+    @property
+    def missing(self):
+        return self.size - len(self.idle) - len(self.pending)
+
+
+class WarmPools:
+
+    def __init__(self, group="warm"):
+        self.group = group
+        self.pools = {}
+        self._owners = {}       # wid -> pool de las ventanas ocultas
+        self._refill = None
+        self.pressure = False
+        self.started = False
+
+    def add(self, name, command, size=1):
+        """Declara un pool; en un reload solo actualiza comando y tamaño"""
+        pool = self.pools.get(name)
+        if pool is None:
+            pool = self.pools[name] = WarmPool(name, command, size)
+        else:
+            pool.command, pool.size = command, size
+        return pool
+
+    # ---------- hooks ----------
+
+    def start(self):
+        """startup_complete: suscribirse a la memoria y llenar los pools"""
+        # Tras un restart quedan en el ScratchPad ventanas de las que ya no sabemos nada
+        group = qtile.groups_map.get(self.group)
+        if group is not None:
+            for window in list(group.windows):
+                if window.wid not in self._owners:
+                    window.kill()
+        sampler.subscribe("memory", self._on_memory, MEMORY_INTERVAL)
+        self.started = True
+        self.fill()
+
+    def resume(self):
+        """Cuerpo de la configuración: en un reload, adoptar y rellenar otra vez
+
+        Al arrancar qtile todavía no hay grupos; ahí lo hace start().
+        """
+        if self.started:
+            self.start()
+
+    def claim(self, window):
+        """client_new: oculta la ventana si la lanzó un pool; True si era suya"""
+        pid = window.get_pid()
+        for pool in self.pools.values():
+            if pool.pending.pop(pid, None) is not None:
+                if self.pressure:
+                    window.kill()       # arrancó antes de vaciar los pools
+                    return True
+                window.togroup(self.group)
+                pool.idle.append(window)
+                self._owners[window.wid] = pool
+                return True
+        return False
+
+    def discard(self, window):
+        """client_killed: una instancia oculta que se cerró sola"""
+        pool = self._owners.pop(window.wid, None)
+        if pool is not None:
+            pool.idle.remove(window)
+            self._schedule_fill()
+
+    # ---------- uso ----------
+
+    def show(self, name):
+        pool = self.pools[name]
+        if not pool.idle:
+            # Pool vacío (recién arrancado o con poca memoria): como antes
+            qtile.spawn(pool.command)
+            self._schedule_fill()
+            return
+        window = pool.idle.pop(0)
+        del self._owners[window.wid]
+        group = qtile.current_group
+        window.togroup(group.name)
+        group.focus(window)
+        self._schedule_fill()
+
+    def lazy_show(self, name):
+        return lazy.function(lambda qtile: self.show(name))
+
+    def fill(self):
+        self._refill = None
+        if self.pressure:
+            return
+        now = time.monotonic()
+        for pool in self.pools.values():
+            pool.expire(now)
+            for _ in range(pool.missing):
+                pid = qtile.spawn(pool.command)
+                if pid is None or pid < 0:
+                    logger.warning("warmpool: no se pudo lanzar %r", pool.command)
+                    break
+                pool.pending[pid] = now
+
+    def shrink(self):
+        """Cierra las instancias ocultas (las que aún arrancan, al llegar)"""
+        for pool in self.pools.values():
+            for window in pool.idle:
+                self._owners.pop(window.wid, None)
+                window.kill()
+            pool.idle.clear()
+
+    def _schedule_fill(self):
+        if self._refill is None:
+            self._refill = qtile.call_later(REFILL_DELAY, self.fill)
+
+    def _on_memory(self, sample):
+        if isinstance(sample, Exception):
+            return
+        mem, _ = sample
+        available = mem.available / mem.total
+        if not self.pressure and available < LOW_AVAILABLE:
+            logger.warning("warmpool: %.0f%% de memoria disponible, vaciando los pools",
+                           available * 100)
+            self.pressure = True
+            self.shrink()
+        elif self.pressure and available > HIGH_AVAILABLE:
+            self.pressure = False
+            self.fill()
+
+
+# Reusar el registro en un reload (el módulo se vuelve a ejecutar en el mismo
+# espacio de nombres): las ventanas ocultas siguen siendo del pool
+warm_pools = globals().get("warm_pools") or WarmPools()
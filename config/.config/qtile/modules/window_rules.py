@@ -0,0 +1,209 @@
+####################################################
+# Motor de reglas de ventanas indexado
+#
+# Con Group.matches y float_rules qtile recorre cada
+# Match en orden y cada Match vuelve a pedir wm_class,
+# título o rol al servidor X. Con ~40 reglas y una
+# sesión que abre 60 ventanas de golpe eso son miles de
+# consultas. Aquí las reglas se compilan una vez:
+#
+# - Match(wm_class="x"), role, title y wm_type con texto
+#   exacto van a un diccionario (una búsqueda por valor)
+# - las reglas "contiene" (ej. "pycharm" dentro del
+#   wm_class) se juntan en una sola expresión regular
+#   con alternativas por campo
+# - los Match compuestos de textos exactos (ej. wm_class
+#   y title) se indexan por uno de sus campos y el resto
+#   se compara con las propiedades ya leídas
+# - solo los Match con func/regex se evalúan como antes,
+#   y solo si pueden ganar
+#
+# Las propiedades de cada ventana se leen una sola vez,
+# la primera vez que alguna regla las necesita.
+####################################################
+
+import re
+
+
+# Campos que se pueden indexar cuando la regla es un texto exacto
+_INDEXED = ("wm_class", "wm_instance_class", "role", "title", "wm_type")
+
+
+class _Props:
+    """Propiedades de una ventana, leídas del servidor X bajo demanda"""
+
+    def __init__(self, client):
+        self.client = client
+        self._cache = {}
+
+    def get(self, field):
+        if field not in self._cache:
+            client = self.client
+            if field == "wm_class":
+                value = tuple(client.get_wm_class() or ())
+            elif field == "wm_instance_class":
+                wm_class = self.get("wm_class")
+                value = wm_class[0] if wm_class else None
+            elif field == "role":
+                value = client.get_wm_role()
+            elif field == "wm_type":
+                value = client.get_wm_type()
+            else:
+                value = client.name
+            self._cache[field] = value
+        return self._cache[field]
+
+    def values(self, field):
+        # wm_class es una lista (instancia, clase); el resto un solo valor
+        value = self.get(field)
+        if value is None:
+            return ()
+        if field == "wm_class":
+            return value
+        return (value,)
+
+
+# Propiedades de las ventanas que se están gestionando: client_new y la
+# comprobación de float_rules comparten la misma lectura. Se liberan
+# con release() en el hook client_managed.
+_pending = {}
+
+def props(client):
+    p = _pending.get(client.wid)
+    if p is None:
+        if len(_pending) > 256:
+            # Ventanas que nunca llegaron a client_managed
+            _pending.clear()
+        p = _pending[client.wid] = _Props(client)
+    return p
+
+
+def release(client):
+    _pending.pop(client.wid, None)
+
+
+class RuleIndex:
+    """Reglas compiladas: classify(ventana) devuelve la acción de la primera regla
+
+    Las reglas se agregan en orden de prioridad con add_match() o
+    add_substring(); la acción puede ser cualquier valor (nombre de
+    grupo, True para flotar...).
+    """
+
+    def __init__(self, name="reglas"):
+        self.name = name
+        self._seq = 0
+        self._exact = {}        # (campo, valor) -> (prioridad, acción)
+        self._compound = {}     # (campo, valor) -> [(prioridad, reglas, acción)]
+        self._substrings = {}   # campo -> [(prioridad, texto, acción)]
+        self._fallback = []     # [(prioridad, Match, acción)]
+        self._regex = {}        # campo -> (regex, {grupo: (prioridad, acción)})
+        self._fields = set()
+
+    def add_match(self, match, action):
+        self._seq += 1
+        rules = match._rules
+        plain = rules and all(
+            field in _INDEXED and isinstance(value, str)
+            for field, value in rules.items()
+        )
+        if not plain:
+            self._fallback.append((self._seq, match, action))
+        elif len(rules) == 1:
+            # La primera regla con ese valor tiene prioridad
+            key = next(iter(rules.items()))
+            self._exact.setdefault(key, (self._seq, action))
+            self._fields.add(key[0])
+        else:
+            # Se indexa por el campo más selectivo; el resto se comprueba
+            # solo cuando ese campo coincide
+            field = next(f for f in _INDEXED if f in rules)
+            key = (field, rules[field])
+            self._compound.setdefault(key, []).append((self._seq, rules, action))
+            self._fields.add(field)
+
+    def add_substring(self, field, text, action):
+        """Regla "contiene" sin distinguir mayúsculas (ej. "pycharm" en wm_class)"""
+        self._seq += 1
+        self._substrings.setdefault(field, []).append((self._seq, text, action))
+        self._fields.add(field)
+        self._regex.pop(field, None)
+
+    def _compile(self, field):
+        entries = self._substrings[field]
+        groups = {}
+        parts = []
+        for i, (seq, text, action) in enumerate(entries):
+            name = f"r{i}"
+            groups[name] = (seq, action)
+            parts.append(f"(?P<{name}>{re.escape(text)})")
+        compiled = (re.compile("|".join(parts), re.IGNORECASE), groups)
+        self._regex[field] = compiled
+        return compiled
+
+    def _lookup(self, window_props):
+        best = None
+        for field in self._fields:
+            for value in window_props.values(field):
+                hit = self._exact.get((field, value))
+                if hit is not None and (best is None or hit[0] < best[0]):
+                    best = hit
+                for seq, rules, action in self._compound.get((field, value), ()):
+                    if best is not None and seq > best[0]:
+                        break
+                    if all(v in window_props.values(f) for f, v in rules.items()):
+                        best = (seq, action)
+                        break
+                if field in self._substrings:
+                    regex, groups = self._regex.get(field) or self._compile(field)
+                    for m in regex.finditer(value):
+                        hit = groups[m.lastgroup]
+                        if best is None or hit[0] < best[0]:
+                            best = hit
+        for seq, match, action in self._fallback:
+            if best is not None and seq > best[0]:
+                break
+            if match.compare(window_props.client):
+                best = (seq, action)
+                break
+        return best
+
+    def classify(self, client):
+        best = self._lookup(props(client))
+        return None if best is None else best[1]
+
+    # Permite usar el índice directamente en float_rules de layout.Floating,
+    # que solo llama a compare() en cada regla
+    def compare(self, client):
+        return self.classify(client) is not None
+
+    def __repr__(self):
+        return f"<RuleIndex {self.name}: {len(self._exact)} exactas, " \
+               f"{sum(map(len, self._compound.values()))} compuestas, " \
+               f"{sum(map(len, self._substrings.values()))} parciales, " \
+               f"{len(self._fallback)} con func/regex>"
+
+
+def group_rules(group_matches, substrings=None):
+    """Índice ventana -> nombre de grupo
+
+    group_matches: {"2": [Match(...), ...], ...} como en config_developer.py
+    substrings: {"3": ["pycharm", "idea"], ...} texto contenido en el wm_class
+    """
+    index = RuleIndex("grupos")
+    for group_name, matches in group_matches.items():
+        for match in matches:
+            index.add_match(match, group_name)
+    for group_name, texts in (substrings or {}).items():
+        for text in texts:
+            index.add_substring("wm_class", text, group_name)
+    return index
+
+
+def float_rules(matches):
+    """Índice para floating_layout: float_rules=[float_rules([...])]"""
+    index = RuleIndex("flotantes")
+    for match in matches:
+        index.add_match(match, True)
+    return index
+
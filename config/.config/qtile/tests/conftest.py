@@ -0,0 +1,6 @@
+# Los tests importan los módulos como lo hacen los scripts:
+#     cd ~/.config/qtile && python3 -m pytest tests
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,115 @@
+# DockerAPI y snapshot() contra un servidor HTTP falso en un socket unix
+import http.server
+import json
+import socketserver
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from modules import docker_api
+
+
+CONTAINERS = [
+    {"Names": ["/python-dev-env"], "State": "running", "Status": "Up 2 hours", "Labels": {}},
+    {"Names": ["/nodejs-dev-env"], "State": "exited", "Status": "Exited (0)", "Labels": {}},
+    # El stack databases: uno parado y otro corriendo, por la etiqueta del proyecto
+    {"Names": ["/databases-postgres-1"], "State": "running", "Status": "Up 5 minutes",
+     "Labels": {"com.docker.compose.project": "databases"}},
+    {"Names": ["/databases-redis-1"], "State": "exited", "Status": "Exited (1)",
+     "Labels": {"com.docker.compose.project": "databases"}},
+    # El stack tools, parado, reconocido por su directorio
+    {"Names": ["/traefik"], "State": "exited", "Status": "Exited (0)",
+     "Labels": {"com.docker.compose.project.working_dir": "CONTAINERS/tools"}},
+]
+NETWORKS = [{"Name": "bridge"}, {"Name": "dev-network-old"}]
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # keep-alive, como dockerd
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        url = urlsplit(self.path)
+        if url.path == "/containers/json":
+            body = self.server.containers
+        elif url.path == "/networks":
+            # Como Docker: el filtro por nombre es por subcadena
+            name = json.loads(parse_qs(url.query)["filters"][0])["name"][0]
+            body = [n for n in self.server.networks if name in n["Name"]]
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def docker(tmp_path):
+    server = _Server(str(tmp_path / "docker.sock"), _Handler)
+    server.requests = []
+    server.containers = json.loads(json.dumps(CONTAINERS).replace(
+        "CONTAINERS", str(tmp_path / "containers")))
+    server.networks = list(NETWORKS)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api = docker_api.DockerAPI(server.server_address)
+    yield server, api
+    api.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_containers_in_one_request(docker):
+    server, api = docker
+    names = [c["Names"][0] for c in api.containers()]
+    assert names == [c["Names"][0] for c in CONTAINERS]
+    assert server.requests == ["/containers/json?all=1"]
+
+
+def test_network_exists_is_exact(docker):
+    server, api = docker
+    assert not api.network_exists("dev-network")
+    server.networks.append({"Name": "dev-network"})
+    assert api.network_exists("dev-network")
+    assert not api.network_exists("dev")
+
+
+def test_snapshot_maps_single_containers_and_stacks(docker, tmp_path):
+    server, api = docker
+    containers_dir = tmp_path / "containers"
+    for service in ("tools", "golang"):
+        (containers_dir / service).mkdir(parents=True)
+
+    result = docker_api.snapshot(api, containers_dir=str(containers_dir))
+    assert result["services"] == {
+        "python": "running",
+        "nodejs": "stopped",
+        "java": "unconfigured",     # sin contenedor ni directorio
+        "golang": "missing",        # hay directorio pero no contenedor
+        "databases": "running",     # alguno del stack corre
+        "tools": "stopped",
+    }
+    assert result["network"] == {"name": "dev-network", "exists": False}
+    assert result["running"] == [("python-dev-env", "Up 2 hours"),
+                                 ("databases-postgres-1", "Up 5 minutes")]
+    # Una petición de contenedores para todos los servicios, por la misma conexión
+    assert server.requests.count("/containers/json?all=1") == 1
+
+
+def test_errors_become_docker_error(tmp_path):
+    api = docker_api.DockerAPI(str(tmp_path / "no-existe.sock"))
+    with pytest.raises(docker_api.DockerError):
+        api.containers()
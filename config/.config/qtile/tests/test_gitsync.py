@@ -0,0 +1,101 @@
+# GitSync contra remotos "git init --bare" en un directorio temporal
+import os
+import subprocess
+import time
+
+import pytest
+
+from modules import gitsync
+
+
+def git(*args, cwd=None):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@localhost",
+                    "-c", "init.defaultBranch=main", *args],
+                   cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def remote(tmp_path):
+    """Remoto bare con un commit"""
+    bare = tmp_path / "remote.git"
+    git("init", "--bare", "-q", str(bare))
+    work = tmp_path / "work"
+    git("init", "-q", str(work))
+    (work / "README").write_text("hola\n")
+    git("add", "README", cwd=work)
+    git("commit", "-q", "-m", "inicio", cwd=work)
+    git("push", "-q", str(bare), "HEAD:main", cwd=work)
+    return str(bare)
+
+
+def clone(remote, projects, name):
+    path = projects / name
+    git("clone", "-q", remote, str(path))
+    return str(path)
+
+
+def make_sync(tmp_path, **kwargs):
+    return gitsync.GitSync(str(tmp_path / "projects"), state_file=str(tmp_path / "state.json"),
+                           **kwargs)
+
+
+def test_fetch_fresh_and_no_remote(tmp_path, remote):
+    projects = tmp_path / "projects"
+    fetched = clone(remote, projects, "a")
+    nested = clone(remote, projects / "python", "b")
+    lonely = str(projects / "c")
+    git("init", "-q", lonely)
+
+    sync = make_sync(tmp_path)
+    results = sync.run()
+    assert results == {fetched: "ok", nested: "ok", lonely: "sin remotos"}
+    assert sync.state[fetched]["failures"] == 0
+    assert os.path.exists(os.path.join(fetched, ".git", "FETCH_HEAD"))
+
+    # FETCH_HEAD recién escrito: la siguiente vuelta no hace nada
+    sync = make_sync(tmp_path)
+    assert sync.run() == {fetched: "fresco", nested: "fresco", lonely: "sin remotos"}
+    assert make_sync(tmp_path).run(force=True)[fetched] == "ok"
+    assert sync.summary() == "2 fresco, 1 sin remotos"
+
+
+def _gone(pid, timeout=5):
+    """El proceso terminó (SIGKILL llega de forma asíncrona: se espera un poco)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                if f.read().split(")")[-1].split()[0] == "Z":
+                    return True
+        except OSError:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_timeout_kills_the_whole_fetch(tmp_path, remote):
+    projects = tmp_path / "projects"
+    repo = clone(remote, projects, "lento")
+    pidfile = tmp_path / "upload-pack.pid"
+    # El upload-pack del remoto no contesta nunca (el # deja fuera la ruta que añade git)
+    git("config", "remote.origin.uploadpack", f"echo $$ > {pidfile}; exec sleep 60 #", cwd=repo)
+
+    sync = make_sync(tmp_path, timeout=1)
+    started = time.monotonic()
+    results = sync.run()
+    assert time.monotonic() - started < 10
+    assert results == {repo: "sin respuesta en 1s"}
+    assert _gone(int(pidfile.read_text()))
+
+    # El fallo deja el repo en espera hasta que pase el backoff
+    entry = sync.state[repo]
+    assert entry["failures"] == 1 and entry["next_try"] > time.time()
+    assert make_sync(tmp_path).run() == {repo: "espera"}
+
+
+def test_remote_host():
+    assert gitsync.remote_host("git@github.com:user/repo.git") == "github.com"
+    assert gitsync.remote_host("https://token@GitLab.com/user/repo") == "gitlab.com"
+    assert gitsync.remote_host("ssh://git@host:2222/repo") == "host"
+    assert gitsync.remote_host("/srv/git/repo.git") == "local"
+    assert gitsync.remote_host("file:///srv/git/repo.git") == "local"
@@ -0,0 +1,29 @@
+# LazyScreen construye la barra al configurarse y apunta su tiempo en el perfil
+import pytest
+
+pytest.importorskip("libqtile.config")
+
+from modules import profiler, screens
+
+
+def test_bar_is_built_once_and_profiled(tmp_path, monkeypatch):
+    log = tmp_path / "startup_profile.log"
+    monkeypatch.setattr(profiler, "PROFILE_LOG", str(log))
+    monkeypatch.setattr(profiler, "PROFILE_CONF", str(tmp_path / "profile.conf"))
+    configured = []
+    monkeypatch.setattr(screens.Screen, "_configure",
+                        lambda self, qtile, index, *args, **kwargs: configured.append(index))
+    built = []
+
+    def factory():
+        built.append(1)
+        return "barra"
+
+    screen = screens.LazyScreen(factory, profile=profiler.StartupProfiler("config.py", 0.0))
+    assert screen.top is None
+    screen._configure(None, 1, 0, 0, 1920, 1080, None)
+    screen._configure(None, 1, 0, 0, 1920, 1080, None)
+    assert screen.top == "barra" and built == [1] and configured == [1, 1]
+    lines = log.read_text().splitlines()
+    assert len(lines) == 1
+    assert lines[0].startswith("bars") and lines[0].endswith("(config.py, pantalla 1)")
@@ -0,0 +1,35 @@
+# SnapshotSet.prune sobre un almacén en un directorio temporal
+import pytest
+
+from modules import snapshots
+
+
+@pytest.fixture
+def snapshot_set(tmp_path):
+    snapshot_set = snapshots.SnapshotSet("p", str(tmp_path / "store"), jobs=1)
+    yield snapshot_set
+    snapshot_set.close()
+
+
+def test_prune_keeps_the_last_ones(tmp_path, snapshot_set):
+    root = tmp_path / "p"
+    root.mkdir()
+    for i in range(3):
+        (root / f"f{i}").write_text(str(i))
+        snapshot_set.backup(str(root), use_gitignore=False)
+    restored = tmp_path / "restaurado"
+    snapshot_set.restore("latest", str(restored))
+
+    assert snapshot_set.prune(2) == 1
+    assert len(snapshot_set.snapshots()) == 2
+    assert snapshot_set.load(snapshot_set.snapshots()[0])["full"]
+    assert snapshot_set.prune(2) == 0
+    again = tmp_path / "otra vez"
+    snapshot_set.restore("latest", str(again))
+    assert sorted(p.name for p in again.iterdir()) == sorted(p.name for p in restored.iterdir())
+
+
+@pytest.mark.parametrize("keep", [0, -1])
+def test_prune_rejects_keeping_nothing(snapshot_set, keep):
+    with pytest.raises(snapshots.BackupError, match="al menos 1"):
+        snapshot_set.prune(keep)
@@ -0,0 +1,42 @@
+# El ayudante de modules/spawner.py: stdio de los programas y reload_config
+import importlib
+import os
+import time
+
+import pytest
+
+from modules import spawner as spawner_module
+
+
+@pytest.fixture
+def spawner():
+    yield spawner_module.spawner
+    spawner_module.spawner.stop()
+
+
+def _wait_for(path, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(path) and os.path.getsize(path):
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_programs_get_dev_null(spawner, tmp_path):
+    out = tmp_path / "fds"
+    # $(...) lee los descriptores del sh lanzado antes de cualquier redirección
+    assert spawner.spawn(["sh", "-c", "fds=$(readlink /proc/$$/fd/0 /proc/$$/fd/1 /proc/$$/fd/2);"
+                                      f" echo $fds > {out}.tmp; mv {out}.tmp {out}"])
+    assert _wait_for(str(out))
+    assert out.read_text().split() == [os.devnull] * 3
+
+
+def test_reload_reuses_the_helper(spawner):
+    spawner.start()
+    pid = spawner.proc.pid
+    # Lo mismo que hace qtile en reload_config(): ejecutar otra vez el módulo
+    reloaded = importlib.reload(spawner_module)
+    assert reloaded.spawner is spawner
+    reloaded.spawner.start()
+    assert reloaded.spawner.proc.pid == pid
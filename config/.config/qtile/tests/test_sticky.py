@@ -0,0 +1,72 @@
+# StickyRegistry.follow() contra grupos falsos con la firma de qtile
+import inspect
+from types import SimpleNamespace
+
+import pytest
+
+group_module = pytest.importorskip("libqtile.group")
+
+from modules import sticky as sticky_module
+
+
+class FakeWindow:
+    def __init__(self, wid, group):
+        self.wid = wid
+        self.group = group
+        self.x = 0
+        self.hidden = False
+        self.can_steal_focus = True
+        group.windows.append(self)
+
+    def hide(self):
+        self.hidden = True
+
+
+class FakeGroup:
+    def __init__(self, name, screen=None):
+        self.name = name
+        self.screen = screen
+        self.windows = []
+        self.focused = []
+        self.laid_out = 0
+
+    # Misma firma que libqtile.group._Group (se comprueba abajo)
+    def add(self, win, force=False):
+        self.windows.append(win)
+        win.group = self
+        if win.can_steal_focus:
+            self.focused.append(win)
+        else:
+            self.laid_out += 1
+
+    def remove(self, win, force=False):
+        self.windows.remove(win)
+        win.group = None
+
+
+def test_fake_group_matches_qtile():
+    for method in ("add", "remove"):
+        assert (inspect.signature(getattr(FakeGroup, method))
+                == inspect.signature(getattr(group_module._Group, method)))
+
+
+def test_follow_moves_without_stealing_focus(monkeypatch):
+    screen = SimpleNamespace(x=1920)
+    old, new = FakeGroup("1"), FakeGroup("2", screen)
+    moving = FakeWindow(1, old)
+    already = FakeWindow(2, new)
+    monkeypatch.setattr(sticky_module, "qtile",
+                        SimpleNamespace(windows_map={1: moving, 2: already, 3: None}))
+
+    registry = sticky_module.StickyRegistry()
+    for window in (moving, already):
+        registry.add(window)
+    registry._wids[3] = None        # ventana que se cerró: se olvida
+
+    registry.follow(new)
+    assert moving.group is new and moving in new.windows and moving not in old.windows
+    assert moving.hidden and moving.x == 1920
+    assert not already.hidden       # ya estaba en el grupo: no se toca
+    assert new.focused == [] and new.laid_out == 1
+    assert moving.can_steal_focus   # se restaura después de moverla
+    assert len(registry) == 2
@@ -0,0 +1,123 @@
+# UnitMonitor contra un dbus-daemon privado, con un systemd falso que
+# responde Subscribe y Properties.Get y emite PropertiesChanged
+import os
+import shutil
+import subprocess
+import threading
+import time
+
+import pytest
+
+from modules import dbus_client, units
+
+
+pytestmark = pytest.mark.skipif(shutil.which("dbus-daemon") is None,
+                                reason="sin dbus-daemon")
+
+
+@pytest.fixture
+def bus():
+    daemon = subprocess.Popen(["dbus-daemon", "--session", "--nofork", "--print-address"],
+                              stdout=subprocess.PIPE, text=True)
+    address = daemon.stdout.readline().strip()
+    yield address
+    daemon.terminate()
+    daemon.wait(5)
+
+
+class FakeSystemd:
+    """Dueño de org.freedesktop.systemd1 en el bus de prueba"""
+
+    def __init__(self, address, states):
+        self.states = states
+        self.subscribed = threading.Event()
+        self.conn = dbus_client.Connection(address)
+        self.conn.call("org.freedesktop.DBus", "/org/freedesktop/DBus",
+                       "org.freedesktop.DBus", "RequestName", "su",
+                       ["org.freedesktop.systemd1", 0])
+        self.paths = {units.unit_path(unit): unit for unit in states}
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _reply(self, message, signature="", body=()):
+        self.conn._send(dbus_client._REPLY, [
+            (dbus_client._REPLY_SERIAL, ("u", message.serial)),
+            (dbus_client._DESTINATION, ("s", message.sender)),
+        ], signature, body)
+
+    def _serve(self):
+        try:
+            while True:
+                message = self.conn._read_message()
+                if message.kind != dbus_client._CALL:
+                    continue
+                if message.member == "Subscribe":
+                    self._reply(message)
+                    self.subscribed.set()
+                elif message.member == "Get":
+                    state = self.states[self.paths[message.path]]
+                    self._reply(message, "v", [("s", state)])
+        except (OSError, ConnectionError):
+            return
+
+    def change(self, unit, state):
+        self.states[unit] = state
+        self.conn.emit_signal(units.unit_path(unit), "org.freedesktop.DBus.Properties",
+                              "PropertiesChanged", "sa{sv}as",
+                              [units._UNIT_IFACE, {"ActiveState": ("s", state)}, []])
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_monitor_follows_properties_changed(bus, tmp_path):
+    state_file = str(tmp_path / "run" / "dev-units.state")
+    systemd = FakeSystemd(bus, {"docker": "active", "redis-server": "inactive"})
+    seen = []
+
+    def callback(states):
+        seen.append(states)
+        units.write_states(states, path=state_file)
+
+    monitor = units.UnitMonitor(["docker", "redis-server"], callback, address=bus)
+    monitor.start()
+    try:
+        # El callback escribe el archivo justo después de cambiar states
+        assert _wait_for(lambda: units.read_states(state_file) == {"docker": "active",
+                                                                   "redis-server": "inactive"})
+        assert systemd.subscribed.is_set()
+        assert units.read_states(state_file) == monitor.states
+
+        systemd.change("redis-server", "active")
+        assert _wait_for(lambda: units.read_states(state_file)
+                         == {"docker": "active", "redis-server": "active"})
+        assert monitor.states["redis-server"] == "active"
+
+        # Una señal de una unidad que no se sigue no cambia nada
+        systemd.change("postgresql", "active")
+        systemd.change("docker", "failed")
+        assert _wait_for(lambda: len(seen) == 3 and monitor.states["docker"] == "failed")
+        assert "postgresql" not in monitor.states
+    finally:
+        monitor.stop()
+        systemd.conn.close()
+
+
+def test_state_file_of_a_dead_owner_is_ignored(tmp_path):
+    path = str(tmp_path / "dev-units.state")
+    units.write_states({"docker": "active"}, path=path)
+    assert units.read_states(path) == {"docker": "active"}
+    dead = subprocess.Popen(["true"])
+    dead.wait()
+    with open(path) as f:
+        lines = f.read().splitlines()
+    with open(path, "w") as f:
+        f.write("\n".join([f"pid {dead.pid}"] + lines[1:]) + "\n")
+    assert units.read_states(path) is None
+    assert units.format_services({"docker": "active"}) == "🐳🟢 🐘🔴 📦🔴"
+    assert not os.path.exists(f"{path}.{os.getpid()}")
@@ -0,0 +1,95 @@
+# backup/restore de modules/volbackup.py sin Docker: el "docker run" se
+# sustituye por el mismo comando con el volumen en un directorio temporal
+import os
+import re
+import subprocess
+
+import pytest
+
+from modules import volbackup
+
+
+@pytest.fixture
+def volumes(tmp_path, monkeypatch):
+    """nombre de volumen -> directorio que hace de /data"""
+    root = tmp_path / "volumes"
+    popen = subprocess.Popen
+
+    def fake_popen(argv, **kwargs):
+        assert argv[:2] == ["docker", "run"]
+        volume, _, _ = argv[argv.index("-v") + 1].partition(":")
+        data = root / volume / "data"
+        data.mkdir(parents=True, exist_ok=True)
+        command = argv[argv.index(volbackup.HELPER_IMAGE) + 1:]
+        if command[0] == "tar":
+            command = ["tar", "cf", "-", "-C", str(data.parent), "data"]
+        else:
+            # /data es el volumen; "$T/data" es la copia extraída
+            command = ["sh", "-c", re.sub(r"(?<!\$T)/data", str(data), command[2])]
+        return popen(command, **kwargs)
+
+    def volume(name):
+        data = root / name / "data"
+        data.mkdir(parents=True, exist_ok=True)
+        return data
+
+    monkeypatch.setattr(volbackup.subprocess, "Popen", fake_popen)
+    return volume
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = volbackup.ChunkStore(str(tmp_path / "store"), jobs=2)
+    yield store
+    store.close()
+
+
+def _tree(path):
+    return {os.path.relpath(os.path.join(d, f), path): open(os.path.join(d, f), "rb").read()
+            for d, _, files in os.walk(path) for f in files}
+
+
+def test_restore_replaces_the_volume(volumes, store):
+    data = volumes("pg")
+    (data / "base").mkdir()
+    (data / "base" / "1").write_bytes(os.urandom(volbackup.CHUNK_SIZE + 10))
+    (data / ".hidden").write_text("x")
+    saved = _tree(data)
+    volbackup.backup_volume(store, "pg", "b1")
+
+    (data / "base" / "1").write_text("cambiado")
+    (data / "nuevo").write_text("sobra")
+    volbackup.restore_volume(store, "pg", "b1")
+    assert _tree(data) == saved
+    assert not (data / ".volbackup-restore").exists()
+
+
+def test_missing_chunk_leaves_the_volume_alone(volumes, store):
+    data = volumes("pg")
+    (data / "a").write_text("uno")
+    volbackup.backup_volume(store, "pg", "b1")
+    (data / "a").write_text("actual")
+    digest = store.load_manifest("b1", "pg")["files"][-1]["chunks"][0]
+    os.unlink(store._path(digest))
+
+    with pytest.raises(volbackup.BackupError, match="faltan 1 trozos"):
+        volbackup.restore_volume(store, "pg", "b1")
+    assert (data / "a").read_text() == "actual"
+
+
+def test_corrupt_chunk_midway_leaves_the_volume_alone(volumes, store):
+    data = volumes("pg")
+    for name in ("a", "b", "c"):
+        (data / name).write_text(name * 100)
+    volbackup.backup_volume(store, "pg", "b1")
+    for name in ("a", "b", "c"):
+        (data / name).write_text("actual")
+    # El último archivo: los anteriores ya habrían llegado al volumen
+    digest = store.load_manifest("b1", "pg")["files"][-1]["chunks"][0]
+    with open(store._path(digest), "wb") as f:
+        f.write(store._compress(b"otra cosa"))
+
+    with pytest.raises(volbackup.BackupError, match="corrupto"):
+        volbackup.restore_volume(store, "pg", "b1")
+    assert _tree(data) == {"a": b"actual", "b": b"actual", "c": b"actual"}
+    assert not (data / ".volbackup-restore").exists()
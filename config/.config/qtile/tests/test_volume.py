@@ -0,0 +1,39 @@
+# VolumeMonitor sin pactl: lee wpctl cada POLL_INTERVAL
+import threading
+
+from modules import volume
+
+
+def _fake_bin(directory, name, script):
+    path = directory / name
+    path.write_text("#!/bin/sh\n" + script)
+    path.chmod(0o755)
+
+
+def test_polls_wpctl_without_pactl(tmp_path, monkeypatch):
+    state = tmp_path / "volume"
+    state.write_text("Volume: 0.40\n")
+    _fake_bin(tmp_path, "wpctl", f'exec /bin/cat "{state}"\n')
+    monkeypatch.setenv("PATH", str(tmp_path))      # sin pactl
+    monkeypatch.setattr(volume, "POLL_INTERVAL", 0.05)
+
+    seen = []
+    changed = threading.Event()
+
+    def callback(percent, muted):
+        seen.append((percent, muted))
+        changed.set()
+
+    monitor = volume.VolumeMonitor(callback)
+    monitor.start()
+    try:
+        assert changed.wait(5)
+        changed.clear()
+        state.write_text("Volume: 0.55 [MUTED]\n")
+        assert changed.wait(5)
+        assert seen == [(40, False), (55, True)]
+        assert monitor._thread.is_alive()
+    finally:
+        monitor.stop()
+        monitor._thread.join(5)
+    assert not monitor._thread.is_alive()
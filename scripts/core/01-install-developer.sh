@@ -674,11 +674,17 @@ check_dependency() {
     return 0
 }
 
+# unit_active: estado de una unidad desde el caché de ~/.config/qtile/modules/units.py
+# (ver units.sh); sin la configuración de qtile, systemctl directamente
+if ! . ~/.config/qtile/modules/units.sh 2>/dev/null; then
+    unit_active() { systemctl is-active --quiet "$1" 2>/dev/null; }
+fi
+
 # Función para verificar servicio systemd
 check_service() {
     local service="$1"
     
-    if systemctl is-active --quiet "$service"; then
+    if unit_active "$service"; then
         dev_log "SUCCESS" "Servicio $service está activo"
         return 0
     else
@@ -701,6 +707,9 @@ check_port() {
 }
 
 # Función para crear backup automático
+# (snapshot incremental con ~/.config/qtile/modules/snapshots.py: solo lee
+# lo que cambió y salta node_modules, venvs y lo de los .gitignore;
+# si no está disponible, un tar.gz completo)
 create_backup() {
     local source_dir="$1"
     local backup_name="$2"
@@ -708,6 +717,16 @@ create_backup() {
     
     mkdir -p "$DEV_BACKUPS"
     
+    if command -v python3 &> /dev/null && [ -f ~/.config/qtile/modules/snapshots.py ]; then
+        if (cd ~/.config/qtile && python3 -m modules.snapshots --store "$DEV_BACKUPS/snapshots" \
+            --name "$backup_name" backup "$source_dir"); then
+            dev_log "SUCCESS" "Snapshot de $source_dir creado en $DEV_BACKUPS/snapshots/$backup_name"
+            return 0
+        fi
+        dev_log "ERROR" "Error creando snapshot de $source_dir"
+        return 1
+    fi
+    
     if tar -czf "$backup_file" -C "$(dirname "$source_dir")" "$(basename "$source_dir")"; then
         dev_log "SUCCESS" "Backup creado: $backup_file"
         return 0
@@ -721,6 +740,21 @@ create_backup() {
 system_health_check() {
     dev_log "INFO" "Iniciando verificación del sistema..."
     
+    # Todas las comprobaciones a la vez con ~/.config/qtile/modules/health.py
+    # (un solo recorrido del PATH y una sola lectura de /proc/net)
+    if command -v python3 &> /dev/null && [ -f ~/.config/qtile/modules/health.py ]; then
+        local section name status ms detail
+        while IFS=$'\t' read -r section name status ms detail; do
+            case "$status" in
+                fail) dev_log "ERROR" "$detail" ;;
+                warn) dev_log "WARN" "$detail" ;;
+                ok)   [ "$section" = "ports" ] && dev_log "INFO" "$detail" ;;
+            esac
+        done < <(cd ~/.config/qtile && python3 -m modules.health health --tsv)
+        dev_log "SUCCESS" "Verificación del sistema completada"
+        return
+    fi
+    
     # Verificar Docker
     check_dependency "docker" "docker.io"
     check_dependency "docker-compose" "docker-compose"
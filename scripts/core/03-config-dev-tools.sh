@@ -907,6 +907,7 @@ devclean() {
 
 # Función mejorada para mostrar status de desarrollo
 devstatus() {
+    local snapshot
     echo "=== STATUS DEL ENTORNO DE DESARROLLO ==="
     echo
     
@@ -914,7 +915,22 @@ devstatus() {
     echo "🐳 Docker:"
     if systemctl is-active --quiet docker; then
         echo "  Estado: 🟢 Activo"
-        if command -v docker &> /dev/null; then
+        if command -v python3 &> /dev/null && [ -f ~/.config/qtile/modules/docker_api.py ] \
+            && snapshot=$(cd ~/.config/qtile && python3 -m modules.docker_api 2>/dev/null); then
+            # Una sola consulta a la API de Docker en vez de dos docker ps
+            local containers=0 container_list="" kind name state
+            while IFS=$'\t' read -r kind name state; do
+                if [ "$kind" = "container" ]; then
+                    ((++containers))
+                    container_list+="    $name: $state"$'\n'
+                fi
+            done <<< "$snapshot"
+            echo "  Contenedores activos: $containers"
+            if [ $containers -gt 0 ]; then
+                echo "  Contenedores:"
+                printf '%s\n' "${container_list%$'\n'}" | head -10
+            fi
+        elif command -v docker &> /dev/null; then
             local containers=$(docker ps --format "table {{.Names}}\t{{.Status}}" 2>/dev/null | tail -n +2 | wc -l)
             echo "  Contenedores activos: $containers"
             if [ $containers -gt 0 ]; then
@@ -933,10 +949,18 @@ devstatus() {
     
     echo
     echo "📂 Proyectos:"
-    local python_projects=$(find "${DEV_PROJECTS:-$HOME/Development/projects}/python" -maxdepth 1 -type d 2>/dev/null | tail -n +2 | wc -l)
-    local nodejs_projects=$(find "${DEV_PROJECTS:-$HOME/Development/projects}/nodejs" -maxdepth 1 -type d 2>/dev/null | tail -n +2 | wc -l)
-    echo "  Python: $python_projects proyectos"
-    echo "  Node.js: $nodejs_projects proyectos"
+    local counts lang count
+    if command -v python3 &> /dev/null && [ -f ~/.config/qtile/modules/projects.py ] \
+        && counts=$(cd ~/.config/qtile && python3 -m modules.projects counts 2>/dev/null); then
+        while IFS=$'\t' read -r lang count; do
+            [ -n "$lang" ] && echo "  $lang: $count proyectos"
+        done <<< "$counts"
+    else
+        local python_projects=$(find "${DEV_PROJECTS:-$HOME/Development/projects}/python" -maxdepth 1 -type d 2>/dev/null | tail -n +2 | wc -l)
+        local nodejs_projects=$(find "${DEV_PROJECTS:-$HOME/Development/projects}/nodejs" -maxdepth 1 -type d 2>/dev/null | tail -n +2 | wc -l)
+        echo "  Python: $python_projects proyectos"
+        echo "  Node.js: $nodejs_projects proyectos"
+    fi
     
     # Mostrar estado de servicios específicos si existen
     if command -v dev-status &> /dev/null; then
@@ -959,6 +983,13 @@ listprojects() {
     echo "📂 Proyectos disponibles:"
     echo
     
+    # Índice de proyectos (~/.config/qtile/modules/projects.py): solo se
+    # vuelve a mirar lo que cambió, y trae rama, cambios y tamaño
+    if command -v python3 &> /dev/null && [ -f ~/.config/qtile/modules/projects.py ] \
+        && (cd ~/.config/qtile && python3 -m modules.projects list "$@"); then
+        return
+    fi
+    
     for lang in python nodejs java golang; do
         local lang_dir="${DEV_PROJECTS:-$HOME/Development/projects}/$lang"
         if [ -d "$lang_dir" ]; then
@@ -982,6 +1013,20 @@ quickbackup() {
     
     dev_log "INFO" "Creando backup rápido..."
     
+    # Snapshot incremental: solo se leen los archivos que cambiaron desde
+    # el anterior, sin node_modules, venvs ni lo ignorado por .gitignore
+    if command -v python3 &> /dev/null && [ -f ~/.config/qtile/modules/snapshots.py ]; then
+        local store="${DEV_BACKUPS:-$HOME/Development/backups}/snapshots"
+        if (cd ~/.config/qtile && python3 -m modules.snapshots --store "$store" \
+            --name "$backup_name" backup "${DEV_PROJECTS:-$HOME/Development/projects}"); then
+            dev_log "SUCCESS" "Snapshot creado en $store/$backup_name"
+            echo "Restaurar: cd ~/.config/qtile && python3 -m modules.snapshots --store $store --name $backup_name restore latest --target <dir>"
+        else
+            dev_log "ERROR" "Error creando backup"
+        fi
+        return
+    fi
+    
     if tar -czf "$backup_file" -C "${DEV_HOME:-$HOME/Development}" projects/; then
         dev_log "SUCCESS" "Backup creado: $backup_file"
         echo "Tamaño: $(du -h "$backup_file" | cut -f1)"
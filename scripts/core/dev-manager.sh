@@ -55,6 +55,10 @@ SERVICES=(
     "tools:Tools Stack:Traefik, MailHog, MinIO, Elasticsearch:multiple"
 )
 
+# Proyecto de docker-compose cuyos volúmenes entran en el backup: compose
+# los llama <proyecto>_<volumen> (databases_postgres-data...)
+DATA_PROJECT=databases
+
 ############################################
 # FUNCIONES UTILITARIAS INTEGRADAS
 ############################################
@@ -215,11 +219,61 @@ show_service_info() {
     echo
 }
 
+# Foto del estado en una sola consulta a la API de Docker
+# (~/.config/qtile/modules/docker_api.py); falla si no está disponible
+docker_snapshot() {
+    command -v python3 &> /dev/null && [ -f ~/.config/qtile/modules/docker_api.py ] || return 1
+    (cd ~/.config/qtile && python3 -m modules.docker_api \
+        --containers-dir "$CONTAINERS_DIR" --network "$NETWORK_NAME" "${SERVICES[@]}")
+}
+
 # Mostrar estado de todos los servicios
 show_status() {
     echo -e "${PURPLE}=== ESTADO DE SERVICIOS DE DESARROLLO ===${NC}"
     echo
     
+    local snapshot
+    if snapshot=$(docker_snapshot 2>/dev/null); then
+        local -A states
+        local kind name state network_state="absent"
+        while IFS=$'\t' read -r kind name state; do
+            case "$kind" in
+                service) states[$name]="$state" ;;
+                network) network_state="$state" ;;
+            esac
+        done <<< "$snapshot"
+        
+        for service_info in "${SERVICES[@]}"; do
+            IFS=':' read -r service container description <<< "$service_info"
+            
+            case "${states[$service]}" in
+                running) status="${GREEN}🟢 Running${NC}" ;;
+                stopped) status="${RED}🔴 Stopped${NC}" ;;
+                *)
+                    if [ "$service" = "databases" ] || [ "$service" = "tools" ]; then
+                        # Stack sin directorio: se omite, como antes
+                        [ "${states[$service]}" = "unconfigured" ] && continue
+                        status="${RED}🔴 Stopped${NC}"
+                    else
+                        status="${YELLOW}⚪ Not Created${NC}"
+                    fi
+                    ;;
+            esac
+            
+            printf "%-15s %-20s %s\n" "$service" "$status" "$description"
+        done
+        
+        echo
+        echo -e "${CYAN}Red de desarrollo:${NC}"
+        if [ "$network_state" = "present" ]; then
+            echo -e "  dev-network: ${GREEN}🟢 Activa${NC}"
+        else
+            echo -e "  dev-network: ${RED}🔴 No existe${NC}"
+        fi
+        return
+    fi
+    
+    # Sin el módulo de Python: una consulta por servicio
     for service_info in "${SERVICES[@]}"; do
         IFS=':' read -r service container description <<< "$service_info"
         
@@ -251,6 +305,27 @@ show_status() {
 start_all() {
     show_step "Iniciando todos los servicios de desarrollo..."
     
+    local stacks=()
+    for service in databases tools python nodejs java golang; do
+        service_exists "$service" && stacks+=("$service")
+    done
+    
+    # Arranque en paralelo por dependencias, esperando los healthchecks
+    # (modules/stacks.py); si no está disponible, uno a uno como antes
+    if [ ${#stacks[@]} -gt 0 ] && command -v python3 &> /dev/null \
+        && [ -f ~/.config/qtile/modules/stacks.py ]; then
+        if (cd ~/.config/qtile && python3 -m modules.stacks \
+            --containers-dir "$CONTAINERS_DIR" "${stacks[@]}"); then
+            for service in "${stacks[@]}"; do
+                show_service_info "$service"
+            done
+            show_success "Todos los servicios disponibles están sanos"
+        else
+            show_warning "Algunos servicios no llegaron a estar sanos (ver arriba)"
+        fi
+        return
+    fi
+    
     # Iniciar servicios en orden específico
     for service in databases tools python nodejs java golang; do
         if service_exists "$service"; then
@@ -296,6 +371,28 @@ cleanup() {
 update_images() {
     show_step "Actualizando imágenes de contenedores..."
     
+    # Descargas en paralelo y recrear solo los servicios cuya imagen
+    # cambió (modules/images.py); si no está disponible, pull uno a uno
+    if command -v python3 &> /dev/null && [ -f ~/.config/qtile/modules/images.py ]; then
+        local stacks=()
+        for service_info in "${SERVICES[@]}"; do
+            IFS=':' read -r service container description <<< "$service_info"
+            service_exists "$service" && stacks+=("$service")
+        done
+        # Sin stacks, modules.images los actualizaría todos
+        if [ ${#stacks[@]} -eq 0 ]; then
+            show_message "No hay servicios configurados que actualizar"
+            return
+        fi
+        if (cd ~/.config/qtile && python3 -m modules.images \
+            --containers-dir "$CONTAINERS_DIR" --jobs "${DEV_PULL_JOBS:-4}" "${stacks[@]}"); then
+            show_success "Imágenes actualizadas"
+        else
+            show_warning "Algunas imágenes no se pudieron actualizar (ver arriba)"
+        fi
+        return
+    fi
+    
     for service_info in "${SERVICES[@]}"; do
         IFS=':' read -r service container description <<< "$service_info"
         if service_exists "$service"; then
@@ -308,23 +405,66 @@ update_images() {
 }
 
 # Backup de volúmenes
+volbackup() {
+    command -v python3 &> /dev/null && [ -f ~/.config/qtile/modules/volbackup.py ] || return 127
+    (cd ~/.config/qtile && python3 -m modules.volbackup "$@")
+}
+
 backup_volumes() {
     show_step "Creando backup de volúmenes de datos..."
     
+    # Backup deduplicado y en paralelo (modules/volbackup.py); si no está
+    # disponible, un tar.gz por volumen como antes
+    if service_exists "databases"; then
+        local rc=0
+        volbackup backup --project "$DATA_PROJECT" || rc=$?
+        if [ $rc -eq 0 ]; then
+            show_success "Backup guardado en ~/Development/backups/store"
+            return
+        elif [ $rc -ne 127 ]; then
+            show_error "Error al crear el backup de volúmenes"
+            return 1
+        fi
+    fi
+    
     local backup_dir="$HOME/Development/backups/$(date +%Y%m%d-%H%M%S)"
     mkdir -p "$backup_dir"
     
     # Backup de volúmenes de bases de datos
     if service_exists "databases"; then
-        docker run --rm -v dev_postgres-data:/data -v "$backup_dir":/backup alpine tar czf /backup/postgres-data.tar.gz -C / data
-        docker run --rm -v dev_mysql-data:/data -v "$backup_dir":/backup alpine tar czf /backup/mysql-data.tar.gz -C / data
-        docker run --rm -v dev_redis-data:/data -v "$backup_dir":/backup alpine tar czf /backup/redis-data.tar.gz -C / data
-        docker run --rm -v dev_mongodb-data:/data -v "$backup_dir":/backup alpine tar czf /backup/mongodb-data.tar.gz -C / data
+        local volume
+        for volume in $(docker volume ls -q --filter "label=com.docker.compose.project=$DATA_PROJECT"); do
+            docker run --rm -v "$volume":/data -v "$backup_dir":/backup alpine tar czf "/backup/$volume.tar.gz" -C / data
+        done
     fi
     
     show_success "Backup creado en: $backup_dir"
 }
 
+# Restaurar volúmenes de un backup (por defecto el último)
+restore_volumes() {
+    local backup=${1:-latest}
+    shift || true
+    
+    if docker ps --format "{{.Label \"com.docker.compose.project\"}}" | grep -qx "$DATA_PROJECT"; then
+        show_error "Para el stack de bases de datos antes de restaurar: $0 stop databases"
+        return 1
+    fi
+    
+    show_step "Restaurando volúmenes del backup $backup..."
+    local rc=0
+    volbackup restore "$backup" "$@" || rc=$?
+    if [ $rc -eq 0 ]; then
+        show_success "Volúmenes restaurados"
+    elif [ $rc -eq 127 ]; then
+        show_error "La restauración necesita python3 y ~/.config/qtile/modules/volbackup.py"
+        return 1
+    else
+        show_error "Error al restaurar el backup $backup"
+        return 1
+    fi
+}
+
 ############################################
 # MENÚ PRINCIPAL
 ############################################
@@ -346,6 +486,8 @@ show_menu() {
     echo -e "  ${CYAN}update${NC}               - Actualizar imágenes"
     echo -e "  ${CYAN}cleanup${NC}              - Limpiar contenedores no utilizados"
     echo -e "  ${CYAN}backup${NC}               - Backup de volúmenes de datos"
+    echo -e "  ${CYAN}restore [fecha]${NC}      - Restaurar volúmenes (por defecto el último backup)"
+    echo -e "  ${CYAN}backups${NC}              - Listar backups de volúmenes"
     echo
     echo -e "${CYAN}Servicios disponibles:${NC}"
     echo -e "  python, nodejs, java, golang, databases, tools"
@@ -376,6 +518,10 @@ show_help() {
     echo -e "${CYAN}# Iniciar todo el entorno de desarrollo${NC}"
     echo "  ./dev-manager.sh start-all"
     echo
+    echo -e "${CYAN}# Backup de las bases de datos y restaurar el último${NC}"
+    echo "  ./dev-manager.sh backup"
+    echo "  ./dev-manager.sh stop databases && ./dev-manager.sh restore"
+    echo
     echo -e "${YELLOW}Estructura de proyectos:${NC}"
     echo "  ~/Development/projects/python/    - Proyectos Python"
     echo "  ~/Development/projects/nodejs/    - Proyectos Node.js"
@@ -468,6 +614,13 @@ main() {
         "backup")
             backup_volumes
             ;;
+        "restore")
+            shift
+            restore_volumes "$@"
+            ;;
+        "backups")
+            volbackup list
+            ;;
         "help"|"-h"|"--help")
             show_help
             ;;
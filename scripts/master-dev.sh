@@ -30,6 +30,12 @@ else
     }
 fi
 
+# ~/.dev_logger antiguos no traen unit_active
+if ! declare -F unit_active > /dev/null \
+        && ! . ~/.config/qtile/modules/units.sh 2>/dev/null; then
+    unit_active() { systemctl is-active --quiet "$1" 2>/dev/null; }
+fi
+
 ############################################
 # CONFIGURACIÓN DEL SCRIPT MAESTRO
 ############################################
@@ -453,8 +459,17 @@ restart_service() {
 # FUNCIONES DE ESTADO Y MONITOREO
 ############################################
 
+# Foto de Docker en una sola consulta a su API
+# (~/.config/qtile/modules/docker_api.py); falla si no está disponible
+docker_snapshot() {
+    command -v python3 &> /dev/null && [ -f ~/.config/qtile/modules/docker_api.py ] || return 1
+    (cd ~/.config/qtile && python3 -m modules.docker_api \
+        --containers-dir "${CONTAINERS_DIR:-${DEV_CONTAINERS:-$HOME/Development/containers}}")
+}
+
 show_status() {
     dev_log "INFO" "Mostrando estado completo del sistema..."
+    local snapshot=""
     
     echo "=============================================="
     echo "📊 ESTADO COMPLETO DEL SISTEMA DE DESARROLLO"
@@ -471,7 +486,7 @@ show_status() {
     
     # Estado de Docker
     echo "🐳 DOCKER:"
-    if systemctl is-active --quiet docker; then
+    if unit_active docker; then
         echo "   Estado: 🟢 Activo"
         local version=$(docker --version 2>/dev/null | cut -d' ' -f3 | cut -d',' -f1 || echo "desconocido")
         echo "   Versión: $version"
@@ -482,13 +497,25 @@ show_status() {
             echo "   Permisos: 🔴 Usuario NO está en grupo docker"
         fi
         
-        # Contenedores activos
-        local containers=$(docker ps --format "{{.Names}}" | wc -l)
+        # Contenedores activos (de la foto si está, si no con docker ps)
+        snapshot=$(docker_snapshot 2>/dev/null) || snapshot=""
+        local containers=0 container_list="" kind name state
+        if [ -n "$snapshot" ]; then
+            while IFS=$'\t' read -r kind name state; do
+                if [ "$kind" = "container" ]; then
+                    ((++containers))
+                    container_list+="     $name: $state"$'\n'
+                fi
+            done <<< "$snapshot"
+        else
+            containers=$(docker ps --format "{{.Names}}" | wc -l)
+            container_list=$(docker ps --format "     {{.Names}}: {{.Status}}")
+        fi
         echo "   Contenedores activos: $containers"
         
         if [ $containers -gt 0 ]; then
             echo "   Lista de contenedores:"
-            docker ps --format "     {{.Names}}: {{.Status}}" | head -10
+            printf '%s\n' "${container_list%$'\n'}" | head -10
         fi
     else
         echo "   Estado: 🔴 Inactivo"
@@ -500,8 +527,20 @@ show_status() {
     if command -v dev-status &> /dev/null; then
         dev-status
     else
+        local -A service_states=()
+        if [ -n "$snapshot" ]; then
+            while IFS=$'\t' read -r kind name state; do
+                [ "$kind" = "service" ] && service_states[$name]="$state"
+            done <<< "$snapshot"
+        fi
         for service in python nodejs java golang databases tools; do
-            if [ -d "$CONTAINERS_DIR/$service" ]; then
+            if [ -n "${service_states[$service]}" ]; then
+                case "${service_states[$service]}" in
+                    running)      echo "   $service: 🟢 Activo" ;;
+                    unconfigured) echo "   $service: ⚫ No configurado" ;;
+                    *)            echo "   $service: 🔴 Inactivo" ;;
+                esac
+            elif [ -d "$CONTAINERS_DIR/$service" ]; then
                 if docker-compose -f "$CONTAINERS_DIR/$service/docker-compose.yml" ps | grep -q "Up"; then
                     echo "   $service: 🟢 Activo"
                 else
@@ -525,7 +564,16 @@ show_status() {
     
     # Estado de proyectos
     echo "📂 PROYECTOS:"
-    if [ -d "$DEV_PROJECTS" ]; then
+    local counts
+    if [ -d "$DEV_PROJECTS" ] && command -v python3 &> /dev/null \
+        && [ -f ~/.config/qtile/modules/projects.py ] \
+        && counts=$(cd ~/.config/qtile && python3 -m modules.projects --root "$DEV_PROJECTS" counts 2>/dev/null); then
+        # Conteos del índice de proyectos, sin un find por lenguaje
+        local lang count
+        while IFS=$'\t' read -r lang count; do
+            [ -n "$lang" ] && echo "   $lang: $count proyectos"
+        done <<< "$counts"
+    elif [ -d "$DEV_PROJECTS" ]; then
         for lang in python nodejs java golang; do
             local lang_dir="$DEV_PROJECTS/$lang"
             if [ -d "$lang_dir" ]; then
@@ -631,10 +679,22 @@ backup_system() {
     local backup_dir="${DEV_BACKUPS:-$HOME/Development/backups}"
     mkdir -p "$backup_dir"
     
+    # Proyectos y configuración de contenedores: snapshots incrementales
+    # (modules/snapshots.py) si está disponible, si no tar.gz completos
+    local snapshots=false
+    if command -v python3 &> /dev/null && [ -f ~/.config/qtile/modules/snapshots.py ]; then
+        snapshots=true
+    fi
+    
     # Backup de proyectos
     if [ -d "$DEV_PROJECTS" ]; then
         dev_log "INFO" "Backing up projects..."
-        tar -czf "$backup_dir/projects-$timestamp.tar.gz" -C "$(dirname "$DEV_PROJECTS")" "$(basename "$DEV_PROJECTS")"
+        if $snapshots; then
+            (cd ~/.config/qtile && python3 -m modules.snapshots --store "$backup_dir/snapshots" \
+                --name projects backup "$DEV_PROJECTS")
+        else
+            tar -czf "$backup_dir/projects-$timestamp.tar.gz" -C "$(dirname "$DEV_PROJECTS")" "$(basename "$DEV_PROJECTS")"
+        fi
     fi
     
     # Backup de configuraciones
@@ -644,7 +704,12 @@ backup_system() {
     # Backup de containers config
     if [ -d "$DEV_CONTAINERS" ]; then
         dev_log "INFO" "Backing up container configurations..."
-        tar -czf "$backup_dir/containers-$timestamp.tar.gz" -C "$(dirname "$DEV_CONTAINERS")" "$(basename "$DEV_CONTAINERS")"
+        if $snapshots; then
+            (cd ~/.config/qtile && python3 -m modules.snapshots --store "$backup_dir/snapshots" \
+                --name containers backup "$DEV_CONTAINERS")
+        else
+            tar -czf "$backup_dir/containers-$timestamp.tar.gz" -C "$(dirname "$DEV_CONTAINERS")" "$(basename "$DEV_CONTAINERS")"
+        fi
     fi
     
     # Backup de base de datos
@@ -673,7 +738,14 @@ update_system() {
     fi
     
     # Actualizar contenedores
-    if [ -d "$DEV_CONTAINERS" ]; then
+    if [ -d "$DEV_CONTAINERS" ] && command -v python3 &> /dev/null \
+        && [ -f ~/.config/qtile/modules/images.py ]; then
+        # Todas las imágenes a la vez; solo se recrea lo que cambió
+        dev_log "INFO" "Actualizando contenedores Docker..."
+        (cd ~/.config/qtile && python3 -m modules.images \
+            --containers-dir "$DEV_CONTAINERS" --jobs "${DEV_PULL_JOBS:-4}") \
+            || dev_log "WARN" "Algunas imágenes no se pudieron actualizar"
+    elif [ -d "$DEV_CONTAINERS" ]; then
         dev_log "INFO" "Actualizando contenedores Docker..."
         for service_dir in "$DEV_CONTAINERS"/*; do
             if [ -d "$service_dir" ] && [ -f "$service_dir/docker-compose.yml" ]; then
@@ -701,6 +773,29 @@ system_check() {
     echo "====================================="
     echo
     
+    # Todas las comprobaciones a la vez (modules/health.py); el código de
+    # salida es el número de problemas. Si no está, una a una como antes
+    if command -v python3 &> /dev/null && [ -f ~/.config/qtile/modules/health.py ]; then
+        (cd ~/.config/qtile && python3 -m modules.health system) || issues=$?
+    else
+        system_check_serial || issues=$?
+    fi
+    
+    # Resultado final
+    if [ $issues -eq 0 ]; then
+        dev_log "SUCCESS" "Sistema completamente verificado - 0 problemas encontrados"
+        echo "🎉 Sistema perfecto para desarrollo!"
+        return 0
+    else
+        dev_log "WARN" "$issues problemas encontrados"
+        echo "🔧 Ejecuta 'master-dev repair' para reparar automáticamente"
+        return 1
+    fi
+}
+
+system_check_serial() {
+    local issues=0
+    
     # Verificar herramientas básicas
     echo "1. 🛠️  Herramientas básicas:"
     for tool in "bash" "git" "curl" "wget" "docker" "docker-compose"; do
@@ -715,7 +810,7 @@ system_check() {
     
     # Verificar Docker específicamente
     echo "2. 🐳 Docker:"
-    if systemctl is-active --quiet docker; then
+    if unit_active docker; then
         echo "   ✅ Servicio activo"
         if groups $USER | grep -q docker; then
             echo "   ✅ Usuario en grupo docker"
@@ -783,16 +878,7 @@ system_check() {
     fi
     echo
     
-    # Resultado final
-    if [ $issues -eq 0 ]; then
-        dev_log "SUCCESS" "Sistema completamente verificado - 0 problemas encontrados"
-        echo "🎉 Sistema perfecto para desarrollo!"
-        return 0
-    else
-        dev_log "WARN" "$issues problemas encontrados"
-        echo "🔧 Ejecuta 'master-dev repair' para reparar automáticamente"
-        return 1
-    fi
+    return $issues
 }
 
 repair_system() {
@@ -801,7 +887,7 @@ repair_system() {
     local repairs=0
     
     # Reparar Docker si no está activo
-    if ! systemctl is-active --quiet docker; then
+    if ! unit_active docker; then
         dev_log "INFO" "Reparando Docker..."
         sudo systemctl start docker
         sudo systemctl enable docker
@@ -861,7 +947,7 @@ system_final_check() {
     local all_good=true
     
     # Docker
-    if systemctl is-active --quiet docker && groups $USER | grep -q docker; then
+    if unit_active docker && groups $USER | grep -q docker; then
         echo "✅ Docker: Configurado correctamente"
     else
         echo "❌ Docker: Requiere atención"